@@ -14,3 +14,9 @@ class ControllerTest:
 
     def returns_a_dict(self):
         return {'id': 1}
+
+    def streams_a_view(self, ViewClass):
+        return ViewClass.stream('test', {'test': 'test'})
+
+    def returns_request_input(self):
+        return request().input('name')
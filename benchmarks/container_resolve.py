@@ -0,0 +1,54 @@
+"""Benchmark for resolving the provider boot methods through the container.
+
+Run from the root of the project:
+
+    $ python -m benchmarks.container_resolve
+"""
+
+import functools
+import time
+
+from config import providers
+from masonite.testsuite.TestSuite import TestSuite
+
+ITERATIONS = 20000
+
+
+def noop_for(method):
+    """Wrap a boot method in a function with the same signature that does nothing.
+    This way only the resolving is measured and not the work of the provider.
+    """
+
+    @functools.wraps(method)
+    def noop(*args):
+        pass
+
+    return noop
+
+
+def run(container, callables, cached=True):
+    start = time.perf_counter()
+
+    for dummy in range(ITERATIONS):
+        for obj in callables:
+            if not cached:
+                container._resolution_plans.clear()
+                container._method_resolution_plans.clear()
+            container.resolve(obj)
+
+    return (ITERATIONS * len(callables)) / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    container = TestSuite().create_container().get_container()
+
+    callables = [
+        noop_for(provider().load_app(container).boot) for provider in providers.PROVIDERS
+    ]
+
+    print('Resolving the boot methods of {0} providers {1} times'.format(
+        len(callables), ITERATIONS))
+    print('Without resolution plans: {0:>12,.0f} resolves/sec'.format(
+        run(container, callables, cached=False)))
+    print('With resolution plans:    {0:>12,.0f} resolves/sec'.format(
+        run(container, callables, cached=True)))
@@ -0,0 +1,87 @@
+"""Benchmark for reading values from a disk cache holding 100,000 entries with the
+hashed file per key of CacheDiskDriver against the previous key:timestamp files
+that were found with glob.
+
+Run from the root of the project:
+
+    $ python -m benchmarks.disk_cache
+"""
+
+import glob
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from masonite.drivers.CacheDiskDriver import CacheDiskDriver
+
+ENTRIES = 100000
+LOOKUPS = 2000
+GLOB_LOOKUPS = 50
+
+
+class CacheConfig:
+
+    def __init__(self, location):
+        self.DRIVERS = {'disk': {'location': location}}
+
+
+def glob_store(location, key, value, expires):
+    """The files written by CacheDiskDriver before keys were hashed.
+    """
+
+    with open(os.path.join(location, '{0}:{1}.txt'.format(key, expires)), 'w') as cache_file:
+        cache_file.write(value)
+
+
+def glob_get(location, key):
+    """The lookup done by CacheDiskDriver before keys were hashed. The timestamp
+    is found with one glob and the file is read after a second glob.
+    """
+
+    cache_file = glob.glob(os.path.join(location, key + ':*'))
+    if not cache_file or float(os.path.splitext(cache_file[0])[0].split(':')[1]) <= time.time():
+        return None
+
+    return open(glob.glob(os.path.join(location, key + ':*'))[0], 'r').read()
+
+
+def run(iterations, function, *args):
+    start = time.perf_counter()
+
+    for dummy in range(iterations):
+        function(*args)
+
+    return (time.perf_counter() - start) / iterations * 1000000
+
+
+if __name__ == '__main__':
+    directory = tempfile.mkdtemp()
+    hashed_location = os.path.join(directory, 'hashed')
+    glob_location = os.path.join(directory, 'glob')
+    os.makedirs(glob_location)
+
+    keys = ['key{0}'.format(index) for index in range(ENTRIES)]
+    expires = time.time() + 3600
+    driver = CacheDiskDriver(CacheConfig(hashed_location), None)
+
+    try:
+        start = time.perf_counter()
+        for key in keys:
+            driver.store_for(key, 'value', 1, 'hour')
+        write = (time.perf_counter() - start) / ENTRIES * 1000000
+
+        for key in keys:
+            glob_store(glob_location, key, 'value', expires)
+
+        print('{0:,} entries'.format(ENTRIES))
+        print('Hashed file write:       {0:>10.1f} us'.format(write))
+        print('Hashed file get:         {0:>10.1f} us'.format(
+            run(LOOKUPS, lambda: driver.get(random.choice(keys)))))
+        print('Hashed file missing get: {0:>10.1f} us'.format(
+            run(LOOKUPS, driver.get, 'missing')))
+        print('Glob get:                {0:>10.1f} us'.format(
+            run(GLOB_LOOKUPS, lambda: glob_get(glob_location, random.choice(keys)))))
+    finally:
+        shutil.rmtree(directory)
@@ -0,0 +1,68 @@
+"""Benchmark for matching a request against the compiled route table and the previous linear scan.
+
+Run from the root of the project:
+
+    $ python -m benchmarks.route_matching
+"""
+
+import re
+import time
+
+from masonite.routes import Get, Route, RouteTable
+
+REQUESTS = 20000
+
+
+def create_routes(amount):
+    return [Get().route('/resource{0}/@id/edit'.format(index), None) for index in range(amount)]
+
+
+def linear_scan(routes, url):
+    """The matching done by RouteProvider before routes were compiled into a table.
+    """
+
+    router = Route()
+    for route in routes:
+        regex = router.compile_route_to_regex(route)
+
+        if route.route_url.endswith('/'):
+            matchurl = re.compile(regex.replace(r'\/\/$', r'\/$'))
+        else:
+            matchurl = re.compile(regex.replace(r'\/$', r'$'))
+
+        try:
+            parameter_dict = {}
+            for index, value in enumerate(matchurl.match(url).groups()):
+                parameter_dict[router.generated_url_list()[index]] = value
+        except AttributeError:
+            pass
+
+        if matchurl.match(url) and route.method_type == 'GET':
+            return route
+
+
+def compiled_table(table, url):
+    for route, parameters in table.matches('GET', url):
+        return route
+
+
+def run(iterations, function, *args):
+    start = time.perf_counter()
+
+    for dummy in range(iterations):
+        function(*args)
+
+    return (time.perf_counter() - start) / iterations * 1000000
+
+
+if __name__ == '__main__':
+    print('{0:>7} {1:>10} {2:>18} {3:>18}'.format('Routes', 'Request', 'Linear scan (us)', 'Route table (us)'))
+
+    for amount in (10, 100, 1000):
+        routes = create_routes(amount)
+        table = RouteTable(routes)
+        iterations = REQUESTS // amount
+
+        for name, url in (('last', '/resource{0}/1/edit'.format(amount - 1)), ('404', '/not/found')):
+            print('{0:>7} {1:>10} {2:>18.1f} {3:>18.1f}'.format(
+                amount, name, run(iterations, linear_scan, routes, url), run(REQUESTS, compiled_table, table, url)))
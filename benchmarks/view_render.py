@@ -0,0 +1,45 @@
+"""Benchmark for rendering resources/templates/index.html with a shared Jinja environment
+against building a new environment on every render.
+
+Run from the root of the project:
+
+    $ python -m benchmarks.view_render
+"""
+
+import time
+
+from masonite.app import App
+from masonite.view import View
+
+ITERATIONS = 2000
+
+
+def new_environment_per_render(view):
+    """The View before environments were cached.
+    """
+
+    view._environment_cache.clear()
+    view.render('index')
+
+
+def shared_environment(view):
+    view.render('index')
+
+
+def run(function, view):
+    start = time.perf_counter()
+
+    for dummy in range(ITERATIONS):
+        function(view)
+
+    return ITERATIONS / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    view = View(App())
+
+    print('Rendering index.html {0} times'.format(ITERATIONS))
+    print('New environment per render: {0:>10,.0f} renders/sec'.format(
+        run(new_environment_per_render, view)))
+    print('Shared environment:         {0:>10,.0f} renders/sec'.format(
+        run(shared_environment, view)))
@@ -0,0 +1,79 @@
+"""Benchmark for the precompiled provider pipeline against instantiating every provider per request.
+
+Run from the root of the project:
+
+    $ python -m benchmarks.wsgi_pipeline
+"""
+
+import time
+
+from app.http.controllers.ControllerTest import ControllerTest
+from config import application, providers
+from masonite.app import App
+from masonite.helpers.routes import get
+from masonite.testsuite.TestSuite import generate_wsgi
+from masonite.wsgi import WSGIApplication
+
+ITERATIONS = 5000
+
+
+def create_application():
+    container = App()
+    container.bind('WSGI', object)
+    container.bind('Application', application)
+    container.bind('Providers', providers)
+
+    wsgi_application = WSGIApplication.from_providers(container, providers.PROVIDERS)
+
+    container.bind('HttpMiddleware', [])
+    container.bind('WebRoutes', [get('/view', ControllerTest.test)])
+    return wsgi_application
+
+
+def per_request_instantiation(container):
+    """The request loop of bootstrap/start.py
+    """
+
+    def app(environ, start_response):
+        container.bind('Environ', environ)
+
+        try:
+            for provider in container.make('Providers').PROVIDERS:
+                located_provider = provider().load_app(container)
+                if located_provider.wsgi is True:
+                    container.resolve(located_provider.boot)
+        except Exception as e:
+            container.make('ExceptionHandler').load_exception(e)
+
+        start_response(container.make('StatusCode'), container.make('Headers'))
+        return iter([bytes(container.make('Response'), 'utf-8')])
+
+    return app
+
+
+def start_response(status, headers):
+    pass
+
+
+def run(app):
+    start = time.perf_counter()
+
+    for dummy in range(ITERATIONS):
+        environ = generate_wsgi()
+        environ['PATH_INFO'] = '/view'
+        list(app(environ, start_response))
+
+    return ITERATIONS / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    wsgi_application = create_application()
+    container = wsgi_application.container
+
+    print('Running {0} requests to /view'.format(ITERATIONS))
+    print('Instantiating providers per request: {0:>10,.0f} requests/sec'.format(
+        run(per_request_instantiation(container))))
+    print('Precompiled provider pipeline:       {0:>10,.0f} requests/sec'.format(
+        run(wsgi_application)))
+    print('Precompiled pipeline, scoped:        {0:>10,.0f} requests/sec'.format(
+        run(WSGIApplication(container, providers.PROVIDERS, scoped=True))))
@@ -1,5 +1,9 @@
 import os
 
+from masonite.helpers.boolean import to_bool
+
+DEBUG = to_bool(os.getenv('APP_DEBUG', False))
+
 KEY = 'NCTpkICMlTXie5te9nJniMj9aVbPM6lsjeq5iDZ0dqY='
 
 BASE_DIRECTORY = os.getcwd()
@@ -9,3 +13,15 @@ URL = 'http://localhost'
 STATIC_ROOT = 'storage'
 
 AUTOLOAD = []
+
+DYNAMIC_ERROR_PAGES = False
+
+ACCESS_LOG = {
+    'enabled': False,
+    'sink': 'file',
+    'location': 'storage/logs/access.log',
+    'level': 'INFO',
+    'sample_rate': 1.0,
+}
+
+VIEW_BYTECODE_CACHE = None
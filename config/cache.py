@@ -2,10 +2,30 @@
 Cache configuration
 """
 
+import os
+
 DRIVER = 'disk'
 
 DRIVERS = {
     'disk': {
         'location': 'bootstrap/cache'
+    },
+    'memory': {
+        'max_entries': 10000,
+        'max_bytes': 64 * 1024 * 1024
+    },
+    'sqlite': {
+        'location': 'bootstrap/cache/cache.sqlite3',
+        'timeout': 5,
+        'evict_every': 1000,
+        'evict_batch': 500
+    },
+    'redis': {
+        'host': os.getenv('REDIS_HOST', 'localhost'),
+        'port': int(os.getenv('REDIS_PORT', 6379)),
+        'db': int(os.getenv('REDIS_DB', 0)),
+        'password': os.getenv('REDIS_PASSWORD') or None,
+        'max_connections': 50,
+        'prefix': 'masonite_cache:'
     }
 }
@@ -2,6 +2,8 @@
 """
 
 import inspect
+import threading
+import weakref
 
 from masonite.exceptions import (ContainerError,
                                  MissingContainerBindingNotFound,
@@ -13,18 +15,39 @@ class App():
     of objects to and from the container.
     """
 
-    def __init__(self, strict=False, override=True):
+    def __init__(self, strict=False, override=True, parent=None):
         """App class constructor
+
+        Keyword Arguments:
+            strict {bool} -- Whether keys can be overridden once bound. (default: {False})
+            override {bool} -- Whether binding an existing key replaces it. (default: {True})
+            parent {masonite.app.App} -- Container to fall back on for keys not bound in this one. (default: {None})
         """
 
         self.providers = {}
+        self._factories = {}
+        self._deferred_providers = {}
+        self._loading_providers = set()
+        self._factory_lock = threading.RLock()
+        self._type_index = {}
+        self._binding_order = {}
         self.strict = strict
         self.override = override
-        self._hooks = {
-            'make': {},
-            'bind': {},
-            'resolve': {},
-        }
+        self.parent = parent
+        self._scope = threading.local()
+
+        if parent is None:
+            self._resolution_plans = weakref.WeakKeyDictionary()
+            self._method_resolution_plans = weakref.WeakKeyDictionary()
+            self._hooks = {
+                'make': {},
+                'bind': {},
+                'resolve': {},
+            }
+        else:
+            self._resolution_plans = parent._resolution_plans
+            self._method_resolution_plans = parent._method_resolution_plans
+            self._hooks = parent._hooks
 
     def bind(self, name, class_obj):
         """Bind classes into the container with a key value pair
@@ -37,16 +60,72 @@ class App():
             self
         """
 
-        if self.strict and name in self.providers:
+        if self.strict and (name in self.providers or name in self._factories):
             raise StrictContainerException(
                 'You cannot override a key inside a strict container')
 
-        if self.override or not name in self.providers:
+        if self.override or not (name in self.providers or name in self._factories):
             self.fire_hook('bind', name, class_obj)
+            self._update_type_index(name, class_obj)
+            self._factories.pop(name, None)
+            self._deferred_providers.pop(name, None)
             self.providers.update({name: class_obj})
 
         return self
 
+    def singleton(self, name, factory):
+        """Bind a factory that is only called the first time the key is made. The
+        object it returns is then bound to the key and shared by everyone. The
+        factory is resolved by the container so it can ask for its own dependencies.
+
+        Arguments:
+            name {string} -- Name of the key you want to bind the object to
+            factory {object} -- A class or callable that creates the object
+
+        Returns:
+            self
+        """
+
+        return self._bind_factory(name, factory, True)
+
+    def factory(self, name, factory):
+        """Bind a factory that is called every time the key is made or resolved
+        so each caller gets a new object. The factory is resolved by the
+        container so it can ask for its own dependencies.
+
+        Arguments:
+            name {string} -- Name of the key you want to bind the factory to
+            factory {object} -- A class or callable that creates the object
+
+        Returns:
+            self
+        """
+
+        return self._bind_factory(name, factory, False)
+
+    def _bind_factory(self, name, factory, shared):
+        """Internal method used to bind a singleton or a factory.
+
+        Arguments:
+            name {string} -- Name of the key you want to bind the factory to
+            factory {object} -- A class or callable that creates the object
+            shared {bool} -- Whether the first object created is shared.
+
+        Returns:
+            self
+        """
+
+        if self.strict and (name in self.providers or name in self._factories):
+            raise StrictContainerException(
+                'You cannot override a key inside a strict container')
+
+        if self.override or not (name in self.providers or name in self._factories):
+            self._update_type_index(name, factory)
+            self.providers.pop(name, None)
+            self._factories[name] = (factory, shared)
+
+        return self
+
     def make(self, name):
         """Retreives a class from the container by key.
 
@@ -61,7 +140,7 @@ class App():
         """
 
         if self.has(name):
-            obj = self.providers[name]
+            obj = self._get_binding(name)
             self.fire_hook('make', name, obj)
             return obj
 
@@ -78,11 +157,146 @@ class App():
             bool
         """
 
-        if name in self.providers:
+        if name in self.providers or name in self._factories or name in self._deferred_providers:
             return True
 
+        if self.parent is not None:
+            return self.parent.has(name)
+
         return False
 
+    def child(self):
+        """Creates a child container. Objects bound into the child are only
+        seen by the child while everything bound into this container is still
+        available to it. Use a child container per request so several requests
+        can run in parallel without overwriting each others bindings. The child
+        becomes the current container of the thread until it is released.
+
+        Returns:
+            masonite.app.App -- The child container.
+        """
+
+        child = App(strict=self.strict, override=self.override, parent=self)
+        self._scope.container = child
+        return child
+
+    def release(self, child):
+        """Stop using a child container as the current container of the thread
+        once its request is finished, so the thread no longer holds on to it.
+
+        Arguments:
+            child {masonite.app.App} -- The child container created with child().
+        """
+
+        if getattr(self._scope, 'container', None) is child:
+            del self._scope.container
+
+    def current(self):
+        """Get the container of the request running in the current thread. This is
+        the child container of the request running in this thread or this container
+        outside of a request. Helpers use it so they never see another request.
+
+        Returns:
+            masonite.app.App
+        """
+
+        return getattr(self._scope, 'container', self)
+
+    def _get_binding(self, name):
+        """Get the object bound to a key in this container or the closest parent.
+        The key should be checked with has() first.
+
+        Arguments:
+            name {string} -- Key in the container that you want to get.
+
+        Returns:
+            object
+        """
+
+        if name in self._deferred_providers:
+            self._load_deferred_provider(self._deferred_providers[name])
+
+        if name in self.providers:
+            return self.providers[name]
+
+        if name in self._factories:
+            return self._call_factory(name)
+
+        if self.parent is None:
+            raise MissingContainerBindingNotFound(
+                "{0} key was not bound by its deferred service provider".format(name))
+
+        return self.parent._get_binding(name)
+
+    def defer(self, provider):
+        """Defer a service provider until one of the keys listed in its provides
+        attribute is made from the container, or one of the classes listed in its
+        provides_classes attribute satisfies a resolved annotation. The provider
+        is then registered and booted a single time.
+
+        Arguments:
+            provider {masonite.provider.ServiceProvider} -- The service provider to defer.
+
+        Returns:
+            self
+        """
+
+        for key in provider.provides:
+            self._deferred_providers[key] = provider
+
+        return self
+
+    def _load_deferred_provider(self, provider):
+        """Register and boot a deferred service provider.
+
+        Arguments:
+            provider {masonite.provider.ServiceProvider} -- The deferred service provider.
+        """
+
+        with self._factory_lock:
+            # Another thread may have loaded the provider while we waited
+            # or the provider itself is making one of its keys
+            if provider in self._loading_providers or provider not in self._deferred_providers.values():
+                return
+
+            self._loading_providers.add(provider)
+
+            try:
+                provider.load_app(self).register()
+                self.resolve(provider.boot)
+            finally:
+                self._loading_providers.discard(provider)
+
+                for key in provider.provides:
+                    if self._deferred_providers.get(key) is provider:
+                        del self._deferred_providers[key]
+
+    def _call_factory(self, name):
+        """Create the object of a singleton or factory binding.
+
+        Arguments:
+            name {string} -- Key of the factory binding.
+
+        Returns:
+            object
+        """
+
+        factory, shared = self._factories[name]
+
+        if not shared:
+            return self.resolve(factory)
+
+        with self._factory_lock:
+            # Another thread may have created the singleton while we waited
+            if name in self.providers:
+                return self.providers[name]
+
+            obj = self.resolve(factory)
+            self.fire_hook('bind', name, obj)
+            self.providers[name] = obj
+            del self._factories[name]
+            return obj
+
     def helper(self):
         """Adds a helper to create builtin functions. Used to more simply return
         instances of this class when building helpers.
@@ -106,13 +320,65 @@ class App():
 
         provider_list = []
 
+        for annotated, parameter in self._resolution_plan(obj):
+            if annotated:
+                provider_list.append(self._find_annotated_parameter(parameter))
+            else:
+                provider_list.append(self._find_parameter(parameter))
+
+        return obj(*provider_list)
+
+    def _resolution_plan(self, obj):
+        """Get the resolution plan of an object. The plan is a tuple of
+        (annotated, parameter) pairs built from the signature the first time
+        the object is resolved so later resolves skip the introspection. Plans
+        are held with weak references so they are freed with their object.
+
+        Arguments:
+            obj {object} -- The object you want the resolution plan for.
+
+        Returns:
+            tuple -- Pairs of whether the parameter is annotated and the parameter to look up.
+        """
+
+        # Bound methods are recreated on every attribute access so key
+        # them by the underlying function instead.
+        if inspect.ismethod(obj):
+            plans, key = self._method_resolution_plans, obj.__func__
+        else:
+            plans, key = self._resolution_plans, obj
+
+        try:
+            return plans[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Callables that cannot be weakly referenced or hashed are not cached
+            return self._build_resolution_plan(obj)
+
+        plan = self._build_resolution_plan(obj)
+        plans[key] = plan
+        return plan
+
+    def _build_resolution_plan(self, obj):
+        """Inspect the signature of an object and build its resolution plan.
+
+        Arguments:
+            obj {object} -- The object you want to build the resolution plan for.
+
+        Returns:
+            tuple -- Pairs of whether the parameter is annotated and the parameter to look up.
+        """
+
+        plan = []
+
         for dummy, value in inspect.signature(obj).parameters.items():
             if ':' in str(value):
-                provider_list.append(self._find_annotated_parameter(value))
+                plan.append((True, value))
             else:
-                provider_list.append(self._find_parameter(value))
+                plan.append((False, str(value)))
 
-        return obj(*provider_list)
+        return tuple(plan)
 
     def collect(self, search):
         """Fetch a dictionary of objects using a search query.
@@ -127,7 +393,11 @@ class App():
             dict -- Returns a dictionary of collected objects and their key bindings.
         """
 
-        provider_list = {}
+        if self.parent is not None:
+            provider_list = self.parent.collect(search)
+        else:
+            provider_list = {}
+
         if isinstance(search, str):
             # Search Can Be:
             #    '*ExceptionHook'
@@ -167,8 +437,8 @@ class App():
             object -- Returns the object found in the container
         """
         parameter = str(parameter)
-        if parameter is not 'self' and parameter in self.providers:
-            obj = self.providers[parameter]
+        if parameter != 'self' and self.has(parameter):
+            obj = self._get_binding(parameter)
             self.fire_hook('resolve', parameter, obj)
             return obj
 
@@ -190,20 +460,133 @@ class App():
             object -- Returns the object found in the container.
         """
 
-        for dummy, provider_class in self.providers.items():
+        container = self
 
-            if parameter.annotation == provider_class or parameter.annotation == provider_class.__class__:
-                obj = provider_class
-                self.fire_hook('resolve', parameter, obj)
-                return obj
-            elif inspect.isclass(provider_class) and issubclass(provider_class, parameter.annotation):
-                obj = provider_class
+        # Bindings of a child container take precedence over its parents
+        while container is not None:
+            key = container._find_indexed_annotation(parameter.annotation)
+            if key is not None:
+                obj = container._get_binding(key)
                 self.fire_hook('resolve', parameter, obj)
                 return obj
 
+            container = container.parent
+
+        # Load a deferred provider binding a class that satisfies the annotation
+        container = self
+        while container is not None:
+            provider = container._find_deferred_annotation(parameter.annotation)
+            if provider is not None:
+                container._load_deferred_provider(provider)
+                return self._find_annotated_parameter(parameter)
+
+            container = container.parent
+
         raise ContainerError(
             'The dependency with the {0} annotation could not be resolved by the container'.format(parameter))
 
+    def _find_deferred_annotation(self, annotation):
+        """Find the deferred provider declaring a class that satisfies an annotation.
+
+        Arguments:
+            annotation {object} -- The annotation to search for.
+
+        Returns:
+            masonite.provider.ServiceProvider|None -- Returns None if no deferred provider satisfies the annotation.
+        """
+
+        for provider in self._deferred_providers.values():
+            if provider in self._loading_providers:
+                continue
+
+            for provided in provider.provides_classes:
+                if self._satisfies_annotation(annotation, provided):
+                    return provider
+
+        return None
+
+    def _find_indexed_annotation(self, annotation):
+        """Find the key of the binding satisfying an annotation using the type index.
+
+        Arguments:
+            annotation {object} -- The annotation to search for.
+
+        Returns:
+            string|None -- Returns the key of the binding or None if nothing satisfies the annotation.
+        """
+
+        try:
+            return self._type_index[annotation]
+        except KeyError:
+            key = self._find_annotated_key(annotation)
+            if key is not None:
+                self._type_index[annotation] = key
+            return key
+        except TypeError:
+            # Unhashable annotations cannot be indexed
+            return self._find_annotated_key(annotation)
+
+    def _find_annotated_key(self, annotation):
+        """Scan the container for the first binding that satisfies an annotation.
+
+        Arguments:
+            annotation {object} -- The annotation to search for.
+
+        Returns:
+            string|None -- Returns the key of the binding or None if nothing satisfies the annotation.
+        """
+
+        for key in self._binding_order:
+            if key in self.providers:
+                provider_class = self.providers[key]
+            else:
+                # Factories are matched by the class they create
+                provider_class = self._factories[key][0]
+
+            if self._satisfies_annotation(annotation, provider_class):
+                return key
+
+        return None
+
+    def _satisfies_annotation(self, annotation, provider_class):
+        """Check if a binding satisfies an annotation. A binding satisfies an annotation
+        if it is the annotation, an instance of it or a subclass of it.
+
+        Arguments:
+            annotation {object} -- The annotation to check against.
+            provider_class {object} -- The object bound in the container.
+
+        Returns:
+            bool
+        """
+
+        if annotation == provider_class or annotation == provider_class.__class__:
+            return True
+
+        return inspect.isclass(provider_class) and issubclass(provider_class, annotation)
+
+    def _update_type_index(self, name, class_obj):
+        """Invalidate the annotations in the type index that a binding may change.
+        A new key is always bound last so it can never take the place of an
+        indexed binding. Rebinding a key drops the annotations pointing at that
+        key as well as the ones the new object would now satisfy first.
+
+        Arguments:
+            name {string} -- Key that is being bound.
+            class_obj {object} -- The object being bound to the key.
+        """
+
+        if name not in self._binding_order:
+            self._binding_order[name] = len(self._binding_order)
+            return
+
+        position = self._binding_order[name]
+
+        for annotation, key in list(self._type_index.items()):
+            if key == name or (self._binding_order[key] > position
+                               and self._satisfies_annotation(annotation, class_obj)):
+                del self._type_index[annotation]
+
     def on_bind(self, key, obj):
         """Set some listeners for when a specific key or class in binded to the container
 
@@ -255,13 +638,31 @@ class App():
             None
         """
 
-        if str(key) in self._hooks[action] or \
-                inspect.isclass(obj) and \
-                obj in self._hooks[action] or obj.__class__ in self._hooks[action]:
+        hooks = self._hooks[action]
+
+        # Most containers never register a hook so skip all the work
+        if not hooks:
+            return
+
+        if str(key) in hooks:
+            self._fire_hook_list(hooks[str(key)], obj)
+
+        if inspect.isclass(obj) and obj in hooks:
+            self._fire_hook_list(hooks[obj], obj)
+
+        if obj.__class__ in hooks:
+            self._fire_hook_list(hooks[obj.__class__], obj)
+
+    def _fire_hook_list(self, hook_list, obj):
+        """Calls every listener in a list of hooks.
+
+        Arguments:
+            hook_list {list} -- The listeners to call.
+            obj {object} -- The object the hook is fired for.
+        """
 
-            for hook, hook_list in self._hooks[action].items():
-                for hook_obj in hook_list:
-                    hook_obj(obj, self)
+        for hook_obj in hook_list:
+            hook_obj(obj, self)
 
     def _bind_hook(self, hook, key, obj):
         """Internal method used to abstract away the logic for binding an listener to the container hooks.
@@ -0,0 +1,32 @@
+import importlib
+
+from cleo import Command
+
+from masonite.helpers.routes import flatten_routes
+from masonite.routes import RouteCache
+
+
+class RouteCacheCommand(Command):
+    """
+    Cache the routes of the application.
+
+    route:cache
+        {--c|clear : Remove the cached routes}
+    """
+
+    def handle(self):
+        cache = RouteCache()
+
+        if self.option('clear'):
+            if cache.clear():
+                self.info('Route cache cleared!')
+            else:
+                self.comment('There are no cached routes.')
+            return
+
+        # The application may have been loaded from the previous cache already
+        # so evaluate routes/web.py again to pick up any changes
+        from routes import web
+
+        routes = cache.write(flatten_routes(importlib.reload(web).ROUTES))
+        self.info('Cached {0} routes to {1}'.format(len(routes), cache.path))
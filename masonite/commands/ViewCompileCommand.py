@@ -0,0 +1,26 @@
+from cleo import Command
+
+
+class ViewCompileCommand(Command):
+    """
+    Compile all templates into the template bytecode cache.
+
+    view:compile
+        {roots?* : Additional template roots to compile such as masonite/snippets}
+    """
+
+    def handle(self):
+        from wsgi import container
+
+        view = container.make('ViewClass')
+
+        if view.bytecode_cache is None:
+            view.cache_bytecode()
+            self.comment('Set VIEW_BYTECODE_CACHE in config/application.py to use the compiled templates.')
+
+        compiled, failed = view.compile_templates(self.argument('roots'))
+
+        for template, error in failed.items():
+            self.comment('Could not compile {0}: {1}'.format(template, error))
+
+        self.info('Compiled {0} templates!'.format(len(compiled)))
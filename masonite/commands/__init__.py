@@ -14,8 +14,10 @@ from .ModelCommand import ModelCommand
 from .ProviderCommand import ProviderCommand
 from .ServeCommand import ServeCommand
 from .ViewCommand import ViewCommand
+from .ViewCompileCommand import ViewCompileCommand
 from .ValidatorCommand import ValidatorCommand
 from .RoutesCommand import RoutesCommand
+from .RouteCacheCommand import RouteCacheCommand
 from .SeedCommand import SeedCommand
 from .SeedRunCommand import SeedRunCommand
 from .TinkerCommand import TinkerCommand
@@ -17,3 +17,12 @@ class CacheContract(ABC):
 
     @abstractmethod
     def cache_exists(self): pass
+
+    @abstractmethod
+    def get_many(self): pass
+
+    @abstractmethod
+    def set_many(self): pass
+
+    @abstractmethod
+    def delete_many(self): pass
@@ -1,21 +1,31 @@
-"""Module for the ache disk driver.
+"""Module for the cache disk driver.
 """
 
-import glob
+import hashlib
 import os
 import time
+import uuid
 
 from masonite.contracts.CacheContract import CacheContract
 from masonite.drivers.BaseDriver import BaseDriver
+from masonite.helpers.time import cache_seconds
 
 
 class CacheDiskDriver(CacheContract, BaseDriver):
     """Class for the cache disk driver.
+
+    Every key is stored in its own file named after the SHA-1 hash of the key so
+    a value can be found with a single open. The first line of the file holds the
+    timestamp the value expires at, or a dash when the value never expires, and
+    the rest of the file holds the value. Files are written to a temporary file
+    first and then renamed so a reader never sees a partially written value.
     """
 
+    forever = b'-'
+
     def __init__(self, CacheConfig, Application):
         """Cache disk driver constructor
-        
+
         Arguments:
             CacheConfig {config.cache} -- Cache configuration module.
             Application {config.application} -- Application configuration module.
@@ -23,188 +33,249 @@ class CacheDiskDriver(CacheContract, BaseDriver):
 
         self.config = CacheConfig
         self.appconfig = Application
-        self.cache_forever = None
 
     def store(self, key, value, extension=".txt", location=None):
         """Stores content in cache file.
-        
+
         Arguments:
             key {string} -- The key to store the cache file into
             value {string} -- The value you want to store in the cache
-        
+
         Keyword Arguments:
-            extension {string} -- the extension you want to append to the file (default: {".txt"})
+            extension {string} -- Not used, the file is named after the key. (default: {".txt"})
             location {string} -- The path you want to store the cache into. (default: {None})
-        
+
         Returns:
             string -- Returns the key
         """
 
-        self.cache_forever = True
-        if not location:
-            location = self.config.DRIVERS['disk']['location']
-
-        location += '/'
-        path = os.path.join(location, key + extension)
-        if not os.path.exists(path):
-            self._create_directory(path)
-
-        open(path, 'w').write(value)
-
+        self._write(self._path(key, location), value, None)
         return key
 
     def store_for(self, key, value, cache_time, cache_type, extension=".txt", location=None):
         """Store the cache for a specific amount of time.
-        
+
         Arguments:
             key {string} -- The key to store the cache file into
             value {string} -- The value you want to store in the cache
             cache_time {int|string} -- The time as a string or an integer (1, 2, 5, 100, etc)
             cache_type {string} -- The type of time to store for (minute, minutes, hours, seconds, etc)
-        
+
         Keyword Arguments:
-            extension {string} -- the extension you want to append to the file (default: {".txt"})
+            extension {string} -- Not used, the file is named after the key. (default: {".txt"})
             location {string} -- The path you want to store the cache into. (default: {None})
-        
+
         Raises:
             ValueError -- Thrown if an invalid cache type was caught (like houes instead of hours).
-        
+
         Returns:
             string -- Returns the key
         """
 
-        self.cache_forever = False
-        cache_type = cache_type.lower()
-        calc = 0
-
-        if cache_type in ("second", "seconds"):
-            # Set time now for
-            calc = 1
-        elif cache_type in ("minute", "minutes"):
-            calc = 60
-        elif cache_type in ("hour", "hours"):
-            calc = 60 * 60
-        elif cache_type in ("day", "days"):
-            calc = 60 * 60 * 60
-        elif cache_type in ("month", "months"):
-            calc = 60 * 60 * 60 * 60
-        elif cache_type in ("year", "years"):
-            calc = 60 * 60 * 60 * 60 * 60
-        else:
-            raise ValueError(
-                '{0} is not a valid caching type.'.format(cache_type))
-
-        cache_for_time = cache_time * calc
-
-        cache_for_time = cache_for_time + time.time()
-
-        key = self.store(
-            key + ":" + str(cache_for_time),
-            value, extension, location
-        )
-
+        expires = time.time() + cache_seconds(cache_time, cache_type)
+        self._write(self._path(key, location), value, expires)
         return key
 
     def get(self, key):
-        """
-        Get the data from a key in the cache
+        """Get the data from a key in the cache.
+
+        Arguments:
+            key {string} -- The key of the value.
+
+        Returns:
+            string|None -- Returns None if the key is not cached or has expired.
         """
 
-        if not self.is_valid(key):
+        entry = self._read(self._path(key))
+        if entry is None:
             return None
 
-        cache_path = self.config.DRIVERS['disk']['location'] + "/"
-        content = ""
+        return entry[0]
+
+    def delete(self, key):
+        """Delete file cache.
 
-        if self.cache_forever:
-            glob_path = cache_path + key + '*'
-        else:
-            glob_path = cache_path + key + ':*'
+        Arguments:
+            key {string} -- The key to delete.
+        """
 
         try:
-            content = open(glob.glob(glob_path)[0], 'r').read()
-        except IndexError:
+            os.remove(self._path(key))
+        except FileNotFoundError:
             pass
 
-        return content
+    def get_many(self, keys):
+        """Get the values of several keys. Every key is read with a single open.
 
-    def delete(self, key):
-        """
-        Delete file cache
+        Arguments:
+            keys {list} -- The keys of the values.
+
+        Returns:
+            dict -- The value of every key or None when the key is not cached.
         """
 
-        cache_path = self.config.DRIVERS['disk']['location'] + "/"
-        if self.cache_forever:
-            glob_path = cache_path + key + '*'
-        else:
-            glob_path = cache_path + key + ':*'
+        return {key: self.get(key) for key in keys}
 
-        for template in glob.glob(glob_path):
-            os.remove(template)
+    def set_many(self, values, cache_time=None, cache_type='seconds'):
+        """Store several values.
 
-    def update(self, key, value, location=None):
+        Arguments:
+            values {dict} -- The values to store by key.
+
+        Keyword Arguments:
+            cache_time {int|string} -- The time to store the values for or None to store them forever. (default: {None})
+            cache_type {string} -- The type of time to store for (minute, minutes, hours, seconds, etc) (default: {'seconds'})
+
+        Raises:
+            ValueError -- Thrown if an invalid cache type was caught (like houes instead of hours).
+
+        Returns:
+            list -- Returns the keys
         """
-            Updates a specific cache by key
+
+        expires = None
+        if cache_time is not None:
+            expires = time.time() + cache_seconds(cache_time, cache_type)
+
+        for key, value in values.items():
+            self._write(self._path(key), value, expires)
+
+        return list(values)
+
+    def delete_many(self, keys):
+        """Delete several keys from the cache.
+
+        Arguments:
+            keys {list} -- The keys to delete.
         """
 
-        if not location:
-            location = self.config.DRIVERS['disk']['location'] + "/"
+        for key in keys:
+            self.delete(key)
+
+    def update(self, key, value, location=None):
+        """Updates a specific cache by key and keeps its expiration.
 
-        location = os.path.join(location, key)
-        cache = glob.glob(location + ':*')[0]
+        Arguments:
+            key {string} -- The key to update.
+            value {string} -- The new value.
 
-        open(cache, 'w').write(str(value))
+        Keyword Arguments:
+            location {string} -- The path the cache is stored in. (default: {None})
 
+        Returns:
+            string -- Returns the key
+        """
+
+        path = self._path(key, location)
+        entry = self._read(path)
+
+        self._write(path, value, entry[1] if entry else None)
         return key
 
     def cache_exists(self, key):
+        """Check if the cache exists.
+
+        Arguments:
+            key {string} -- The key to check.
+
+        Returns:
+            bool
         """
-        Check if the cache exists
+
+        return os.path.exists(self._path(key))
+
+    def is_valid(self, key):
+        """Check if a key is cached and has not expired. Expired files are removed.
+
+        Arguments:
+            key {string} -- The key to check.
+
+        Returns:
+            bool
         """
 
-        cache_path = self.config.DRIVERS['disk']['location'] + "/"
-        if self.cache_forever:
-            glob_path = cache_path + key + '*'
-        else:
-            glob_path = cache_path + key + ':*'
+        return self._read(self._path(key)) is not None
 
-        find_template = glob.glob(glob_path)
-        if find_template:
-            return True
-        return False
+    def _path(self, key, location=None):
+        """Get the path of the file a key is stored in.
 
-    def is_valid(self, key):
+        Arguments:
+            key {string} -- The key of the value.
+
+        Keyword Arguments:
+            location {string} -- The path the cache is stored in. (default: {None})
+
+        Returns:
+            string
         """
-        Check if a valid cache
+
+        if not location:
+            location = self.config.DRIVERS['disk']['location']
+
+        return os.path.join(location, hashlib.sha1(key.encode('utf-8')).hexdigest())
+
+    def _read(self, path):
+        """Read the value and expiration of a cache file. Expired files are removed.
+
+        Arguments:
+            path {string} -- The path of the cache file.
+
+        Returns:
+            tuple|None -- The value and the expiration timestamp or None when it never expires.
         """
 
-        cache_path = self.config.DRIVERS['disk']['location'] + "/"
-        if self.cache_forever:
-            glob_path = cache_path + key + '*'
-        else:
-            glob_path = cache_path + key + ':*'
+        try:
+            with open(path, 'rb') as cache_file:
+                header = cache_file.readline().rstrip(b'\n')
+                content = cache_file.read()
+        except FileNotFoundError:
+            return None
 
-        cache_file = glob.glob(glob_path)
-        if cache_file:
+        if header == self.forever:
+            return (content.decode('utf-8'), None)
+
+        try:
+            expires = float(header)
+        except ValueError:
+            return None
+
+        if expires <= time.time():
             try:
-                cache_timestamp = float(
-                    os.path.splitext(cache_file[0])[0].split(':')[1]
-                )
-            except IndexError:
-                if self.cache_forever:
-                    return True
-                else:
-                    return False
-
-            if cache_timestamp > time.time():
-                return True
-
-        self.delete(key)
-        return False
-
-    def _create_directory(self, directory):
-        if not os.path.exists(os.path.dirname(directory)):
-            # Create the path to the model if it does not exist
-            os.makedirs(os.path.dirname(directory))
-            return True
-        return False
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+            return None
+
+        return (content.decode('utf-8'), expires)
+
+    def _write(self, path, value, expires):
+        """Write a cache file through a temporary file so it is replaced at once.
+
+        Arguments:
+            path {string} -- The path of the cache file.
+            value {string} -- The value to store.
+            expires {float|None} -- Timestamp the value expires at or None to never expire.
+        """
+
+        directory = os.path.dirname(path)
+        header = self.forever if expires is None else repr(expires).encode('utf-8')
+
+        temporary = os.path.join(directory, '.tmp' + uuid.uuid4().hex)
+        flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY
+
+        # The kernel applies the umask to the mode like for any other new file
+        try:
+            descriptor = os.open(temporary, flags, 0o666)
+        except FileNotFoundError:
+            os.makedirs(directory, exist_ok=True)
+            descriptor = os.open(temporary, flags, 0o666)
+
+        try:
+            with os.fdopen(descriptor, 'wb') as cache_file:
+                cache_file.write(header + b'\n' + str(value).encode('utf-8'))
+
+            os.replace(temporary, path)
+        except BaseException:
+            os.remove(temporary)
+            raise
@@ -0,0 +1,258 @@
+"""Module for the cache memory driver.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from masonite.contracts.CacheContract import CacheContract
+from masonite.drivers.BaseDriver import BaseDriver
+from masonite.helpers.time import cache_seconds
+
+
+class CacheMemoryDriver(CacheContract, BaseDriver):
+    """Class for the cache memory driver.
+
+    Values are kept in memory in least recently used order. When the maximum amount
+    of entries or bytes is reached the least recently used values are removed first.
+    The values are shared by every instance of the driver in the process.
+    """
+
+    # key -> (value, expiration timestamp or None, size in bytes)
+    _cache = OrderedDict()
+    _size = 0
+    _lock = threading.RLock()
+
+    def __init__(self, CacheConfig, Application):
+        """Cache memory driver constructor
+
+        Arguments:
+            CacheConfig {config.cache} -- Cache configuration module.
+            Application {config.application} -- Application configuration module.
+        """
+
+        self.config = CacheConfig
+        self.appconfig = Application
+
+        config = CacheConfig.DRIVERS.get('memory', {})
+        self.max_entries = config.get('max_entries')
+        self.max_bytes = config.get('max_bytes')
+
+    def store(self, key, value, extension=".txt", location=None):
+        """Stores a value in the cache forever.
+
+        Arguments:
+            key {string} -- The key to store the value under.
+            value {string} -- The value you want to store in the cache
+
+        Keyword Arguments:
+            extension {string} -- Not used by the memory driver. (default: {".txt"})
+            location {string} -- Not used by the memory driver. (default: {None})
+
+        Returns:
+            string -- Returns the key
+        """
+
+        self._set(key, value, None)
+        return key
+
+    def store_for(self, key, value, cache_time, cache_type, extension=".txt", location=None):
+        """Store a value in the cache for a specific amount of time.
+
+        Arguments:
+            key {string} -- The key to store the value under.
+            value {string} -- The value you want to store in the cache
+            cache_time {int|string} -- The time as a string or an integer (1, 2, 5, 100, etc)
+            cache_type {string} -- The type of time to store for (minute, minutes, hours, seconds, etc)
+
+        Keyword Arguments:
+            extension {string} -- Not used by the memory driver. (default: {".txt"})
+            location {string} -- Not used by the memory driver. (default: {None})
+
+        Raises:
+            ValueError -- Thrown if an invalid cache type was caught (like houes instead of hours).
+
+        Returns:
+            string -- Returns the key
+        """
+
+        self._set(key, value, time.time() + cache_seconds(cache_time, cache_type))
+        return key
+
+    def get(self, key):
+        """Get the value of a key in the cache.
+
+        Arguments:
+            key {string} -- The key of the value.
+
+        Returns:
+            string|None -- Returns None if the key is not cached or has expired.
+        """
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+
+            if entry[1] is not None and entry[1] <= time.time():
+                self._remove(key)
+                return None
+
+            self._cache.move_to_end(key)
+            return entry[0]
+
+    def get_many(self, keys):
+        """Get the values of several keys while holding the lock once.
+
+        Arguments:
+            keys {list} -- The keys of the values.
+
+        Returns:
+            dict -- The value of every key or None when the key is not cached.
+        """
+
+        with self._lock:
+            return {key: self.get(key) for key in keys}
+
+    def set_many(self, values, cache_time=None, cache_type='seconds'):
+        """Store several values while holding the lock once.
+
+        Arguments:
+            values {dict} -- The values to store by key.
+
+        Keyword Arguments:
+            cache_time {int|string} -- The time to store the values for or None to store them forever. (default: {None})
+            cache_type {string} -- The type of time to store for (minute, minutes, hours, seconds, etc) (default: {'seconds'})
+
+        Raises:
+            ValueError -- Thrown if an invalid cache type was caught (like houes instead of hours).
+
+        Returns:
+            list -- Returns the keys
+        """
+
+        expires = None
+        if cache_time is not None:
+            expires = time.time() + cache_seconds(cache_time, cache_type)
+
+        with self._lock:
+            for key, value in values.items():
+                self._set(key, value, expires)
+
+        return list(values)
+
+    def delete(self, key):
+        """Delete a key from the cache.
+
+        Arguments:
+            key {string} -- The key to delete.
+        """
+
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+
+    def delete_many(self, keys):
+        """Delete several keys while holding the lock once.
+
+        Arguments:
+            keys {list} -- The keys to delete.
+        """
+
+        with self._lock:
+            for key in keys:
+                if key in self._cache:
+                    self._remove(key)
+
+    def update(self, key, value, location=None):
+        """Updates the value of a key and keeps its expiration. Keys that are not
+        cached or have expired are stored forever.
+
+        Arguments:
+            key {string} -- The key to update.
+            value {string} -- The new value.
+
+        Keyword Arguments:
+            location {string} -- Not used by the memory driver. (default: {None})
+
+        Returns:
+            string -- Returns the key
+        """
+
+        with self._lock:
+            expires = None
+            if self.cache_exists(key):
+                expires = self._cache[key][1]
+
+            self._set(key, value, expires)
+
+        return key
+
+    def cache_exists(self, key):
+        """Check if the cache exists without marking the key as recently used.
+
+        Arguments:
+            key {string} -- The key to check.
+
+        Returns:
+            bool
+        """
+
+        with self._lock:
+            entry = self._cache.get(key)
+            return entry is not None and (entry[1] is None or entry[1] > time.time())
+
+    def is_valid(self, key):
+        """Check if a key is cached and has not expired.
+
+        Arguments:
+            key {string} -- The key to check.
+
+        Returns:
+            bool
+        """
+
+        return self.get(key) is not None
+
+    def flush(self):
+        """Remove every value from the cache.
+        """
+
+        with self._lock:
+            self._cache.clear()
+            CacheMemoryDriver._size = 0
+
+    def _set(self, key, value, expires):
+        """Store a value and remove the least recently used values over the limits.
+        Values are stored as strings like the other cache drivers return them.
+
+        Arguments:
+            key {string} -- The key to store the value under.
+            value {string} -- The value to store.
+            expires {float|None} -- Timestamp the value expires at or None to never expire.
+        """
+
+        value = str(value)
+        size = sys.getsizeof(value)
+
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+
+            self._cache[key] = (value, expires, size)
+            CacheMemoryDriver._size += size
+
+            while self._cache and (
+                    (self.max_entries and len(self._cache) > self.max_entries)
+                    or (self.max_bytes and self._size > self.max_bytes)):
+                self._remove(next(iter(self._cache)))
+
+    def _remove(self, key):
+        """Remove a key from the cache. The lock must be held.
+
+        Arguments:
+            key {string} -- The key to remove.
+        """
+
+        CacheMemoryDriver._size -= self._cache.pop(key)[2]
@@ -0,0 +1,288 @@
+"""Module for the cache redis driver.
+"""
+
+import os
+import threading
+import weakref
+
+from masonite.contracts.CacheContract import CacheContract
+from masonite.drivers.BaseDriver import BaseDriver
+from masonite.exceptions import DriverLibraryNotFound
+from masonite.helpers.time import cache_seconds
+
+
+class CacheRedisDriver(CacheContract, BaseDriver):
+    """Class for the cache redis driver.
+
+    Every process creates one client with a connection pool for each redis
+    server and every driver in the process shares that client. Values expire
+    through the time to live of redis keys.
+    """
+
+    # (process id, connection settings) -> redis.Redis
+    _clients = {}
+    _lock = threading.Lock()
+
+    # redis.Redis -> False when the server does not support SET KEEPTTL
+    _keeps_ttl = weakref.WeakKeyDictionary()
+
+    def __init__(self, CacheConfig, Application):
+        """Cache redis driver constructor
+
+        Arguments:
+            CacheConfig {config.cache} -- Cache configuration module.
+            Application {config.application} -- Application configuration module.
+        """
+
+        self.config = CacheConfig
+        self.appconfig = Application
+
+        config = dict(CacheConfig.DRIVERS.get('redis', {}))
+        self.prefix = config.pop('prefix', '')
+        self.connection = config
+        self.client = None
+
+    def store(self, key, value, extension=".txt", location=None):
+        """Stores a value in the cache forever.
+
+        Arguments:
+            key {string} -- The key to store the value under.
+            value {string} -- The value you want to store in the cache
+
+        Keyword Arguments:
+            extension {string} -- Not used by the redis driver. (default: {".txt"})
+            location {string} -- Not used by the redis driver. (default: {None})
+
+        Returns:
+            string -- Returns the key
+        """
+
+        self._client().set(self.prefix + key, str(value))
+        return key
+
+    def store_for(self, key, value, cache_time, cache_type, extension=".txt", location=None):
+        """Store a value in the cache for a specific amount of time.
+
+        Arguments:
+            key {string} -- The key to store the value under.
+            value {string} -- The value you want to store in the cache
+            cache_time {int|string} -- The time as a string or an integer (1, 2, 5, 100, etc)
+            cache_type {string} -- The type of time to store for (minute, minutes, hours, seconds, etc)
+
+        Keyword Arguments:
+            extension {string} -- Not used by the redis driver. (default: {".txt"})
+            location {string} -- Not used by the redis driver. (default: {None})
+
+        Raises:
+            ValueError -- Thrown if an invalid cache type was caught (like houes instead of hours).
+
+        Returns:
+            string -- Returns the key
+        """
+
+        self._set(self._client(), key, value, cache_seconds(cache_time, cache_type))
+        return key
+
+    def get(self, key):
+        """Get the value of a key in the cache.
+
+        Arguments:
+            key {string} -- The key of the value.
+
+        Returns:
+            string|None -- Returns None if the key is not cached or has expired.
+        """
+
+        return self._client().get(self.prefix + key)
+
+    def get_many(self, keys):
+        """Get the values of several keys with one round trip to redis.
+
+        Arguments:
+            keys {list} -- The keys of the values.
+
+        Returns:
+            dict -- The value of every key or None when the key is not cached.
+        """
+
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        return dict(zip(keys, self._client().mget([self.prefix + key for key in keys])))
+
+    def set_many(self, values, cache_time=None, cache_type='seconds'):
+        """Store several values in one pipeline.
+
+        Arguments:
+            values {dict} -- The values to store by key.
+
+        Keyword Arguments:
+            cache_time {int|string} -- The time to store the values for or None to store them forever. (default: {None})
+            cache_type {string} -- The type of time to store for (minute, minutes, hours, seconds, etc) (default: {'seconds'})
+
+        Raises:
+            ValueError -- Thrown if an invalid cache type was caught (like houes instead of hours).
+
+        Returns:
+            list -- Returns the keys
+        """
+
+        seconds = None if cache_time is None else cache_seconds(cache_time, cache_type)
+
+        pipeline = self._client().pipeline(transaction=False)
+        for key, value in values.items():
+            if seconds is None:
+                pipeline.set(self.prefix + key, str(value))
+            else:
+                self._set(pipeline, key, value, seconds)
+        pipeline.execute()
+
+        return list(values)
+
+    def delete(self, key):
+        """Delete a key from the cache.
+
+        Arguments:
+            key {string} -- The key to delete.
+        """
+
+        self._client().delete(self.prefix + key)
+
+    def delete_many(self, keys):
+        """Delete several keys with one command.
+
+        Arguments:
+            keys {list} -- The keys to delete.
+        """
+
+        keys = [self.prefix + key for key in keys]
+        if keys:
+            self._client().delete(*keys)
+
+    def update(self, key, value, location=None):
+        """Updates the value of a key and keeps its time to live.
+
+        Arguments:
+            key {string} -- The key to update.
+            value {string} -- The new value.
+
+        Keyword Arguments:
+            location {string} -- Not used by the redis driver. (default: {None})
+
+        Returns:
+            string -- Returns the key
+        """
+
+        from redis.exceptions import ResponseError
+
+        client = self._client()
+
+        # Servers older than redis 6 answer SET KEEPTTL with a syntax error
+        if self._keeps_ttl.get(client, True):
+            try:
+                client.execute_command('SET', self.prefix + key, str(value), 'KEEPTTL')
+                return key
+            except ResponseError as e:
+                if 'syntax' not in str(e).lower():
+                    raise
+
+                self._keeps_ttl[client] = False
+
+        client.transaction(self._update_with_ttl(key, value), self.prefix + key)
+        return key
+
+    def cache_exists(self, key):
+        """Check if the cache exists.
+
+        Arguments:
+            key {string} -- The key to check.
+
+        Returns:
+            bool
+        """
+
+        return bool(self._client().exists(self.prefix + key))
+
+    def is_valid(self, key):
+        """Check if a key is cached and has not expired.
+
+        Arguments:
+            key {string} -- The key to check.
+
+        Returns:
+            bool
+        """
+
+        return self.cache_exists(key)
+
+    def _set(self, client, key, value, seconds):
+        """Store a value with a time to live. Values that would expire at once are deleted.
+
+        Arguments:
+            client {redis.Redis|redis.client.Pipeline} -- The client or pipeline to send the command to.
+            key {string} -- The key to store the value under.
+            value {string} -- The value to store.
+            seconds {float} -- The amount of seconds the value is stored for.
+        """
+
+        milliseconds = int(seconds * 1000)
+
+        if milliseconds <= 0:
+            client.delete(self.prefix + key)
+        else:
+            client.set(self.prefix + key, str(value), px=milliseconds)
+
+    def _update_with_ttl(self, key, value):
+        """Get the transaction that updates a value and keeps its time to live on servers
+        without SET KEEPTTL. The transaction is retried when the key changes while it runs.
+
+        Arguments:
+            key {string} -- The key to update.
+            value {string} -- The new value.
+
+        Returns:
+            callable -- The transaction to run with redis.Redis.transaction().
+        """
+
+        def update(pipeline):
+            milliseconds = pipeline.pttl(self.prefix + key)
+            pipeline.multi()
+
+            if milliseconds and milliseconds > 0:
+                pipeline.set(self.prefix + key, str(value), px=milliseconds)
+            else:
+                pipeline.set(self.prefix + key, str(value))
+
+        return update
+
+    def _client(self):
+        """Get the redis client of the current process.
+
+        Raises:
+            DriverLibraryNotFound -- Thrown when the redis library is not installed.
+
+        Returns:
+            redis.Redis
+        """
+
+        if self.client is not None:
+            return self.client
+
+        key = (os.getpid(), tuple(sorted(self.connection.items())))
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        try:
+            import redis
+        except ImportError:
+            raise DriverLibraryNotFound(
+                'Could not find the "redis" library. Please pip install this library running "pip install redis"')
+
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = redis.Redis(
+                    connection_pool=redis.ConnectionPool(decode_responses=True, **self.connection))
+
+            return self._clients[key]
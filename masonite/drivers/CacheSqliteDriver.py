@@ -0,0 +1,349 @@
+"""Module for the cache sqlite driver.
+"""
+
+import itertools
+import os
+import sqlite3
+import threading
+import time
+
+from masonite.contracts.CacheContract import CacheContract
+from masonite.drivers.BaseDriver import BaseDriver
+from masonite.helpers.time import cache_seconds
+
+
+class CacheSqliteDriver(CacheContract, BaseDriver):
+    """Class for the cache sqlite driver.
+
+    Values are stored in a SQLite database in write-ahead logging mode so every
+    worker process on the host shares the same cache and readers never wait on
+    a writer. Every thread of a process opens its own connection to the database.
+    Expired rows are skipped when reading and removed in batches while writing.
+    """
+
+    _local = threading.local()
+    _writes = itertools.count(1)
+    batch_size = 500
+
+    def __init__(self, CacheConfig, Application):
+        """Cache sqlite driver constructor
+
+        Arguments:
+            CacheConfig {config.cache} -- Cache configuration module.
+            Application {config.application} -- Application configuration module.
+        """
+
+        self.config = CacheConfig
+        self.appconfig = Application
+
+        config = CacheConfig.DRIVERS.get('sqlite', {})
+        self.location = config.get('location', 'bootstrap/cache/cache.sqlite3')
+        self.timeout = config.get('timeout', 5)
+        self.evict_every = config.get('evict_every', 1000)
+        self.evict_batch = config.get('evict_batch', 500)
+
+    def store(self, key, value, extension=".txt", location=None):
+        """Stores a value in the cache forever.
+
+        Arguments:
+            key {string} -- The key to store the value under.
+            value {string} -- The value you want to store in the cache
+
+        Keyword Arguments:
+            extension {string} -- Not used by the sqlite driver. (default: {".txt"})
+            location {string} -- Not used by the sqlite driver. (default: {None})
+
+        Returns:
+            string -- Returns the key
+        """
+
+        self._set(key, value, None)
+        return key
+
+    def store_for(self, key, value, cache_time, cache_type, extension=".txt", location=None):
+        """Store a value in the cache for a specific amount of time.
+
+        Arguments:
+            key {string} -- The key to store the value under.
+            value {string} -- The value you want to store in the cache
+            cache_time {int|string} -- The time as a string or an integer (1, 2, 5, 100, etc)
+            cache_type {string} -- The type of time to store for (minute, minutes, hours, seconds, etc)
+
+        Keyword Arguments:
+            extension {string} -- Not used by the sqlite driver. (default: {".txt"})
+            location {string} -- Not used by the sqlite driver. (default: {None})
+
+        Raises:
+            ValueError -- Thrown if an invalid cache type was caught (like houes instead of hours).
+
+        Returns:
+            string -- Returns the key
+        """
+
+        self._set(key, value, time.time() + cache_seconds(cache_time, cache_type))
+        return key
+
+    def get(self, key):
+        """Get the value of a key in the cache.
+
+        Arguments:
+            key {string} -- The key of the value.
+
+        Returns:
+            string|None -- Returns None if the key is not cached or has expired.
+        """
+
+        row = self._connection().execute(
+            'SELECT value FROM cache WHERE key = ? AND (expires IS NULL OR expires > ?)',
+            (key, time.time())
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        return row[0]
+
+    def delete(self, key):
+        """Delete a key from the cache.
+
+        Arguments:
+            key {string} -- The key to delete.
+        """
+
+        self._connection().execute('DELETE FROM cache WHERE key = ?', (key,))
+
+    def get_many(self, keys):
+        """Get the values of several keys with one query for every batch of keys.
+
+        Arguments:
+            keys {list} -- The keys of the values.
+
+        Returns:
+            dict -- The value of every key or None when the key is not cached.
+        """
+
+        values = dict.fromkeys(keys)
+        now = time.time()
+
+        for batch in self._batches(list(values)):
+            values.update(self._connection().execute(
+                'SELECT key, value FROM cache WHERE key IN ({0}) '
+                'AND (expires IS NULL OR expires > ?)'.format(', '.join('?' * len(batch))),
+                batch + [now]
+            ))
+
+        return values
+
+    def set_many(self, values, cache_time=None, cache_type='seconds'):
+        """Store several values in one transaction.
+
+        Arguments:
+            values {dict} -- The values to store by key.
+
+        Keyword Arguments:
+            cache_time {int|string} -- The time to store the values for or None to store them forever. (default: {None})
+            cache_type {string} -- The type of time to store for (minute, minutes, hours, seconds, etc) (default: {'seconds'})
+
+        Raises:
+            ValueError -- Thrown if an invalid cache type was caught (like houes instead of hours).
+
+        Returns:
+            list -- Returns the keys
+        """
+
+        expires = None
+        if cache_time is not None:
+            expires = time.time() + cache_seconds(cache_time, cache_type)
+
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.executemany(
+                'INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)',
+                [(key, str(value), expires) for key, value in values.items()]
+            )
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+        connection.execute('COMMIT')
+        self._count_writes(len(values))
+
+        return list(values)
+
+    def delete_many(self, keys):
+        """Delete several keys with one query for every batch of keys.
+
+        Arguments:
+            keys {list} -- The keys to delete.
+        """
+
+        for batch in self._batches(list(keys)):
+            self._connection().execute(
+                'DELETE FROM cache WHERE key IN ({0})'.format(', '.join('?' * len(batch))), batch
+            )
+
+    def update(self, key, value, location=None):
+        """Updates the value of a key and keeps its expiration. Keys that are not
+        cached or have expired are stored forever.
+
+        Arguments:
+            key {string} -- The key to update.
+            value {string} -- The new value.
+
+        Keyword Arguments:
+            location {string} -- Not used by the sqlite driver. (default: {None})
+
+        Returns:
+            string -- Returns the key
+        """
+
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            updated = connection.execute(
+                'UPDATE cache SET value = ? WHERE key = ? AND (expires IS NULL OR expires > ?)',
+                (str(value), key, time.time())
+            ).rowcount
+
+            if not updated:
+                connection.execute(
+                    'INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, NULL)',
+                    (key, str(value))
+                )
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+
+        connection.execute('COMMIT')
+
+        return key
+
+    def cache_exists(self, key):
+        """Check if the cache exists.
+
+        Arguments:
+            key {string} -- The key to check.
+
+        Returns:
+            bool
+        """
+
+        return self.is_valid(key)
+
+    def is_valid(self, key):
+        """Check if a key is cached and has not expired.
+
+        Arguments:
+            key {string} -- The key to check.
+
+        Returns:
+            bool
+        """
+
+        return self.get(key) is not None
+
+    def evict(self, limit=None):
+        """Remove expired rows from the cache.
+
+        Keyword Arguments:
+            limit {int} -- The most rows to remove, defaults to the evict_batch setting. (default: {None})
+
+        Returns:
+            int -- The amount of rows that were removed.
+        """
+
+        return self._connection().execute(
+            'DELETE FROM cache WHERE key IN '
+            '(SELECT key FROM cache WHERE expires <= ? ORDER BY expires LIMIT ?)',
+            (time.time(), limit or self.evict_batch)
+        ).rowcount
+
+    def flush(self):
+        """Remove every value from the cache.
+        """
+
+        self._connection().execute('DELETE FROM cache')
+
+    def _set(self, key, value, expires):
+        """Store a value and remove a batch of expired rows every evict_every writes.
+
+        Arguments:
+            key {string} -- The key to store the value under.
+            value {string} -- The value to store.
+            expires {float|None} -- Timestamp the value expires at or None to never expire.
+        """
+
+        self._connection().execute(
+            'INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)',
+            (key, str(value), expires)
+        )
+
+        self._count_writes(1)
+
+    def _count_writes(self, amount):
+        """Count writes and remove a batch of expired rows every evict_every writes.
+
+        Arguments:
+            amount {int} -- The amount of rows that were written.
+        """
+
+        if not self.evict_every:
+            return
+
+        if any(next(self._writes) % self.evict_every == 0 for dummy in range(amount)):
+            self.evict()
+
+    def _batches(self, keys):
+        """Split keys into batches that stay below the parameter limit of SQLite.
+
+        Arguments:
+            keys {list} -- The keys to split.
+
+        Returns:
+            generator -- Lists of at most batch_size keys.
+        """
+
+        for start in range(0, len(keys), self.batch_size):
+            yield keys[start:start + self.batch_size]
+
+    def _connection(self):
+        """Get the connection of the current thread to the database. Connections
+        are not shared with processes forked after they were opened.
+
+        Returns:
+            sqlite3.Connection
+        """
+
+        local = self._local
+        if getattr(local, 'pid', None) != os.getpid():
+            local.pid = os.getpid()
+            local.connections = {}
+
+        connection = local.connections.get(self.location)
+        if connection is None:
+            connection = local.connections[self.location] = self._connect()
+
+        return connection
+
+    def _connect(self):
+        """Open a connection to the database and create the cache table.
+
+        Returns:
+            sqlite3.Connection
+        """
+
+        directory = os.path.dirname(self.location)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        connection = sqlite3.connect(self.location, timeout=self.timeout, isolation_level=None)
+        connection.execute('PRAGMA journal_mode = WAL')
+        connection.execute('PRAGMA synchronous = NORMAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS cache '
+            '(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL) WITHOUT ROWID'
+        )
+        connection.execute('CREATE INDEX IF NOT EXISTS cache_expires ON cache (expires)')
+
+        return connection
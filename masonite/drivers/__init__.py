@@ -4,6 +4,9 @@ from .BaseUploadDriver import BaseUploadDriver
 from .BroadcastAblyDriver import BroadcastAblyDriver
 from .BroadcastPusherDriver import BroadcastPusherDriver
 from .CacheDiskDriver import CacheDiskDriver
+from .CacheMemoryDriver import CacheMemoryDriver
+from .CacheRedisDriver import CacheRedisDriver
+from .CacheSqliteDriver import CacheSqliteDriver
 from .MailMailgunDriver import MailMailgunDriver
 from .MailSmtpDriver import MailSmtpDriver
 from .QueueAsyncDriver import QueueAsyncDriver
@@ -7,6 +7,8 @@ import platform
 import sys
 import traceback
 
+from masonite.helpers.boolean import to_bool
+
 package_directory = os.path.dirname(os.path.realpath(__file__))
 
 
@@ -60,7 +62,7 @@ class ExceptionHandler:
         self._app.make('HookHandler').fire('*ExceptionHook')
 
         # Check if DEBUG is False
-        if not self._app.make('Application').DEBUG or self._app.make('Application').DEBUG == 'False':
+        if not to_bool(getattr(self._app.make('Application'), 'DEBUG', False)):
             return
 
         # return a view
@@ -0,0 +1,173 @@
+"""Module for caching fragments of templates.
+"""
+
+import hashlib
+import threading
+
+from jinja2 import nodes
+from jinja2.ext import Extension
+from markupsafe import Markup
+
+
+class FragmentCacheStats:
+    """Counts the hits and misses of cached template fragments.
+    """
+
+    def __init__(self):
+        """FragmentCacheStats constructor
+        """
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def hit(self):
+        """Count a fragment that was found in the cache.
+        """
+
+        with self._lock:
+            self.hits += 1
+
+    def miss(self):
+        """Count a fragment that had to be rendered.
+        """
+
+        with self._lock:
+            self.misses += 1
+
+    def reset(self):
+        """Reset the counts to zero.
+        """
+
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+class FragmentCacheExtension(Extension):
+    """Jinja extension adding the cache tag to templates.
+
+    The body of the tag is stored in the Cache container binding for a number of
+    seconds. Any arguments after the amount of seconds are added to the key so a
+    fragment can be cached for every user or every locale:
+
+        {% cache 'sidebar', 300, user.id %}
+            ...
+        {% endcache %}
+
+    Only strings, numbers, booleans and None can be used to vary a fragment by.
+    Pass an attribute like user.id rather than the object itself.
+
+    Without an amount of seconds the fragment is cached forever. Without a Cache
+    binding the fragment is rendered every time.
+    """
+
+    tags = set(['cache'])
+
+    def __init__(self, environment):
+        """FragmentCacheExtension constructor
+
+        Arguments:
+            environment {jinja2.Environment} -- The environment the extension is added to.
+        """
+
+        super().__init__(environment)
+        environment.extend(
+            fragment_cache_container=None,
+            fragment_cache_stats=FragmentCacheStats()
+        )
+
+    def parse(self, parser):
+        """Parse the cache tag into a call of the _cache method.
+
+        Arguments:
+            parser {jinja2.parser.Parser} -- The template parser.
+
+        Returns:
+            jinja2.nodes.CallBlock
+        """
+
+        lineno = next(parser.stream).lineno
+
+        arguments = [parser.parse_expression()]
+        while parser.stream.skip_if('comma'):
+            arguments.append(parser.parse_expression())
+
+        key = arguments[0]
+        seconds = arguments[1] if len(arguments) > 1 else nodes.Const(None)
+        vary = nodes.List(arguments[2:])
+
+        body = parser.parse_statements(['name:endcache'], drop_needle=True)
+
+        return nodes.CallBlock(
+            self.call_method('_cache', [key, seconds, vary]), [], [], body
+        ).set_lineno(lineno)
+
+    def _cache(self, key, seconds, vary, caller):
+        """Get the fragment from the cache or render and store it.
+
+        Arguments:
+            key {string} -- Name of the fragment.
+            seconds {int|None} -- Amount of seconds to cache the fragment for.
+            vary {list} -- Values the fragment varies by.
+            caller {callable} -- Renders the body of the tag.
+
+        Returns:
+            jinja2.Markup
+        """
+
+        container = self.environment.fragment_cache_container
+        stats = self.environment.fragment_cache_stats
+
+        if container is None or not container.has('Cache'):
+            stats.miss()
+            return caller()
+
+        cache = container.make('Cache')
+        key = self._key(key, vary)
+
+        fragment = cache.get(key)
+        if fragment is not None:
+            stats.hit()
+            return Markup(fragment)
+
+        stats.miss()
+        fragment = caller()
+
+        if seconds is None:
+            cache.store(key, str(fragment), '.html')
+        else:
+            cache.store_for(key, str(fragment), seconds, 'seconds', '.html')
+
+        return fragment
+
+    # Types whose repr does not change between requests
+    vary_types = (str, int, float, bool, type(None))
+
+    @classmethod
+    def _key(cls, key, vary):
+        """Get the cache key of a fragment.
+
+        Arguments:
+            key {string} -- Name of the fragment.
+            vary {list} -- Values the fragment varies by.
+
+        Raises:
+            TypeError -- Thrown when the fragment varies by a value that is not a string, number, boolean or None.
+
+        Returns:
+            string
+        """
+
+        for value in vary:
+            if not isinstance(value, cls.vary_types):
+                raise TypeError(
+                    "The '{0}' fragment cannot vary by a {1} object. Vary it by a string, number, "
+                    "boolean or None such as an id instead.".format(key, type(value).__name__))
+
+        key = 'fragment_{0}'.format(key)
+
+        if vary:
+            key += '_' + hashlib.md5(repr(vary).encode('utf-8')).hexdigest()
+
+        return key
@@ -0,0 +1,17 @@
+""" Boolean Module """
+
+
+def to_bool(value):
+    """Turns a configuration value such as an environment variable into a boolean.
+
+    Arguments:
+        value {bool|string|None} -- Could be values like True, 'true', '1' or 'False'
+
+    Returns:
+        bool
+    """
+
+    if isinstance(value, str):
+        return value.strip().lower() in ('true', '1', 'yes', 'on')
+
+    return bool(value)
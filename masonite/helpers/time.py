@@ -35,3 +35,40 @@ def cookie_expire_time(str_time):
         return None
     else:
         return pendulum.now('GMT').subtract(years=20).format('%a, %d %b %Y %H:%M:%S GMT')
+
+
+def cache_seconds(cache_time, cache_type):
+    """Takes an amount of time like 5 and a type like minutes and returns the amount of seconds.
+
+    Arguments:
+        cache_time {int|string} -- The time as a string or an integer (1, 2, 5, 100, etc)
+        cache_type {string} -- The type of time (second, minutes, hours, days, months or years)
+
+    Raises:
+        ValueError -- Thrown if an invalid cache type was caught (like houes instead of hours).
+
+    Returns:
+        float -- The amount of seconds.
+    """
+
+    cache_type = cache_type.lower()
+
+    if cache_type in ('second', 'seconds'):
+        calc = 1
+    elif cache_type in ('minute', 'minutes'):
+        calc = 60
+    elif cache_type in ('hour', 'hours'):
+        calc = 60 * 60
+    elif cache_type in ('day', 'days'):
+        calc = 60 * 60 * 24
+    elif cache_type in ('week', 'weeks'):
+        calc = 60 * 60 * 24 * 7
+    elif cache_type in ('month', 'months'):
+        calc = 60 * 60 * 24 * 30
+    elif cache_type in ('year', 'years'):
+        calc = 60 * 60 * 24 * 365
+    else:
+        raise ValueError(
+            '{0} is not a valid caching type.'.format(cache_type))
+
+    return float(cache_time) * calc
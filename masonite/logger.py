@@ -0,0 +1,176 @@
+"""Module for the Access Logger
+"""
+
+import atexit
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+from logging.handlers import QueueListener, RotatingFileHandler
+
+from masonite.exceptions import DriverNotFound
+
+
+class AccessLogger:
+    """Writes a record of every request to a sink from a background thread.
+
+    Requests only put the record on a queue. A writer thread takes the records
+    off the queue and writes them to stdout, a file or a rotating file so a
+    request never waits on the sink.
+    """
+
+    format = '%(asctime)s %(levelname)s %(method)s %(path)s %(status)s %(duration).2fms %(bytes)s'
+
+    def __init__(self, sink='stdout', location='storage/logs/access.log', level='INFO',
+                 sample_rate=1.0, max_bytes=10485760, backups=5):
+        """AccessLogger constructor
+
+        Keyword Arguments:
+            sink {string} -- Where records are written to (stdout|file|rotating). (default: {'stdout'})
+            location {string} -- The file records are written to by the file sinks. (default: {'storage/logs/access.log'})
+            level {string} -- Records below this level are not written. (default: {'INFO'})
+            sample_rate {float} -- Fraction of the requests that are logged. (default: {1.0})
+            max_bytes {int} -- Size a rotating file is rotated at. (default: {10485760})
+            backups {int} -- Amount of rotated files to keep. (default: {5})
+
+        Raises:
+            DriverNotFound -- Thrown when the sink is not supported.
+            ValueError -- Thrown when the level is not a logging level.
+        """
+
+        if isinstance(level, str):
+            # getLevelName() returns a string for names it does not know
+            name, level = level, logging.getLevelName(level.upper())
+            if not isinstance(level, int):
+                raise ValueError(
+                    "'{0}' is not a logging level. Use DEBUG, INFO, WARNING, ERROR or CRITICAL.".format(name))
+
+        self.level = level
+        self.sample_rate = sample_rate
+        self.queue = queue.Queue()
+        self.listener = QueueListener(
+            self.queue, self._create_handler(sink, location, max_bytes, backups))
+        self.running = False
+        self._lock = threading.Lock()
+        self._stops_at_exit = False
+
+    @classmethod
+    def from_config(cls, config):
+        """Create the access logger from the ACCESS_LOG configuration dictionary.
+
+        Arguments:
+            config {dict} -- The ACCESS_LOG setting of config/application.py
+
+        Returns:
+            masonite.logger.AccessLogger|None -- Returns None when access logging is disabled.
+        """
+
+        config = dict(config)
+        if not config.pop('enabled', True):
+            return None
+
+        return cls(**config)
+
+    def log(self, method, path, status, duration, size):
+        """Queue the record of a request. Server errors are logged as errors
+        and client errors as warnings.
+
+        Arguments:
+            method {string} -- The request method.
+            path {string} -- The path of the request.
+            status {string} -- The status code of the response.
+            duration {float} -- Time spent on the request in milliseconds.
+            size {int|string} -- Length of the response body in bytes or '-' when it is not known.
+
+        Returns:
+            bool -- Whether the record was queued.
+        """
+
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return False
+
+        if status.startswith('5'):
+            level = logging.ERROR
+        elif status.startswith('4'):
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+
+        if level < self.level:
+            return False
+
+        if not self.running:
+            self.start()
+
+        self.queue.put_nowait(logging.makeLogRecord({
+            'name': 'masonite.access',
+            'levelno': level,
+            'levelname': logging.getLevelName(level),
+            'msg': '%s %s %s',
+            'args': (method, path, status),
+            'method': method,
+            'path': path,
+            'status': status,
+            'duration': duration,
+            'bytes': size,
+        }))
+
+        return True
+
+    def start(self):
+        """Start the writer thread.
+        """
+
+        with self._lock:
+            if not self.running:
+                self.listener.start()
+                self.running = True
+
+                if not self._stops_at_exit:
+                    atexit.register(self.stop)
+                    self._stops_at_exit = True
+
+    def stop(self):
+        """Write every queued record and stop the writer thread.
+        """
+
+        with self._lock:
+            if self.running:
+                self.running = False
+                self.listener.stop()
+
+    def _create_handler(self, sink, location, max_bytes, backups):
+        """Create the logging handler writing to the sink.
+
+        Arguments:
+            sink {string} -- Where records are written to (stdout|file|rotating).
+            location {string} -- The file records are written to by the file sinks.
+            max_bytes {int} -- Size a rotating file is rotated at.
+            backups {int} -- Amount of rotated files to keep.
+
+        Raises:
+            DriverNotFound -- Thrown when the sink is not supported.
+
+        Returns:
+            logging.Handler
+        """
+
+        if sink == 'stdout':
+            handler = logging.StreamHandler(sys.stdout)
+        elif sink in ('file', 'rotating'):
+            directory = os.path.dirname(location)
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+
+            if sink == 'file':
+                handler = logging.FileHandler(location, delay=True)
+            else:
+                handler = RotatingFileHandler(
+                    location, maxBytes=max_bytes, backupCount=backups, delay=True)
+        else:
+            raise DriverNotFound('"{0}" is not a supported access log sink. Use stdout, file or rotating.'.format(sink))
+
+        handler.setFormatter(logging.Formatter(self.format))
+        return handler
@@ -8,6 +8,15 @@ class ServiceProvider:
 
     wsgi = True
 
+    # Deferred providers are only registered and booted once one of the
+    # keys they provide is made from the container
+    deferred = False
+    provides = []
+
+    # Classes bound by a deferred provider. The provider is also loaded when one
+    # of them satisfies an annotation, such as a contract, that is resolved
+    provides_classes = []
+
     def __init__(self):
         """Service provider constructor
         """
@@ -1,31 +1,35 @@
 """ An AppProvider Service Provider """
 
+import copy
+
 from config import application, middleware, storage
 
+from masonite.auth import Csrf
 from masonite.autoload import Autoload
 from masonite.commands import (AuthCommand, CommandCommand, ControllerCommand,
                                InfoCommand, InstallCommand, JobCommand,
                                KeyCommand, MakeMigrationCommand,
                                MigrateCommand, MigrateRefreshCommand,
                                MigrateResetCommand, MigrateRollbackCommand,
-                               ModelCommand, ProviderCommand, RoutesCommand,
-                               SeedCommand, SeedRunCommand, ServeCommand,
-                               TinkerCommand, ViewCommand, ValidatorCommand)
+                               ModelCommand, ProviderCommand, RouteCacheCommand,
+                               RoutesCommand, SeedCommand, SeedRunCommand,
+                               ServeCommand, TinkerCommand, ValidatorCommand,
+                               ViewCommand, ViewCompileCommand)
 
 from masonite.exception_handler import ExceptionHandler
+from masonite.exceptions import InvalidRouteCompileException
 from masonite.helpers.routes import flatten_routes
 from masonite.hook import Hook
 from masonite.provider import ServiceProvider
 from masonite.request import Request
-from masonite.routes import Route
-from routes import api, web
+from masonite.routes import Route, RouteCache
 
 
 class AppProvider(ServiceProvider):
 
     def register(self):
         self.app.bind('HookHandler', Hook(self.app))
-        self.app.bind('WebRoutes', flatten_routes(web.ROUTES))
+        self.app.bind('WebRoutes', self._load_routes())
         self.app.bind('Response', None)
         self.app.bind('Storage', storage)
         self.app.bind('Route', Route())
@@ -51,7 +55,9 @@ class AppProvider(ServiceProvider):
         self.app.bind('MasoniteModelCommand', ModelCommand())
         self.app.bind('MasoniteProviderCommand', ProviderCommand())
         self.app.bind('MasoniteViewCommand', ViewCommand())
+        self.app.bind('MasoniteViewCompileCommand', ViewCompileCommand())
         self.app.bind('MasoniteRoutesCommand', RoutesCommand())
+        self.app.bind('MasoniteRouteCacheCommand', RouteCacheCommand())
         self.app.bind('MasoniteServeCommand', ServeCommand())
         self.app.bind('MasoniteSeedCommand', SeedCommand())
         self.app.bind('MasoniteSeedRunCommand', SeedRunCommand())
@@ -63,8 +69,68 @@ class AppProvider(ServiceProvider):
     def boot(self, Environ, Request, Route):
         self.app.bind('Headers', [])
         self.app.bind('StatusCode', '404 Not Found')
+
+        if self.app.parent is not None:
+            Request, Route = self._scope_request(Request)
+
         Route.load_environ(Environ)
         Request.load_environ(Environ).load_app(self.app)
 
+    def _scope_request(self, request):
+        """
+        |--------------------------------------------------------------------------
+        | Bind Request Objects Into The Request Container
+        |--------------------------------------------------------------------------
+        |
+        | When booting inside a child container, every object that holds on to
+        | the current request is created again and bound into the child. This
+        | way requests running in parallel threads never share the request,
+        | the route, the view data or the exception handling.
+        |
+        """
+
+        request = request.clone()
+        route = Route()
+
+        self.app.bind('Request', request)
+        self.app.bind('Route', route)
+        self.app.bind('HookHandler', Hook(self.app))
+        self.app.bind('ExceptionHandler', ExceptionHandler(self.app))
+
+        if self.app.has('Csrf'):
+            self.app.bind('Csrf', Csrf(request))
+
+        if self.app.has('ViewClass'):
+            view = copy.copy(self.app.make('ViewClass'))
+            view.dictionary = view.dictionary.copy()
+            view.container = self.app
+            self.app.bind('ViewClass', view)
+            self.app.bind('View', view.render)
+
+        return request, route
+
+    def _load_routes(self):
+        """
+        |--------------------------------------------------------------------------
+        | Load The Application Routes
+        |--------------------------------------------------------------------------
+        |
+        | When the routes have been cached with the route:cache command they are
+        | loaded from the cache file and routes/web.py is never imported. The
+        | controllers of cached routes are imported the first time they run.
+        | A cache that no longer matches the application is skipped.
+        |
+        """
+
+        cache = RouteCache()
+        if cache.exists():
+            try:
+                return cache.load()
+            except InvalidRouteCompileException:
+                pass
+
+        from routes import web
+        return flatten_routes(web.ROUTES)
+
     def _autoload(self, directories):
         Autoload(self.app).load(directories)
@@ -9,6 +9,9 @@ from masonite.provider import ServiceProvider
 class BroadcastProvider(ServiceProvider):
 
     wsgi = False
+    deferred = True
+    provides = ['BroadcastConfig', 'BroadcastPusherDriver', 'BroadcastAblyDriver', 'BroadcastManager', 'Broadcast']
+    provides_classes = [BroadcastPusherDriver, BroadcastAblyDriver, BroadcastManager]
 
     def register(self):
         self.app.bind('BroadcastConfig', broadcast)
@@ -1,7 +1,8 @@
 """ A Cache Service Provider """
 
 from config import cache
-from masonite.drivers import CacheDiskDriver
+from masonite.drivers import (CacheDiskDriver, CacheMemoryDriver,
+                              CacheRedisDriver, CacheSqliteDriver)
 from masonite.managers.CacheManager import CacheManager
 from masonite.provider import ServiceProvider
 
@@ -13,6 +14,9 @@ class CacheProvider(ServiceProvider):
     def register(self):
         self.app.bind('CacheConfig', cache)
         self.app.bind('CacheDiskDriver', CacheDiskDriver)
+        self.app.bind('CacheMemoryDriver', CacheMemoryDriver)
+        self.app.bind('CacheRedisDriver', CacheRedisDriver)
+        self.app.bind('CacheSqliteDriver', CacheSqliteDriver)
         self.app.bind('CacheManager', CacheManager(self.app))
 
     def boot(self, CacheManager, CacheConfig):
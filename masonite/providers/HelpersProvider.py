@@ -3,6 +3,7 @@
 import builtins
 import os
 
+from masonite.helpers.static import static
 from masonite.helpers.view_helpers import back, set_request_method
 from masonite.provider import ServiceProvider
 
@@ -14,22 +15,43 @@ class HelpersProvider(ServiceProvider):
     def register(self):
         pass
 
-    def boot(self, View, ViewClass, Request):
+    def boot(self, ViewClass):
         """ Add helper functions to Masonite """
-        builtins.view = View
-        builtins.request = Request.helper
-        builtins.auth = Request.user
-        builtins.container = self.app.helper
+        builtins.view = self.view
+        builtins.request = self.request
+        builtins.auth = self.auth
+        builtins.container = self.app.current
         builtins.env = os.getenv
-        builtins.resolve = self.app.resolve
-        builtins.route = Request.route
+        builtins.resolve = self.resolve
+        builtins.route = self.route
 
         ViewClass.share(
             {
-                'request': Request.helper,
-                'auth': Request.user,
+                'request': self.request,
+                'auth': self.auth,
                 'request_method': set_request_method,
-                'route': Request.route,
-                'back': back
+                'route': self.route,
+                'back': back,
+                'static': static,
             }
         )
+
+    def view(self, *args, **kwargs):
+        """Render a view with the container of the current request."""
+        return self.app.current().make('View')(*args, **kwargs)
+
+    def request(self):
+        """Get the request running in the current thread."""
+        return self.app.current().make('Request').helper()
+
+    def auth(self):
+        """Get the user of the request running in the current thread."""
+        return self.request().user()
+
+    def resolve(self, obj):
+        """Resolve an object with the container of the current request."""
+        return self.app.current().resolve(obj)
+
+    def route(self, name, params={}):
+        """Get the url of a named route from the current request."""
+        return self.request().route(name, params)
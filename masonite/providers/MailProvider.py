@@ -9,6 +9,9 @@ from masonite.provider import ServiceProvider
 class MailProvider(ServiceProvider):
 
     wsgi = False
+    deferred = True
+    provides = ['MailConfig', 'MailSmtpDriver', 'MailMailgunDriver', 'MailManager', 'Mail']
+    provides_classes = [MailSmtpDriver, MailMailgunDriver, MailManager]
 
     def register(self):
         self.app.bind('MailConfig', mail)
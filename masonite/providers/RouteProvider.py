@@ -1,155 +1,190 @@
 """ A RouteProvider Service Provider """
 
 import json
-import re
-from pydoc import locate
 
 from masonite.provider import ServiceProvider
+from masonite.routes import MiddlewareChain, RouteTable, locate_http_middleware
 from masonite.view import View
 
 
 class RouteProvider(ServiceProvider):
 
+    # The route table compiled from the last list of routes booted
+    _compiled_route_table = None
+
+    # The HTTP middleware located from the last HttpMiddleware binding
+    _http_middleware_chain = None
+
     def register(self):
         pass
 
     def boot(self, WebRoutes, Route, Request, Environ, Headers):
-        # All routes joined
-        for route in WebRoutes:
-            router = Route
-            request = Request
+        router = Route
+        request = Request
+
+        """
+        |--------------------------------------------------------------------------
+        | Houston, we've got a match
+        |--------------------------------------------------------------------------
+        |
+        | Look up the routes matching the request in the compiled route table. If
+        | a match is found, execute that route and break out of the loop. We only
+        | need one match. Routes are executed on a first come, first serve basis
+        |
+        """
+
+        table = self._route_table(WebRoutes)
+        method = Environ['REQUEST_METHOD']
+        matches = table.matches(method, router.url)
+
+        """
+        |--------------------------------------------------------------------------
+        | Answer HEAD And OPTIONS Requests
+        |--------------------------------------------------------------------------
+        |
+        | HEAD requests without a HEAD route are served by the GET route of the
+        | path without running the controller. OPTIONS requests without an
+        | OPTIONS route are answered with the methods the path allows. The
+        | HTTP middleware runs around the answer so it can add CORS headers.
+        |
+        """
+
+        if not matches and method == 'HEAD':
+            matches = table.matches('GET', router.url)
+
+        if not matches and method == 'OPTIONS':
+            allowed_methods = table.allowed_methods(router.url)
+            if allowed_methods:
+                middleware = self._http_middleware()
+                middleware.run('before', self.app)
+
+                if not request.redirect_url:
+                    Request.status('200 OK')
+                    Request.header('Allow', ', '.join(allowed_methods), http_prefix=None)
+                    self.app.bind('Response', '')
+
+                middleware.run('after', self.app)
+                return
+
+        for route, parameter_dict in matches:
+            # This is the dictionary of parameters given.
+            # This is the code used to
+            # convert /url/@firstname/@lastname to
+            # {'firstmane': 'joseph', 'lastname': 'mancuso'}
+            request.set_params(parameter_dict)
 
-            # Compiles the given route to regex
-            regex = router.compile_route_to_regex(route)
+            if request.has_subdomain():
+                # check if the subdomain matches the routes domain
+                if not route.has_required_domain(request):
+                    self.app.bind('Response', 'Route not found. Error 404')
+                    continue
 
             """
             |--------------------------------------------------------------------------
-            | Make a better match for trailing slashes
+            | Execute Before Middleware
             |--------------------------------------------------------------------------
             |
-            | Sometimes a user will end with a trailing slash. Because the user might
-            | create routes like `/url/route` and `/url/route/` and how the regex
-            | is compiled down, we may need to adjust for urls that end or dont
-            | end with a trailing slash.
+            | This is the HTTP middleware and then the route middleware that
+            | contains a before method. The middleware classes are located
+            | once per route and only resolved out of the container here.
             |
             """
 
-            if route.route_url.endswith('/'):
-                matchurl = re.compile(regex.replace(r'\/\/$', r'\/$'))
-            else:
-                matchurl = re.compile(regex.replace(r'\/$', r'$'))
-
-            # This will create a dictionary of parameters given.
-            # This is sort of a short
-            # but complex way to retrieve the url parameters.
-            # This is the code used to
-            # convert /url/@firstname/@lastname to
-            # {'firstmane': 'joseph', 'lastname': 'mancuso'}
-            try:
-                parameter_dict = {}
-                for index, value in enumerate(matchurl.match(router.url).groups()):
-                    parameter_dict[router.generated_url_list()[index]] = value
-                request.set_params(parameter_dict)
-            except AttributeError:
-                pass
+            middleware = route.middleware_chain(self.app)
+            middleware.run('before', self.app)
+
+            # Get the data from the route. This data is typically the
+            # output of the controller method
+            if not request.redirect_url and route.method_type != method:
+                # A HEAD request served by a GET route only needs the headers
+                Request.status('200 OK')
+                if not Request.header('Content-Type'):
+                    Request.header(
+                        'Content-Type', 'text/html; charset=utf-8', http_prefix=None)
+                self.app.bind('Response', '')
+
+            elif not request.redirect_url:
+                Request.status('200 OK')
+
+                # Resolve Controller Constructor
+                controller = self.app.resolve(route.controller)
+
+                # Resolve Controller Method
+                response = self.app.resolve(
+                    getattr(controller, route.controller_method))
+
+                if isinstance(response, View):
+                    response = response.rendered_template
+
+                self.app.bind(
+                    'Response',
+                    router.get(route.route, response)
+                )
+
+                # If the Content-Type was not set in the view or before this
+                if not Request.header('Content-Type'):
+                    if isinstance(response, dict):
+                        Request.header(
+                            'Content-Type', 'application/json; charset=utf-8', http_prefix=None)
+                        self.app.bind(
+                            'Response',
+                            str(json.dumps(response))
+                        )
+                    else:
+                        Request.header(
+                            'Content-Type', 'text/html; charset=utf-8', http_prefix=None)
 
             """
             |--------------------------------------------------------------------------
-            | Houston, we've got a match
+            | Execute After Middleware
             |--------------------------------------------------------------------------
             |
-            | Check to see if a route matches the corresponding router url. If a match
-            | is found, execute that route and break out of the loop. We only need
-            | one match. Routes are executed on a first come, first serve basis
+            | This is the route middleware and then the HTTP middleware
+            | with an after method.
             |
             """
 
-            if matchurl.match(router.url) and route.method_type == Environ['REQUEST_METHOD']:
-                route.load_request(request)
-                if request.has_subdomain():
-                    # check if the subdomain matches the routes domain
-                    if not route.has_required_domain():
-                        self.app.bind('Response', 'Route not found. Error 404')
-                        continue
-                """
-                |--------------------------------------------------------------------------
-                | Execute Before Middleware
-                |--------------------------------------------------------------------------
-                |
-                | This is middleware that contains a before method.
-                |
-                """
-
-                for http_middleware in self.app.make('HttpMiddleware'):
-                    located_middleware = self.app.resolve(
-                        locate(http_middleware)
-                    )
-                    if hasattr(located_middleware, 'before'):
-                        located_middleware.before()
-
-                # Show a helper in the terminal of which route has been visited
-                print(route.method_type + ' Route: ' + router.url)
-
-                # Loads the request in so the middleware
-                # specified is able to use the
-                # request object. This is before middleware and is ran
-                # before the request
-                route.run_middleware('before')
-
-                # Get the data from the route. This data is typically the
-                # output of the controller method
-                if not request.redirect_url:
-                    Request.status('200 OK')
-
-                    # Resolve Controller Constructor
-                    controller = self.app.resolve(route.controller)
-
-                    # Resolve Controller Method
-                    response = self.app.resolve(
-                        getattr(controller, route.controller_method))
-
-                    if isinstance(response, View):
-                        response = response.rendered_template
-
-                    self.app.bind(
-                        'Response',
-                        router.get(route.route, response)
-                    )
-
-                    # If the Content-Type was not set in the view or before this
-                    if not Request.header('Content-Type'):
-                        if isinstance(response, dict):
-                            Request.header(
-                                'Content-Type', 'application/json; charset=utf-8', http_prefix=None)
-                            self.app.bind(
-                                'Response',
-                                str(json.dumps(response))
-                            )
-                        else:
-                            Request.header(
-                                'Content-Type', 'text/html; charset=utf-8', http_prefix=None)
-
-                # Loads the request in so the middleware
-                # specified is able to use the
-                # request object. This is after middleware
-                # and is ran after the request
-                route.run_middleware('after')
-
-                """
-                |--------------------------------------------------------------------------
-                | Execute After Middleware
-                |--------------------------------------------------------------------------
-                |
-                | This is middleware with an after method.
-                |
-                """
-
-                for http_middleware in self.app.make('HttpMiddleware'):
-                    located_middleware = self.app.resolve(
-                        locate(http_middleware)
-                    )
-                    if hasattr(located_middleware, 'after'):
-                        located_middleware.after()
-                break
-            else:
+            middleware.run('after', self.app)
+            break
+        else:
+            if WebRoutes:
                 self.app.bind('Response', 'Route not found. Error 404')
+
+    def _route_table(self, routes):
+        """Get the compiled route table for a list of routes. Routes are only
+        compiled again when a different list of routes is booted.
+
+        Arguments:
+            routes {list} -- List of routes, typically the WebRoutes container binding.
+
+        Returns:
+            masonite.routes.RouteTable
+        """
+
+        table = RouteProvider._compiled_route_table
+        if table is None or not table.is_compiled_from(routes):
+            table = RouteTable(routes)
+            RouteProvider._compiled_route_table = table
+
+        return table
+
+    def _http_middleware(self):
+        """Get the chain of HTTP middleware to run around automatic responses. The
+        middleware is only located again when the HttpMiddleware binding changes.
+
+        Raises:
+            RouteMiddlewareNotFound -- Thrown when the middleware could not be found.
+
+        Returns:
+            masonite.routes.MiddlewareChain
+        """
+
+        http_middleware = self.app.make('HttpMiddleware')
+
+        chain = RouteProvider._http_middleware_chain
+        if chain is None or not chain.is_built_from(http_middleware, None, ()):
+            chain = MiddlewareChain(
+                locate_http_middleware(http_middleware), bindings=(http_middleware, None, ()))
+            RouteProvider._http_middleware_chain = chain
+
+        return chain
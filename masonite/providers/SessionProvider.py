@@ -15,6 +15,10 @@ class SessionProvider(ServiceProvider):
         self.app.bind('SessionManager', SessionManager(self.app))
 
     def boot(self, Environ, Request, ViewClass, SessionManager, SessionConfig):
+        if self.app.parent is not None:
+            # Create the driver from the request container it belongs to
+            SessionManager = SessionManager.__class__(self.app)
+
         self.app.bind('Session', SessionManager.driver(SessionConfig.DRIVER))
         Session = self.app.make('Session')
         Request.session = Session
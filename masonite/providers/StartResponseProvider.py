@@ -1,28 +1,63 @@
 """ A StartResponseProvider Service Provider """
 
+from config import application
+
 from masonite.exceptions import ResponseError
+from masonite.logger import AccessLogger
 from masonite.provider import ServiceProvider
+from masonite.view import ViewStream
 
 
 class StartResponseProvider(ServiceProvider):
 
     def register(self):
-        pass
+        """
+        |--------------------------------------------------------------------------
+        | Access Log
+        |--------------------------------------------------------------------------
+        |
+        | The ACCESS_LOG setting in config/application.py configures the record
+        | the WSGI application writes for every request once its response is
+        | final. The access log is off unless 'enabled' is set to True.
+        |
+        """
+
+        access_logger = AccessLogger.from_config(getattr(application, 'ACCESS_LOG', {'enabled': False}))
+        if access_logger:
+            self.app.bind('AccessLogger', access_logger)
 
     def boot(self, Request, Response, Headers):
         if not Request.redirect_url:
-            # Convert the data that is retrieved above to bytes
-            # so the wsgi server can handle it.
-            try:
-                data = bytes(Response, 'utf-8')
-            except TypeError:
-                raise ResponseError(
-                    'An acceptable response type was not returned')
+            if isinstance(Response, ViewStream):
+                # Streamed views are sent in chunks as they are rendered
+                data = None
+            elif isinstance(Response, bytes):
+                # Error pages are already encoded
+                data = Response
+            else:
+                # Convert the data that is retrieved above to bytes
+                # so the wsgi server can handle it.
+                try:
+                    data = bytes(Response, 'utf-8')
+                except TypeError:
+                    raise ResponseError(
+                        'An acceptable response type was not returned')
 
             self.app.bind('StatusCode', Request.get_status_code())
-            Headers += [
-                ("Content-Length", str(len(data)))
-            ] + Request.get_cookies() + Request.get_headers()
+
+            # HEAD responses report the length of the body without sending it.
+            # The length is not known for streams or when a GET route was
+            # answered without running its controller.
+            head = Request.get_request_method() == 'HEAD'
+            if data is not None and (data or not head):
+                Headers += [
+                    ("Content-Length", str(len(data)))
+                ]
+
+            Headers += Request.get_cookies() + Request.get_headers()
+
+            if head:
+                self.app.bind('Response', '')
         else:
             self.app.bind('StatusCode', "302 OK")
             self.app.bind('Headers', [
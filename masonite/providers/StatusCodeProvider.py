@@ -1,23 +1,98 @@
 """ A StatusProvider Service Provider """
 
+from masonite.helpers.boolean import to_bool
 from masonite.provider import ServiceProvider
 
 
+class StatusCodePages:
+    """Renders the pages shown for error status codes.
+
+    The page of a status code is rendered the first time the status code is
+    needed and kept as encoded bytes with its Content-Length, so serving it
+    again only copies the bytes. Error templates that show data of the request,
+    like the user or the csrf token, need dynamic pages, which are rendered
+    again for every request.
+    """
+
+    def __init__(self, dynamic=False):
+        """StatusCodePages constructor
+
+        Keyword Arguments:
+            dynamic {bool} -- Whether pages should be rendered for every request. (default: {False})
+        """
+
+        self.dynamic = dynamic
+        self.pages = {}
+
+    def render(self, app, status_code):
+        """Render the page of a status code.
+
+        Arguments:
+            app {masonite.app.App} -- The container to render the page with.
+            status_code {string} -- The status code (404 Not Found).
+
+        Returns:
+            tuple -- The encoded page and its Content-Length.
+        """
+
+        page = self.pages.get(status_code)
+        if page is not None:
+            return page
+
+        template, dictionary = self.template(app, status_code)
+        body = bytes(app.make('View')(template, dictionary).rendered_template, 'utf-8')
+        page = (body, str(len(body)))
+
+        if not self.dynamic:
+            self.pages[status_code] = page
+
+        return page
+
+    def template(self, app, status_code):
+        """Find the template of a status code.
+
+        Arguments:
+            app {masonite.app.App} -- The container to find the template with.
+            status_code {string} -- The status code (404 Not Found).
+
+        Returns:
+            tuple -- The template and the dictionary to render it with.
+        """
+
+        template = 'errors/{}'.format(status_code.split(' ')[0])
+        if app.make('ViewClass').exists(template):
+            return (template, {})
+
+        return ('/masonite/snippets/statuscode', {'code': status_code})
+
+
+def status_code_pages(app):
+    """Get the status code pages bound to the container.
+
+    Arguments:
+        app {masonite.app.App} -- The application container.
+
+    Returns:
+        masonite.providers.StatusCodeProvider.StatusCodePages
+    """
+
+    if app.has('StatusCodePages'):
+        return app.make('StatusCodePages')
+
+    return StatusCodePages(dynamic=True)
+
+
 class ServerErrorExceptionHook:
 
     def load(self, app):
-        if app.make('Application').DEBUG == 'True' or app.make('Application').DEBUG == True:
+        if to_bool(getattr(app.make('Application'), 'DEBUG', False)):
             return
 
         request = app.make('Request').status('500 Internal Server Error')
-        if app.make('ViewClass').exists('errors/500'):
-            rendered_view = app.make('View')('errors/500').rendered_template
-        else:
-            rendered_view = app.make('View')(
-                '/masonite/snippets/statuscode', {'code': '500 Internal Server Error'}).rendered_template
+        rendered_view, content_length = status_code_pages(app).render(app, '500 Internal Server Error')
 
         headers = [
-            ("Content-Length", str(len(rendered_view)))
+            ("Content-Length", content_length)
         ]
         app.bind('Headers', headers)
         app.bind('Response', rendered_view)
@@ -28,20 +103,31 @@ class StatusCodeProvider(ServiceProvider):
     def register(self):
         self.app.bind('ServiceErrorExceptionHook', ServerErrorExceptionHook())
 
+        """
+        |--------------------------------------------------------------------------
+        | Render Error Pages Once
+        |--------------------------------------------------------------------------
+        |
+        | An error page is rendered once and served from memory after that. Set
+        | DYNAMIC_ERROR_PAGES to True in config/application.py when the errors/
+        | templates show request data or may change while the application runs.
+        |
+        """
+
+        dynamic = False
+        if self.app.has('Application'):
+            dynamic = getattr(self.app.make('Application'), 'DYNAMIC_ERROR_PAGES', False)
+
+        self.app.bind('StatusCodePages', StatusCodePages(dynamic=dynamic))
+
     def boot(self, StatusCode, Request):
         if StatusCode == '200 OK':
             return
 
         if StatusCode in ('500 Internal Server Error', '404 Not Found'):
-            if self.app.make('ViewClass').exists('errors/{}'.format(StatusCode.split(' ')[0])):
-                rendered_view = self.app.make('View')(
-                    'errors/{}'.format(StatusCode.split(' ')[0])).rendered_template
-            else:
-                rendered_view = self.app.make('View')('/masonite/snippets/statuscode', {
-                    'code': StatusCode
-                }).rendered_template
+            rendered_view, content_length = status_code_pages(self.app).render(self.app, StatusCode)
             Headers = [
-                ("Content-Length", str(len(rendered_view)))
+                ("Content-Length", content_length)
             ]
             self.app.bind('Response', rendered_view)
 
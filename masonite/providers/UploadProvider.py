@@ -2,7 +2,6 @@
 
 from config import storage
 from masonite.drivers import UploadDiskDriver, UploadS3Driver
-from masonite.helpers.static import static
 from masonite.managers import UploadManager
 from masonite.provider import ServiceProvider
 
@@ -10,6 +9,9 @@ from masonite.provider import ServiceProvider
 class UploadProvider(ServiceProvider):
 
     wsgi = False
+    deferred = True
+    provides = ['StorageConfig', 'UploadDiskDriver', 'UploadS3Driver', 'UploadManager', 'Upload']
+    provides_classes = [UploadDiskDriver, UploadS3Driver, UploadManager]
 
     def register(self):
         self.app.bind('StorageConfig', storage)
@@ -17,10 +19,5 @@ class UploadProvider(ServiceProvider):
         self.app.bind('UploadS3Driver', UploadS3Driver)
         self.app.bind('UploadManager', UploadManager(self.app))
 
-    def boot(self, UploadManager, StorageConfig, ViewClass):
+    def boot(self, UploadManager, StorageConfig):
         self.app.bind('Upload', UploadManager.driver(StorageConfig.DRIVER))
-        ViewClass.share(
-            {
-                'static': static,
-            }
-        )
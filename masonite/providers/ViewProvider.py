@@ -1,5 +1,8 @@
 """ A View Service Provider """
 
+from config import application
+
+from masonite.helpers.boolean import to_bool
 from masonite.provider import ServiceProvider
 from masonite.view import View
 
@@ -10,6 +13,15 @@ class ViewProvider(ServiceProvider):
 
     def register(self):
         view = View(self.app)
+        config = self.app.make('Application') if self.app.has('Application') else application
+
+        # Only look for changed templates while debugging
+        view.auto_reload = to_bool(getattr(config, 'DEBUG', False))
+
+        # Keep compiled templates in bootstrap/cache for new processes
+        if getattr(config, 'VIEW_BYTECODE_CACHE', None):
+            view.cache_bytecode(config.VIEW_BYTECODE_CACHE)
+
         self.app.bind('ViewClass', view)
         self.app.bind('View', view.render)
 
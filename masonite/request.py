@@ -7,7 +7,10 @@ Methods may return another object if necessary to expand capabilities
 of this class.
 """
 
+import copy
+import inspect
 import re
+import types
 from http import cookies
 from urllib.parse import parse_qs
 
@@ -18,6 +21,7 @@ from masonite.auth.Sign import Sign
 from masonite.helpers.Extendable import Extendable
 from masonite.helpers.routes import compile_route_to_regex
 from masonite.helpers.time import cookie_expire_time
+from masonite.routes import RouteIndex, url_template
 
 
 class Request(Extendable):
@@ -29,6 +33,7 @@ class Request(Extendable):
         Extendable {masonite.helpers.Extendable.Extendable} -- Makes this class have the ability to extend another class at runtime.
     """
 
+    _compiled_route_index = None
 
     def __init__(self, environ=None):
         """Request class constructor. Initializes several properties and sets various methods 
@@ -519,8 +524,6 @@ class Request(Extendable):
             self
         """
 
-        web_routes = self.container.make('WebRoutes')
-
         self.redirect_url = self._get_named_route(route_name, params)
 
         return self
@@ -537,13 +540,12 @@ class Request(Extendable):
                            compiled URI.
         """
 
-        web_routes = self.container.make('WebRoutes')
+        template = self._route_index().named(name)
 
-        for route in web_routes:
-            if route.named_route == name:
-                return self.compile_route_to_url(route.route_url, params)
+        if template is None:
+            return None
 
-        return None
+        return template.format(params)
     
     def _get_route_from_controller(self, controller):
         """Get the route using the controller. 
@@ -558,8 +560,6 @@ class Request(Extendable):
             masonite.routes.Route|None -- Returns None if the route could not be found.
         """
 
-        web_routes = self.container.make('WebRoutes')
-
         if not isinstance(controller, str):
             module_location = controller.__module__
             controller = controller.__qualname__.split('.')
@@ -567,9 +567,24 @@ class Request(Extendable):
             module_location = 'app.http.controllers'
             controller = controller.split('@')
 
-        for route in web_routes:
-            if route.controller.__name__ == controller[0] and route.controller_method == controller[1] and route.module_location == module_location:
-                return route
+        return self._route_index().controller(module_location, controller[0], controller[1])
+
+    def _route_index(self):
+        """Get the index of the routes by name and by controller. The index is only
+        built again when a different list of routes is bound to the container.
+
+        Returns:
+            masonite.routes.RouteIndex
+        """
+
+        routes = self.container.make('WebRoutes')
+
+        index = Request._compiled_route_index
+        if index is None or not index.is_compiled_from(routes):
+            index = RouteIndex(routes)
+            Request._compiled_route_index = index
+
+        return index
 
     def url_from_controller(self, controller, params = {}):
         """Returns the compiled URI using a controller.
@@ -599,10 +614,34 @@ class Request(Extendable):
             masonite.routes.Route|None -- Returns None if the route cannot be found.
         """
 
-        web_routes = self.container.make('WebRoutes')
-
         return self._get_named_route(name, params)
 
+    def clone(self):
+        """Creates a copy of this request for a new request scope. Settings such as the
+        encryption key, subdomain activation and extended methods are kept while all of
+        the state of the current request is reset.
+
+        Returns:
+            masonite.request.Request -- The new request object.
+        """
+
+        request = copy.copy(self)
+
+        # Methods added with extend() are bound to this request
+        for key, value in list(request.__dict__.items()):
+            if inspect.ismethod(value) and value.__self__ is self:
+                setattr(request, key, types.MethodType(value.__func__, request))
+
+        request.cookies = []
+        request._headers = []
+        request.url_params = {}
+        request.redirect_url = False
+        request.redirect_route = False
+        request.user_model = None
+        request.subdomain = None
+        request._status = '404 Not Found'
+        return request
+
     def reset_redirections(self):
         """Resets the redirections because of this class acting like a singleton pattern.
         """
@@ -672,35 +711,7 @@ class Request(Extendable):
             string -- Returns a compiled string (/dashboard/joseph/1)
         """
 
-        if "http" in route:
-            return route
-
-        # Split the url into a list
-        split_url = route.split('/')
-
-        # Start beginning of the new compiled url
-        compiled_url = '/'
-
-        # Iterate over the list
-        for url in split_url:
-            if url:
-                # if the url contains a parameter variable like @id:int
-                if '@' in url:
-                    url = url.replace('@', '').replace(
-                        ':int', '').replace(':string', '')
-                    compiled_url += str(params[url]) + '/'
-                else:
-                    compiled_url += url + '/'
-
-        # The loop isn't perfect and may have an unwanted trailing slash
-        if compiled_url.endswith('/') and not route.endswith('/'):
-            compiled_url = compiled_url[:-1]
-
-        # The loop isn't perfect and may have 2 slashes next to eachother
-        if '//' in compiled_url:
-            compiled_url = compiled_url.replace('//', '/')
-
-        return compiled_url
+        return url_template(route).format(params)
     
     def activate_subdomains(self):
         """Activates subdomains abilities
@@ -2,14 +2,96 @@
 """
 
 import cgi
+import functools
 import importlib
 import json
+import os
+import re
+import uuid
 from pydoc import locate
 
 from config import middleware
 from masonite.exceptions import RouteMiddlewareNotFound, InvalidRouteCompileException
 
 
+class Converter:
+    """Converts a route parameter between the string in the URI and a Python value.
+    """
+
+    regex = r'([\w.-]+)'
+
+    def __init__(self, regex=None):
+        """Converter constructor
+
+        Keyword Arguments:
+            regex {string} -- The regex the parameter has to match. (default: {None})
+        """
+
+        if regex is not None:
+            self.regex = regex
+
+    def to_python(self, value):
+        """Converts the matched string into the value given to the controller.
+
+        Arguments:
+            value {string} -- The string matched in the URI.
+
+        Raises:
+            ValueError -- Thrown when the value can not be converted. The route will not match.
+
+        Returns:
+            object
+        """
+
+        return value
+
+    def to_url(self, value):
+        """Converts a value into the string used in a URI.
+
+        Arguments:
+            value {object} -- The value passed to the route parameter.
+
+        Returns:
+            string
+        """
+
+        return str(value)
+
+
+class IntConverter(Converter):
+    """Converts a route parameter into an integer.
+    """
+
+    regex = r'(\d+)'
+
+    def to_python(self, value):
+        return int(value)
+
+
+class UUIDConverter(Converter):
+    """Converts a route parameter into a uuid.UUID object.
+    """
+
+    regex = r'([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})'
+
+    def to_python(self, value):
+        return uuid.UUID(value)
+
+
+class SlugConverter(Converter):
+    """Matches a slug of letters, numbers, dashes and underscores.
+    """
+
+    regex = r'([-a-zA-Z0-9_]+)'
+
+
+class PathConverter(Converter):
+    """Matches the rest of the URI, including slashes.
+    """
+
+    regex = r'(.+)'
+
+
 class Route:
     """Route class used to handle routing.
     """
@@ -18,7 +100,20 @@ class Route:
         'int': r'(\d+)',
         'integer': r'(\d+)', 
         'string': r'([a-zA-Z]+)',
-        'default': r'([\w.-]+)'
+        'default': r'([\w.-]+)',
+        'uuid': UUIDConverter.regex,
+        'slug': SlugConverter.regex,
+        'path': PathConverter.regex,
+    }
+
+    route_converters = {
+        'int': IntConverter(),
+        'integer': IntConverter(),
+        'string': Converter(route_compilers['string']),
+        'default': Converter(),
+        'uuid': UUIDConverter(),
+        'slug': SlugConverter(),
+        'path': PathConverter(),
     }
 
     def __init__(self, environ=None):
@@ -152,10 +247,7 @@ class Route:
                 regex += r'\/'
 
                 # append the variable name passed @(variable):int to a list
-                url_list.append(
-                    regex_route.replace('@', '').replace(
-                        ':int', '').replace(':string', '')
-                )
+                url_list.append(self.parse_parameter(regex_route)[0])
             else:
                 regex += regex_route + r'\/'
 
@@ -167,6 +259,47 @@ class Route:
         self.route_compilers.update({key: to})
         return self
 
+    def converter(self, key, converter):
+        """Adds a route converter. Parameters like @id:key will match the regex of
+        the converter and reach the controller as the value returned by its to_python method.
+
+        Arguments:
+            key {string} -- The name used in routes (@id:key).
+            converter {masonite.routes.Converter} -- The converter to use.
+
+        Returns:
+            self
+        """
+
+        self.route_converters.update({key: converter})
+        self.route_compilers.update({key: converter.regex})
+
+        # Templates compiled before were built with the previous converter
+        url_template.cache_clear()
+        return self
+
+    @classmethod
+    def parse_parameter(cls, segment):
+        """Gets the name and the converter of a route parameter.
+
+        Arguments:
+            segment {string} -- A parameter segment of a route (@id:int).
+
+        Returns:
+            tuple -- The name of the parameter and its converter. The converter is None
+                     for compilers added with compile(), which also keep the compiler in the name.
+        """
+
+        name = segment.replace('@', '')
+        if ':' not in name:
+            return name, cls.route_converters['default']
+
+        key = name.split(':')[1]
+        if key in cls.route_converters:
+            return name.split(':')[0], cls.route_converters[key]
+
+        return name, None
+
     def generated_url_list(self):
         """Returns the URL list
 
@@ -253,6 +386,42 @@ class BaseHttpRoute:
         except Exception as e:
             print('\033[93mWarning in routes/web.py!', e, '\033[0m')
 
+    def __getattr__(self, attribute):
+        """Imports the controller of a route loaded from the route cache on first use.
+
+        Arguments:
+            attribute {string} -- The attribute that was not found on the route.
+
+        Raises:
+            AttributeError -- Thrown when the attribute is not a lazily imported controller.
+
+        Returns:
+            object
+        """
+
+        location = self.__dict__.get('controller_location')
+        if attribute != 'controller' or not location:
+            raise AttributeError(attribute)
+
+        module, controller = location.rsplit('.', 1)
+        self.controller = getattr(importlib.import_module(module), controller)
+        return self.controller
+
+    def get_controller_location(self):
+        """Gets the dotted path of the controller attached to the route.
+
+        Returns:
+            string|None -- The dotted path or None if the route has no controller.
+        """
+
+        if 'controller_location' in self.__dict__:
+            return self.controller_location
+
+        if 'controller' not in self.__dict__:
+            return None
+
+        return '{0}.{1}'.format(self.controller.__module__, self.controller.__name__)
+
     def domain(self, domain):
         """Sets the subdomain for the route.
 
@@ -279,14 +448,19 @@ class BaseHttpRoute:
         self.module_location = module
         return self
 
-    def has_required_domain(self):
+    def has_required_domain(self, request=None):
         """Check if the route has the required subdomain before executing the route.
 
+        Keyword Arguments:
+            request {masonite.request.Request} -- The request to check. Defaults to the loaded request. (default: {None})
+
         Returns:
             bool
         """
 
-        if self.request.has_subdomain() and (self.required_domain is '*' or self.request.subdomain == self.required_domain):
+        request = request or self.request
+
+        if request.has_subdomain() and (self.required_domain is '*' or request.subdomain == self.required_domain):
             return True
         return False
 
@@ -339,25 +513,155 @@ class BaseHttpRoute:
             RouteMiddlewareNotFound -- Thrown when the middleware could not be found.
         """
 
+        container = self.request.app()
+        MiddlewareChain(self._locate_middleware(container.make('RouteMiddleware'))).run(
+            type_of_middleware, container)
+
+    def middleware_chain(self, container):
+        """Get the chain of HTTP and route middleware to run for this route. The middleware
+        is only located again when the middleware bindings or the route middleware change.
+
+        Arguments:
+            container {masonite.app.App} -- The container with the HttpMiddleware and RouteMiddleware bindings.
+
+        Raises:
+            RouteMiddlewareNotFound -- Thrown when the middleware could not be found.
+
+        Returns:
+            masonite.routes.MiddlewareChain
+        """
+
+        http_middleware = container.make('HttpMiddleware')
+        route_middleware = container.make('RouteMiddleware') if self.list_middleware else None
+        bindings = (http_middleware, route_middleware, tuple(self.list_middleware))
+
+        chain = self.__dict__.get('_middleware_chain')
+        if chain is None or not chain.is_built_from(*bindings):
+            chain = MiddlewareChain(
+                locate_http_middleware(http_middleware),
+                self._locate_middleware(route_middleware),
+                bindings=bindings)
+            self._middleware_chain = chain
+
+        return chain
+
+    def _locate_middleware(self, route_middleware):
+        """Locate the classes of the route middleware attached to this route.
+
+        Arguments:
+            route_middleware {dict} -- Dictionary of route middleware, typically the RouteMiddleware container binding.
+
+        Raises:
+            RouteMiddlewareNotFound -- Thrown when the middleware could not be found.
+
+        Returns:
+            list -- List of middleware classes.
+        """
+
+        located = []
+
         # Get the list of middleware to run for a route.
         for arg in self.list_middleware:
-            middleware_to_run = self.request.app().make('RouteMiddleware')[arg]
+            try:
+                middleware_to_run = route_middleware[arg]
+            except (KeyError, TypeError):
+                raise RouteMiddlewareNotFound(
+                    "Could not find the '{0}' route middleware".format(arg))
+
             if isinstance(middleware_to_run, str):
                 middleware_to_run = [middleware_to_run]
 
             # Locate the middleware based on the string specified
-            try:
-                for middleware in middleware_to_run:
-                    located_middleware = self.request.app().resolve(locate(middleware))
+            for middleware in middleware_to_run:
+                located_middleware = locate(middleware)
+                if located_middleware is None:
+                    raise RouteMiddlewareNotFound(
+                        "Could not find the '{0}' route middleware".format(middleware))
 
-                    # If the middleware has the specific type of middleware
-                    # (before or after) then execute that
-                    if hasattr(located_middleware, type_of_middleware):
-                        getattr(located_middleware, type_of_middleware)()
+                located.append(located_middleware)
 
-            except KeyError:
-                raise RouteMiddlewareNotFound(
-                    "Could not find the '{0}' route middleware".format(arg))
+        return located
+
+
+def locate_http_middleware(http_middleware):
+    """Locate the classes of the HTTP middleware ran for every request.
+
+    Arguments:
+        http_middleware {list} -- List of middleware paths, typically the HttpMiddleware container binding.
+
+    Raises:
+        RouteMiddlewareNotFound -- Thrown when the middleware could not be found.
+
+    Returns:
+        list -- List of middleware classes.
+    """
+
+    located = []
+
+    for middleware in http_middleware:
+        located_middleware = locate(middleware)
+        if located_middleware is None:
+            raise RouteMiddlewareNotFound(
+                "Could not find the '{0}' HTTP middleware".format(middleware))
+
+        located.append(located_middleware)
+
+    return located
+
+
+class MiddlewareChain:
+    """Located middleware of a route, split into the middleware to run before and after the route.
+
+    Locating middleware walks the import machinery, so it happens once per route. Each request
+    then only resolves the middleware classes out of the container and calls them.
+    """
+
+    def __init__(self, http_middleware, route_middleware=[], bindings=(None, None, ())):
+        """MiddlewareChain constructor
+
+        Arguments:
+            http_middleware {list} -- List of middleware classes ran for every route.
+
+        Keyword Arguments:
+            route_middleware {list} -- List of middleware classes attached to the route. (default: {[]})
+            bindings {tuple} -- The HttpMiddleware and RouteMiddleware bindings and the route middleware
+                                names the chain was built from. (default: {(None, None, ())})
+        """
+
+        self.bindings = bindings
+        self.length = len(bindings[0] or [])
+
+        # HTTP middleware runs around the route middleware
+        self.before = [middleware for middleware in http_middleware + route_middleware
+                       if hasattr(middleware, 'before')]
+        self.after = [middleware for middleware in route_middleware + http_middleware
+                      if hasattr(middleware, 'after')]
+
+    def is_built_from(self, http_middleware, route_middleware, list_middleware):
+        """Check if this chain was built from the current middleware bindings.
+
+        Arguments:
+            http_middleware {list} -- The HttpMiddleware container binding.
+            route_middleware {dict|None} -- The RouteMiddleware container binding.
+            list_middleware {tuple} -- Names of the middleware attached to the route.
+
+        Returns:
+            bool
+        """
+
+        return self.bindings[0] is http_middleware and self.length == len(http_middleware) \
+            and self.bindings[1] is route_middleware and self.bindings[2] == list_middleware
+
+    def run(self, type_of_middleware, container):
+        """Resolve and run the middleware.
+
+        Arguments:
+            type_of_middleware {string} -- Type of middleware to be ran (before|after)
+            container {masonite.app.App} -- The container to resolve the middleware with.
+        """
+
+        for middleware in getattr(self, type_of_middleware):
+            getattr(container.resolve(middleware), type_of_middleware)()
 
 
 class Get(BaseHttpRoute):
@@ -494,3 +798,502 @@ class RouteGroup():
         for route in self.routes:
             if isinstance(route.named_route, str):
                 route.named_route = name + route.named_route
+
+
+class RouteTable:
+    """Compiled table of routes used to match a request to a route.
+
+    Every route is compiled once into a tree of URI segments per request method.
+    A request is then matched by walking the segments of its path instead of
+    compiling and matching every route in turn, so the cost of a match does not
+    grow with the amount of routes.
+    """
+
+    # Strings a segment regex should never match. Routes with a compiler
+    # matching any of these may span several segments and are matched
+    # against their full regex instead.
+    _segment_probes = ('/', 'a/b', '1/2')
+
+    # Static segments using any of these are matched as a regex
+    _regex_characters = '.^$*+?{}[]\\|()'
+
+    def __init__(self, routes):
+        """RouteTable constructor
+
+        Arguments:
+            routes {list} -- List of routes, typically the WebRoutes container binding.
+        """
+
+        self.routes = routes
+        self.length = len(routes)
+        self.methods = {}
+
+        compiler = Route()
+
+        for index, route in enumerate(routes):
+            table = self.methods.setdefault(
+                route.method_type, {'tree': self._node(), 'regex': []})
+
+            regex = compiler.compile_route_to_regex(route)
+            names = compiler.generated_url_list()
+            converters = self._compile_converters(route)
+            segments = self._compile_segments(route)
+
+            if segments is None:
+                # Make a better match for trailing slashes
+                if route.route_url.endswith('/'):
+                    regex = regex.replace(r'\/\/$', r'\/$')
+                else:
+                    regex = regex.replace(r'\/$', r'$')
+
+                table['regex'].append((index, route, re.compile(regex), names, converters))
+                continue
+
+            node = table['tree']
+            for segment in segments:
+                if isinstance(segment, str):
+                    node = node['static'].setdefault(segment, self._node())
+                else:
+                    node = node['dynamic'].setdefault(
+                        segment.pattern, (segment, self._node()))[1]
+
+            node['routes'].append((index, route, names, converters))
+
+    def is_compiled_from(self, routes):
+        """Check if this table was compiled from a list of routes.
+
+        Arguments:
+            routes {list} -- List of routes.
+
+        Returns:
+            bool
+        """
+
+        return self.routes is routes and self.length == len(routes)
+
+    def matches(self, method, url):
+        """Find the routes matching a request in the order they were defined.
+
+        Arguments:
+            method {string} -- The request method (GET, POST, etc).
+            url {string} -- The path of the request.
+
+        Returns:
+            list -- List of tuples of the route and a dictionary of its parameters.
+        """
+
+        table = self.methods.get(method)
+        if not table:
+            return []
+
+        found = []
+        self._walk(table['tree'], url.split('/'), 0, (), found)
+
+        for index, route, regex, names, converters in table['regex']:
+            match = regex.match(url)
+            if match:
+                found.append((index, route, names, converters, match.groups()))
+
+        if len(found) > 1:
+            found.sort(key=lambda match: match[0])
+
+        matches = []
+        for index, route, names, converters, values in found:
+            if converters:
+                # A value the converter rejects means the route does not match
+                try:
+                    values = [convert(value) if convert else value
+                              for convert, value in zip(converters, values)]
+                except ValueError:
+                    continue
+
+            matches.append((route, dict(zip(names, values))))
+
+        return matches
+
+    def allowed_methods(self, url):
+        """Get the request methods a path can be requested with. HEAD is allowed for
+        every path with a GET route and OPTIONS for every path with a route.
+
+        Arguments:
+            url {string} -- The path of the request.
+
+        Returns:
+            list -- Sorted list of request methods. Empty if no route matches the path.
+        """
+
+        allowed = set(method for method in self.methods if self.matches(method, url))
+
+        if not allowed:
+            return []
+
+        if 'GET' in allowed:
+            allowed.add('HEAD')
+
+        allowed.add('OPTIONS')
+        return sorted(allowed)
+
+    def _walk(self, node, segments, position, values, found):
+        """Walk the tree of segments and collect every route matching the path.
+
+        Arguments:
+            node {dict} -- The current node of the tree.
+            segments {list} -- The segments of the path.
+            position {int} -- Position of the segment to match against the node.
+            values {tuple} -- Values of the parameters matched so far.
+            found {list} -- List the matching routes are appended to.
+        """
+
+        if position == len(segments):
+            for index, route, names, converters in node['routes']:
+                found.append((index, route, names, converters, values))
+            return
+
+        segment = segments[position]
+
+        if segment in node['static']:
+            self._walk(node['static'][segment], segments, position + 1, values, found)
+
+        for regex, child in node['dynamic'].values():
+            match = regex.fullmatch(segment)
+            if match:
+                self._walk(child, segments, position + 1, values + match.groups(), found)
+
+    def _compile_converters(self, route):
+        """Get the to_python methods of the converters of the route parameters.
+
+        Arguments:
+            route {masonite.routes.BaseHttpRoute} -- The route to compile.
+
+        Returns:
+            tuple|None -- None if no parameter of the route has to be converted.
+        """
+
+        converters = []
+
+        for segment in route.route_url.split('/'):
+            if '@' in segment:
+                converter = Route.parse_parameter(segment)[1]
+
+                # Plain converters return the matched string as it is
+                if converter is None or type(converter).to_python is Converter.to_python:
+                    converters.append(None)
+                else:
+                    converters.append(converter.to_python)
+
+        if any(converters):
+            return tuple(converters)
+
+        return None
+
+    def _compile_segments(self, route):
+        """Compile the URI of a route into a list of segments. Static segments
+        stay strings and everything else becomes a compiled regex.
+
+        Arguments:
+            route {masonite.routes.BaseHttpRoute} -- The route to compile.
+
+        Returns:
+            list|None -- None if the route can not be split into segments.
+        """
+
+        segments = []
+
+        for segment in route.route_url.split('/'):
+            if '@' in segment:
+                if ':' in segment:
+                    pattern = Route.route_compilers[segment.split(':')[1]]
+                else:
+                    pattern = Route.route_compilers['default']
+            elif any(character in segment for character in self._regex_characters):
+                pattern = segment
+            else:
+                segments.append(segment)
+                continue
+
+            regex = re.compile(pattern)
+            if any(regex.fullmatch(probe) for probe in self._segment_probes):
+                return None
+
+            segments.append(regex)
+
+        return segments
+
+    def _node(self):
+        """Create a node of the segment tree.
+
+        Returns:
+            dict
+        """
+
+        return {'static': {}, 'dynamic': {}, 'routes': []}
+
+
+class UrlTemplate:
+    """URI of a route compiled ahead of time to quickly generate URIs from parameters.
+
+    Converts /url/@id into /url/1 the same way Request.compile_route_to_url always has,
+    without splitting the route every time a URI is generated.
+    """
+
+    def __init__(self, route):
+        """UrlTemplate constructor
+
+        Arguments:
+            route {string} -- An uncompiled route (/dashboard/@user:string/@id:int)
+        """
+
+        self.route = route
+        self.parts = []
+
+        if "http" in route:
+            self.tail = route
+            return
+
+        static = '/'
+        for url in route.split('/'):
+            if not url:
+                continue
+
+            if '@' in url:
+                name, converter = Route.parse_parameter(url)
+                self.parts.append((static, name, converter.to_url if converter else str))
+                static = '/'
+            else:
+                static += url + '/'
+
+        # Only keep the trailing slash when the route has one
+        if not route.endswith('/'):
+            static = static[:-1]
+
+        self.tail = static
+
+    def format(self, params={}):
+        """Compile the template into a URI.
+
+        Keyword Arguments:
+            params {dict} -- Dictionary of parameters to pass to the route (default: {{}})
+
+        Returns:
+            string -- Returns a compiled string (/dashboard/joseph/1)
+        """
+
+        if not self.parts:
+            return self.tail
+
+        compiled_url = ''.join([static + to_url(params[parameter])
+                                for static, parameter, to_url in self.parts]) + self.tail
+
+        if '//' in compiled_url:
+            compiled_url = compiled_url.replace('//', '/')
+
+        return compiled_url
+
+
+@functools.lru_cache(maxsize=512)
+def url_template(route):
+    """Get the compiled template of a route URI. Templates of the most recently
+    used URIs are kept so they are only compiled once.
+
+    Arguments:
+        route {string} -- An uncompiled route (/dashboard/@user:string/@id:int)
+
+    Returns:
+        masonite.routes.UrlTemplate
+    """
+
+    return UrlTemplate(route)
+
+
+class RouteIndex:
+    """Index of routes by name and by controller used to generate URIs.
+
+    Looking up a route by its name or its controller no longer scans every route.
+    When several routes share a name or a controller the first defined route is used.
+    Controllers of routes loaded from the route cache are not imported to build the index.
+    """
+
+    def __init__(self, routes):
+        """RouteIndex constructor
+
+        Arguments:
+            routes {list} -- List of routes, typically the WebRoutes container binding.
+        """
+
+        self.routes = routes
+        self.length = len(routes)
+        self.names = {}
+        self.controllers = {}
+
+        for route in routes:
+            if route.named_route is not None and route.named_route not in self.names:
+                self.names[route.named_route] = url_template(route.route_url)
+
+            location = route.get_controller_location()
+            if location:
+                key = (route.module_location, location.split('.')[-1], route.controller_method)
+                self.controllers.setdefault(key, route)
+
+    def is_compiled_from(self, routes):
+        """Check if this index was built from a list of routes.
+
+        Arguments:
+            routes {list} -- List of routes.
+
+        Returns:
+            bool
+        """
+
+        return self.routes is routes and self.length == len(routes)
+
+    def named(self, name):
+        """Get the URI template of a named route.
+
+        Arguments:
+            name {string} -- Name of the route (dashboard.user).
+
+        Returns:
+            masonite.routes.UrlTemplate|None -- Returns None if there is no route with the name.
+        """
+
+        return self.names.get(name)
+
+    def controller(self, module_location, controller, method):
+        """Get the route attached to a controller method.
+
+        Arguments:
+            module_location {string} -- The module the route looked for the controller in.
+            controller {string} -- Name of the controller class.
+            method {string} -- Name of the controller method.
+
+        Returns:
+            masonite.routes.BaseHttpRoute|None -- Returns None if no route uses the controller.
+        """
+
+        return self.controllers.get((module_location, controller, method))
+
+
+class RouteCache:
+    """Reads and writes the flattened routes of the application to a cache file.
+
+    Loading routes from the cache does not evaluate routes/web.py. The controllers
+    of the cached routes are only imported the first time a route is dispatched.
+    """
+
+    # Route classes of cache files that do not store the class of every route
+    methods = {
+        'GET': Get,
+        'POST': Post,
+        'PUT': Put,
+        'PATCH': Patch,
+        'DELETE': Delete,
+    }
+
+    def __init__(self, path='bootstrap/cache/routes.json'):
+        """RouteCache constructor
+
+        Keyword Arguments:
+            path {string} -- The location of the route cache file. (default: {'bootstrap/cache/routes.json'})
+        """
+
+        self.path = path
+
+    def exists(self):
+        """Check if the routes have been cached.
+
+        Returns:
+            bool
+        """
+
+        return os.path.isfile(self.path)
+
+    def write(self, routes):
+        """Serializes the routes to the cache file.
+
+        Arguments:
+            routes {list} -- List of flattened routes, typically the WebRoutes container binding.
+
+        Returns:
+            list -- The serialized routes.
+        """
+
+        serialized = []
+        router = Route()
+
+        for route in routes:
+            router.compile_route_to_regex(route)
+            serialized.append({
+                'class': '{0}.{1}'.format(route.__class__.__module__, route.__class__.__name__),
+                'method': route.method_type,
+                'url': route.route_url,
+                'parameters': router.generated_url_list(),
+                'name': route.named_route,
+                'domain': route.required_domain,
+                'middleware': route.list_middleware,
+                'module': route.module_location,
+                'controller': route.get_controller_location(),
+                'controller_method': getattr(route, 'controller_method', None),
+            })
+
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with open(self.path, 'w') as cache:
+            json.dump(serialized, cache, indent=4)
+
+        return serialized
+
+    def load(self):
+        """Creates the routes stored in the cache file.
+
+        Raises:
+            InvalidRouteCompileException -- Thrown when the class of a cached route cannot be found.
+
+        Returns:
+            list -- List of routes.
+        """
+
+        with open(self.path) as cache:
+            serialized = json.load(cache)
+
+        routes = []
+        for data in serialized:
+            if 'class' in data:
+                route_class = locate(data['class'])
+            else:
+                route_class = self.methods.get(data['method'])
+
+            if route_class is None:
+                raise InvalidRouteCompileException(
+                    'Could not find the route class of the cached route {0}. Run "craft route:cache" again.'.format(
+                        data['url']))
+
+            route = route_class()
+            route.method_type = data['method']
+            route.route_url = data['url']
+            route.named_route = data['name']
+            route.required_domain = data['domain']
+            route.list_middleware = data['middleware']
+            route.module_location = data['module']
+
+            if data['controller']:
+                route.controller_location = data['controller']
+                route.controller_method = data['controller_method']
+
+            routes.append(route)
+
+        return routes
+
+    def clear(self):
+        """Removes the cache file.
+
+        Returns:
+            bool -- Whether there was a cache file to remove.
+        """
+
+        if self.exists():
+            os.remove(self.path)
+            return True
+
+        return False
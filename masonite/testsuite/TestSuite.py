@@ -1,6 +1,7 @@
 from masonite.app import App
 from masonite.testsuite.TestRoute import TestRoute
 from masonite.testsuite.TestRequest import TestRequest
+from masonite.wsgi import WSGIApplication
 from config import application, providers
 from pydoc import locate
 
@@ -56,16 +57,9 @@ class TestSuite:
         |
         """
 
-        for provider in container.make('Providers').PROVIDERS:
-            provider().load_app(container).register()
+        wsgi_application = WSGIApplication.from_providers(container, container.make('Providers').PROVIDERS)
 
-        for provider in container.make('Providers').PROVIDERS:
-            located_provider = provider().load_app(container)
-
-            if located_provider.wsgi is False:
-                container.resolve(located_provider.boot)
-
-            """
+        """
         |--------------------------------------------------------------------------
         | Startup the Service Container
         |--------------------------------------------------------------------------
@@ -87,11 +81,9 @@ class TestSuite:
         |
         """
 
-        for provider in container.make('Providers').PROVIDERS:
-            located_provider = provider().load_app(container)
+        for boot in wsgi_application.pipeline:
             container.bind('Response', 'test')
-            if located_provider.wsgi is True:
-                container.resolve(located_provider.boot)
+            container.resolve(boot)
 
         self.container = container
         return self
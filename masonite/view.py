@@ -1,11 +1,13 @@
 """ View Module """
 
+import os
 
-from jinja2 import (ChoiceLoader, Environment, FileSystemLoader, PackageLoader,
-                    select_autoescape)
-from jinja2.exceptions import TemplateNotFound
+from jinja2 import (ChoiceLoader, Environment, FileSystemBytecodeCache,
+                    FileSystemLoader, PackageLoader, select_autoescape)
+from jinja2.exceptions import TemplateError, TemplateNotFound
 
 from masonite.exceptions import RequiredContainerBindingNotFound
+from masonite.fragment_cache import FragmentCacheExtension, FragmentCacheStats
 
 
 def view(template='index', dictionary={}):
@@ -46,6 +48,17 @@ class View:
         self.environments = []
         self._filters = {}
 
+        # Jinja environments keyed by template root
+        self._environment_cache = {}
+        self.bytecode_cache = None
+
+        # Hits and misses of the {% cache %} tag in every environment
+        self.fragment_cache_stats = FragmentCacheStats()
+
+        # Whether templates may change while the application runs
+        self.auto_reload = True
+        self._exists_cache = {}
+
     def render(self, template, dictionary={}):
         """Get the string contents of the view.
 
@@ -76,6 +89,35 @@ class View:
 
         return self
 
+    def stream(self, template, dictionary={}, chunk_size=8192):
+        """Render the view in chunks instead of as one string. The rendered template
+        is an iterator of encoded chunks which the server sends as they are rendered.
+        Streamed views are not cached with cache_for.
+
+        Arguments:
+            template {string} -- Name of the template you want to render.
+
+        Keyword Arguments:
+            dictionary {dict} -- Data that you want to pass into your view. (default: {{}})
+            chunk_size {int} -- Amount of characters rendered before a chunk is sent. (default: {8192})
+
+        Returns:
+            self
+        """
+
+        self.__load_environment(template)
+
+        self.dictionary.update(dictionary)
+
+        if self.composers:
+            self._update_from_composers()
+
+        # The template renders lazily so it gets a copy of the current data
+        self.rendered_template = ViewStream(
+            self.env.get_template(self.filename).generate(dict(self.dictionary)), chunk_size)
+
+        return self
+
     def _update_from_composers(self):
         """Adds data into the view from specified composers.
         """
@@ -177,13 +219,22 @@ class View:
             bool
         """
 
+        if template in self._exists_cache:
+            return self._exists_cache[template]
+
         self.__load_environment(template)
 
         try:
             self.env.get_template(self.filename)
-            return True
+            exists = True
         except TemplateNotFound as e:
-            return False
+            exists = False
+
+        # Templates can only appear or disappear when they are reloaded
+        if not self.auto_reload:
+            self._exists_cache[template] = exists
+
+        return exists
 
     def add_environment(self, template_location, loader=PackageLoader):
         """Add an environment to the templates.
@@ -205,6 +256,64 @@ class View:
             self.environments.append(
                 loader(template_location))
 
+        # Every environment has to be built again with the new loader
+        self._environment_cache.clear()
+        self._exists_cache.clear()
+
+    def cache_bytecode(self, directory='bootstrap/cache/templates'):
+        """Store the compiled templates in a directory so they are not compiled
+        again when a new process renders them.
+
+        Keyword Arguments:
+            directory {string} -- Directory to store the compiled templates in. (default: {'bootstrap/cache/templates'})
+
+        Returns:
+            self
+        """
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        self.bytecode_cache = FileSystemBytecodeCache(directory)
+
+        # Every environment has to be built again with the bytecode cache
+        self._environment_cache.clear()
+        self._exists_cache.clear()
+        return self
+
+    def compile_templates(self, roots=[]):
+        """Compile every template ahead of time. Templates are only written
+        to the bytecode cache when one is set with cache_bytecode().
+
+        Keyword Arguments:
+            roots {list} -- Additional template roots to compile such as masonite/snippets. (default: {[]})
+
+        Returns:
+            tuple -- The names of the compiled templates and a dictionary of the templates
+                     that could not be compiled with their errors.
+        """
+
+        roots = [('resources', 'templates')] + list(self._environment_cache) + [
+            (root.split('/')[0], '/'.join(root.split('/')[1:])) for root in roots]
+
+        compiled = []
+        failed = {}
+        for root in dict.fromkeys(roots):
+            env = self._environment_cache.get(root)
+            if env is None:
+                env = self._create_environment(root)
+                self._environment_cache[root] = env
+
+            for template in env.list_templates(extensions=['html']):
+                # Templates may use filters that are only added at runtime
+                try:
+                    env.get_template(template)
+                    compiled.append(template)
+                except TemplateError as e:
+                    failed[template] = e
+
+        return compiled, failed
+
     def filter(self, name, function):
         """Used to add filters to views.
 
@@ -215,6 +324,9 @@ class View:
 
         self._filters.update({name: function})
 
+        for env in self._environment_cache.values():
+            env.filters.update({name: function})
+
     def __load_environment(self, template):
         """Private method for loading all the environments.
 
@@ -230,26 +342,40 @@ class View:
             location = list(filter(None, template.split('/')))
             self.filename = location[-1] + '.html'
 
-            loader = PackageLoader(location[0], '/'.join(location[1:-1]))
-
-            self.env = Environment(
-                loader=ChoiceLoader(
-                    [loader] + self.environments
-                ),
-                autoescape=select_autoescape(['html', 'xml']),
-                extensions=['jinja2.ext.loopcontrols']
-            )
+            root = (location[0], '/'.join(location[1:-1]))
         else:
-            self.env = Environment(
-                loader=ChoiceLoader(
-                    [PackageLoader('resources', 'templates')] +
-                    self.environments
-                ),
-                autoescape=select_autoescape(['html', 'xml']),
-                extensions=['jinja2.ext.loopcontrols']
-            )
+            root = ('resources', 'templates')
+
+        self.env = self._environment_cache.get(root)
+        if self.env is None:
+            self.env = self._create_environment(root)
+            self._environment_cache[root] = self.env
+
+    def _create_environment(self, root):
+        """Create the Jinja environment for a template root. Environments are reused
+        for every template in the same root so Jinja only compiles a template once.
+
+        Arguments:
+            root {tuple} -- The package and directory of the templates.
+
+        Returns:
+            jinja2.Environment
+        """
+
+        env = Environment(
+            loader=ChoiceLoader(
+                [PackageLoader(*root)] + self.environments
+            ),
+            autoescape=select_autoescape(['html', 'xml']),
+            extensions=['jinja2.ext.loopcontrols', FragmentCacheExtension],
+            bytecode_cache=self.bytecode_cache,
+            auto_reload=self.auto_reload
+        )
 
-        self.env.filters.update(self._filters)
+        env.filters.update(self._filters)
+        env.fragment_cache_container = self.container
+        env.fragment_cache_stats = self.fragment_cache_stats
+        return env
 
     def __create_cache_template(self, template):
         """Save in the cache the template.
@@ -298,3 +424,43 @@ class View:
         driver_cache = self.container.make('Cache')
         self.rendered_template = driver_cache.get(self.template)
         return self
+
+
+class ViewStream:
+    """Iterator of the encoded chunks of a streamed view.
+    """
+
+    def __init__(self, events, chunk_size=8192):
+        """ViewStream constructor
+
+        Arguments:
+            events {iterator} -- The strings rendered by the Jinja template.
+
+        Keyword Arguments:
+            chunk_size {int} -- Amount of characters rendered before a chunk is returned. (default: {8192})
+        """
+
+        self.events = events
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        buffer = []
+        size = 0
+
+        for event in self.events:
+            buffer.append(event)
+            size += len(event)
+
+            if size >= self.chunk_size:
+                yield ''.join(buffer).encode('utf-8')
+                buffer = []
+                size = 0
+
+        if buffer:
+            yield ''.join(buffer).encode('utf-8')
+
+    def close(self):
+        """Stop rendering the template. Called by the server when the client goes away.
+        """
+
+        self.events.close()
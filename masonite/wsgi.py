@@ -0,0 +1,169 @@
+"""Module for the WSGI application callable.
+"""
+
+import time
+
+from masonite.view import ViewStream
+
+
+class WSGIApplication:
+    """WSGI application that runs the boot methods of the service providers on every request.
+
+    The providers that need to boot on every request are found, instantiated and
+    have their resolution plans compiled a single time when this class is created.
+    Each request then only replays that list of boot methods.
+
+    A scoped application runs every request in its own child container so
+    requests can be served from several threads at once. The helpers such as
+    request() and auth() always look up the container of their own request.
+    """
+
+    def __init__(self, container, providers, scoped=False):
+        """WSGIApplication constructor. Use from_providers() to register and boot
+        the providers as well.
+
+        Arguments:
+            container {masonite.app.App} -- The application container with all providers registered.
+            providers {list} -- List of service provider classes, typically config.providers.PROVIDERS
+
+        Keyword Arguments:
+            scoped {bool} -- Whether every request runs in its own child container. (default: {False})
+        """
+
+        self.container = container
+        self.scoped = scoped
+        self.providers = []
+        self.pipeline = []
+
+        for provider in providers:
+            if provider.wsgi is True and not provider.deferred:
+                located_provider = provider().load_app(container)
+
+                # Compile the resolution plan now so no request pays for it
+                container._resolution_plan(located_provider.boot)
+
+                self.providers.append(provider)
+                self.pipeline.append(located_provider.boot)
+
+    @classmethod
+    def from_providers(cls, container, providers, scoped=False):
+        """Register every service provider into the container, boot the providers
+        that only boot once and create the application for the others.
+
+        Deferred providers are not registered. They are loaded the first time one
+        of the keys or classes they provide is needed.
+
+        Arguments:
+            container {masonite.app.App} -- The application container.
+            providers {list} -- List of service provider classes, typically config.providers.PROVIDERS
+
+        Keyword Arguments:
+            scoped {bool} -- Whether every request runs in its own child container. (default: {False})
+
+        Returns:
+            masonite.wsgi.WSGIApplication
+        """
+
+        for provider in providers:
+            if provider.deferred:
+                container.defer(provider())
+            else:
+                provider().load_app(container).register()
+
+        for provider in providers:
+            if provider.wsgi is False and not provider.deferred:
+                container.resolve(provider().load_app(container).boot)
+
+        return cls(container, providers, scoped=scoped)
+
+    def __call__(self, environ, start_response):
+        """Handle a single request.
+
+        Arguments:
+            environ {dict} -- The WSGI environ
+            start_response {callable} -- The WSGI start_response callable
+
+        Returns:
+            iterator -- The response body
+        """
+
+        started_at = time.perf_counter()
+
+        if not self.scoped:
+            return self._respond(self.container, self.pipeline, environ, start_response, started_at)
+
+        container = self.container.child()
+        try:
+            pipeline = [provider().load_app(container).boot for provider in self.providers]
+            body = self._respond(container, pipeline, environ, start_response, started_at)
+        except BaseException:
+            self.container.release(container)
+            raise
+
+        # Streamed views still render with the request container while they are sent
+        if isinstance(body, ViewStream):
+            return self._release_after(body, container)
+
+        self.container.release(container)
+        return body
+
+    def _respond(self, container, pipeline, environ, start_response, started_at):
+        """Run the boot methods of the providers and start the response.
+
+        Arguments:
+            container {masonite.app.App} -- The container the request runs in.
+            pipeline {list} -- The boot methods to run.
+            environ {dict} -- The WSGI environ
+            start_response {callable} -- The WSGI start_response callable
+            started_at {float} -- The performance counter when the request came in.
+
+        Returns:
+            iterator -- The response body
+        """
+
+        container.bind('Environ', environ)
+
+        try:
+            for boot in pipeline:
+                container.resolve(boot)
+        except Exception as e:
+            container.make('ExceptionHandler').load_exception(e)
+
+        start_response(container.make('StatusCode'), container.make('Headers'))
+
+        response = container.make('Response')
+
+        # Streamed views are already an iterator of encoded chunks
+        if isinstance(response, ViewStream):
+            body, size = response, '-'
+        else:
+            data = response if isinstance(response, bytes) else bytes(response, 'utf-8')
+            body, size = iter([data]), len(data)
+
+        if container.has('AccessLogger'):
+            container.make('AccessLogger').log(
+                environ['REQUEST_METHOD'],
+                environ['PATH_INFO'],
+                container.make('StatusCode'),
+                (time.perf_counter() - started_at) * 1000,
+                size,
+            )
+
+        return body
+
+    def _release_after(self, body, container):
+        """Send a streamed body and release the request container once it is sent or closed.
+
+        Arguments:
+            body {masonite.view.ViewStream} -- The streamed body.
+            container {masonite.app.App} -- The container the request ran in.
+
+        Returns:
+            generator -- The chunks of the body.
+        """
+
+        try:
+            for chunk in body:
+                yield chunk
+        finally:
+            self.container.release(container)
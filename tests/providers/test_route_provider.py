@@ -3,10 +3,12 @@ from masonite.routes import Route
 from masonite.request import Request
 from masonite.providers.RouteProvider import RouteProvider
 from masonite.view import View
-from masonite.helpers.routes import get
+from masonite.helpers.routes import get, post
 from masonite.testsuite.TestSuite import generate_wsgi
 from app.http.controllers.ControllerTest import ControllerTest
 from config import middleware
+from masonite.exceptions import RouteMiddlewareNotFound
+import pytest
 
 
 class TestRouteProvider:
@@ -39,6 +41,23 @@ class TestRouteProvider:
 
         assert self.app.make('Response') == 'test'
 
+    def test_provider_matches_route_with_request_method(self):
+        self.app.make('Route').url = '/view'
+        self.app.bind('WebRoutes', [
+            post('/view', ControllerTest.returns_a_dict),
+            get('/view', ControllerTest.test),
+        ])
+
+        self.provider.boot(
+            self.app.make('WebRoutes'),
+            self.app.make('Route'),
+            self.app.make('Request'),
+            self.app.make('Environ'),
+            self.app.make('Headers'),
+        )
+
+        assert self.app.make('Response') == 'test'
+
     def test_controller_does_not_return_with_non_matching_end_slash(self):
         self.app.make('Route').url = '/view'
         self.app.bind('WebRoutes', [get('/view/', ControllerTest.returns_a_view)])
@@ -181,8 +200,128 @@ class TestRouteProvider:
         assert self.app.make('Request').path == 'test/middleware/before/ran'
         assert self.app.make('Request').attribute == True
 
+    def test_head_request_served_by_get_route_without_controller(self):
+        self.app.make('Environ')['REQUEST_METHOD'] = 'HEAD'
+        self.app.make('Route').url = '/view'
+        self.app.bind('WebRoutes', [get('/view', ControllerTest.test)])
+
+        self.provider.boot(
+            self.app.make('WebRoutes'),
+            self.app.make('Route'),
+            self.app.make('Request'),
+            self.app.make('Environ'),
+            self.app.make('Headers'),
+        )
+
+        assert self.app.make('Response') == ''
+        assert self.app.make('Request').get_status_code() == '200 OK'
+        assert self.app.make('Request').header('Content-Type') == 'text/html; charset=utf-8'
+
+    def test_options_request_answered_with_allowed_methods(self):
+        self.app.make('Environ')['REQUEST_METHOD'] = 'OPTIONS'
+        self.app.make('Route').url = '/view'
+        self.app.bind('WebRoutes', [
+            get('/view', ControllerTest.test),
+            post('/view', ControllerTest.test),
+            post('/other', ControllerTest.test),
+        ])
+
+        self.provider.boot(
+            self.app.make('WebRoutes'),
+            self.app.make('Route'),
+            self.app.make('Request'),
+            self.app.make('Environ'),
+            self.app.make('Headers'),
+        )
+
+        assert self.app.make('Response') == ''
+        assert self.app.make('Request').get_status_code() == '200 OK'
+        assert ('Allow', 'GET, HEAD, OPTIONS, POST') in self.app.make('Request').get_headers()
+
+    def test_options_request_runs_http_middleware(self):
+        self.app.make('Environ')['REQUEST_METHOD'] = 'OPTIONS'
+        self.app.make('Route').url = '/view'
+        self.app.bind('HttpMiddleware', ['tests.providers.test_route_provider.CorsMiddleware'])
+        self.app.bind('WebRoutes', [get('/view', ControllerTest.test)])
+
+        self.provider.boot(
+            self.app.make('WebRoutes'),
+            self.app.make('Route'),
+            self.app.make('Request'),
+            self.app.make('Environ'),
+            self.app.make('Headers'),
+        )
+
+        assert ('Allow', 'GET, HEAD, OPTIONS') in self.app.make('Request').get_headers()
+        assert ('Access-Control-Allow-Origin', '*') in self.app.make('Request').get_headers()
+
+    def test_options_request_for_unknown_path_is_not_found(self):
+        self.app.make('Environ')['REQUEST_METHOD'] = 'OPTIONS'
+        self.app.make('Route').url = '/unknown'
+        self.app.bind('WebRoutes', [get('/view', ControllerTest.test)])
+
+        self.provider.boot(
+            self.app.make('WebRoutes'),
+            self.app.make('Route'),
+            self.app.make('Request'),
+            self.app.make('Environ'),
+            self.app.make('Headers'),
+        )
+
+        assert self.app.make('Response') == 'Route not found. Error 404'
+
+    def test_route_locates_middleware_once(self):
+        self.app.make('Route').url = '/view'
+        self.app.bind('HttpMiddleware', ['app.http.middleware.AddAttributeMiddleware.AddAttributeMiddleware'])
+        self.app.bind('RouteMiddleware', middleware.ROUTE_MIDDLEWARE)
+        route = get('/view', ControllerTest.returns_a_dict).middleware('test')
+        self.app.bind('WebRoutes', [route])
+
+        chain = route.middleware_chain(self.app)
+        assert len(chain.before) == 2
+        assert route.middleware_chain(self.app) is chain
+
+        self.provider.boot(
+            self.app.make('WebRoutes'),
+            self.app.make('Route'),
+            self.app.make('Request'),
+            self.app.make('Environ'),
+            self.app.make('Headers'),
+        )
+
+        assert route.middleware_chain(self.app) is chain
+        assert self.app.make('Request').path == 'test/middleware/before/ran'
+        assert self.app.make('Request').attribute == True
+
+        self.app.bind('HttpMiddleware', [])
+        assert route.middleware_chain(self.app) is not chain
+
+    def test_route_raises_exception_for_missing_middleware(self):
+        self.app.bind('RouteMiddleware', middleware.ROUTE_MIDDLEWARE)
+        route = get('/view', ControllerTest.returns_a_dict).middleware('missing')
+
+        with pytest.raises(RouteMiddlewareNotFound):
+            route.middleware_chain(self.app)
+
+    def test_route_raises_exception_for_missing_http_middleware(self):
+        self.app.bind('HttpMiddleware', ['app.http.middleware.CsrfMiddlware.CsrfMiddleware'])
+        route = get('/view', ControllerTest.returns_a_dict)
+
+        with pytest.raises(RouteMiddlewareNotFound):
+            route.middleware_chain(self.app)
+
+
 class Middleware:
 
     def before(): pass
 
     def after(): pass
+
+
+class CorsMiddleware:
+
+    def __init__(self, Request):
+        self.request = Request
+
+    def after(self):
+        self.request.header('Access-Control-Allow-Origin', '*', http_prefix=None)
@@ -2,7 +2,7 @@ from masonite.providers import StatusCodeProvider
 from masonite.request import Request
 from masonite.view import View
 from masonite.app import App
-from masonite.providers.StatusCodeProvider import ServerErrorExceptionHook
+from masonite.providers.StatusCodeProvider import ServerErrorExceptionHook, StatusCodePages
 
 class TestStatusCode:
 
@@ -15,7 +15,7 @@ class TestStatusCode:
         self.provider = StatusCodeProvider().load_app(self.app).boot(self.app.make('StatusCode'), self.app.make('Request'))
     
     def test_provider_returns_masonite_view(self):
-        assert '404 Not Found' in self.app.make('Response')
+        assert b'404 Not Found' in self.app.make('Response')
         assert self.app.make('Headers')
     
     def test_provider_returns_none_on_200_OK(self):
@@ -42,4 +42,37 @@ class TestServerErrorExceptionHook:
         application = MockApplicationConfig
         application.DEBUG = False
         self.app.bind('Application', application)
-        assert self.hook == ServerErrorExceptionHook().load(self.app) is None
\ No newline at end of file
+        assert self.hook == ServerErrorExceptionHook().load(self.app) is None
+
+class TestStatusCodePages:
+
+    def setup_method(self):
+        self.app = App()
+        self.app.bind('Request', Request(None).load_app(self.app))
+        self.app.bind('ViewClass', View(self.app))
+        self.app.bind('View', self.app.make('ViewClass').render)
+        StatusCodeProvider().load_app(self.app).register()
+
+    def test_pages_are_rendered_once(self):
+        pages = self.app.make('StatusCodePages')
+        StatusCodeProvider().load_app(self.app).boot('404 Not Found', self.app.make('Request'))
+        response = self.app.make('Response')
+
+        assert b'404 Not Found' in response
+        assert pages.pages['404 Not Found'] == (response, str(len(response)))
+
+        self.app.bind('View', None)
+        StatusCodeProvider().load_app(self.app).boot('404 Not Found', self.app.make('Request'))
+        assert self.app.make('Response') is response
+
+    def test_dynamic_pages_are_rendered_for_every_request(self):
+        pages = StatusCodePages(dynamic=True)
+        view = self.app.make('ViewClass')
+
+        view.share({'user': 'first'})
+        assert pages.render(self.app, "418 I'm a teapot") == (b'first', '5')
+
+        view.share({'user': 'second'})
+        assert pages.render(self.app, "418 I'm a teapot") == (b'second', '6')
+        assert b'404 Not Found' in pages.render(self.app, '404 Not Found')[0]
+        assert pages.pages == {}
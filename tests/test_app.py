@@ -77,3 +77,15 @@ class TestApp:
 
     def _resolve_reques_class(self, request: Request):
         return request
+
+    def test_hook_only_fires_matching_listeners(self):
+        self.app.on_make('Request', self._func_on_make)
+        self.app.on_make('Route', self._func_on_make_route)
+        self.app.bind('Request', REQUEST)
+        self.app.bind('Route', Get().route('test/', None))
+
+        self.app.make('Request')
+        assert REQUEST.path == '/test/on/make'
+
+    def _func_on_make_route(self, route, container):
+        REQUEST.path = '/test/on/make/route'
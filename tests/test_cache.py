@@ -1,10 +1,18 @@
 from config import cache
 from masonite.app import App
 from masonite.drivers.CacheDiskDriver import CacheDiskDriver
+from masonite.drivers.CacheMemoryDriver import CacheMemoryDriver
+from masonite.drivers.CacheRedisDriver import CacheRedisDriver
+from masonite.drivers.CacheSqliteDriver import CacheSqliteDriver
 from masonite.managers.CacheManager import CacheManager
-import time
 import glob
+import multiprocessing
 import os
+import sys
+import threading
+import time
+
+import pytest
 
 
 class TestCache:
@@ -57,9 +65,8 @@ class TestCache:
         assert cache_driver.get('key') == 'value'
         assert cache_driver.get('key_time') == 'key value'
 
-
-        for cache_file in glob.glob('bootstrap/cache/key*'):
-            os.remove(cache_file)
+        cache_driver.delete('key')
+        cache_driver.delete('key_time')
 
     def test_cache_expired_before_get(self):
         cache_driver = self.app.make('Cache')
@@ -72,10 +79,7 @@ class TestCache:
 
         assert not cache_driver.is_valid('key_for_1_second')
         assert cache_driver.get('key_for_1_second') is None
-
-
-        for cache_file in glob.glob('bootstrap/cache/key*'):
-            os.remove(cache_file)
+        assert not cache_driver.cache_exists('key_for_1_second')
 
     def test_cache_sets_times(self):
 
@@ -99,7 +103,339 @@ class TestCache:
         assert cache_driver.get('key_for_1_month') == 'value'
         assert cache_driver.get('key_for_1_year') == 'value'
 
+        for key in ('minute', 'hour', 'day', 'month', 'year'):
+            cache_driver.delete('key_for_1_' + key)
+
+    def test_disk_cache_does_not_mix_up_keys_with_the_same_prefix(self):
+        cache_driver = self.app.make('Cache')
+
+        cache_driver.store('key', 'value')
+        cache_driver.store_for('key_time', 'key value', 1, 'minute')
+        cache_driver.delete('key')
+
+        assert cache_driver.get('key') is None
+        assert cache_driver.get('key_time') == 'key value'
+
+        cache_driver.delete('key_time')
+
+    def test_disk_cache_update_keeps_expiration(self):
+        cache_driver = self.app.make('Cache')
+
+        cache_driver.store_for('key_update', 'value', 0.5, 'seconds')
+        cache_driver.update('key_update', 'updated')
+        assert cache_driver.get('key_update') == 'updated'
+
+        time.sleep(1)
+        assert cache_driver.get('key_update') is None
+
+    def test_disk_cache_gets_sets_and_deletes_many(self):
+        cache_driver = self.app.make('Cache')
+
+        assert cache_driver.set_many({'key_first': 1, 'key_second': 2}, 1, 'minute') == ['key_first', 'key_second']
+        assert cache_driver.get_many(['key_first', 'key_second', 'key_missing']) == {
+            'key_first': '1', 'key_second': '2', 'key_missing': None
+        }
+
+        cache_driver.delete_many(['key_first', 'key_second'])
+        assert cache_driver.get_many(['key_first', 'key_second']) == {'key_first': None, 'key_second': None}
+
+    def test_disk_cache_writes_one_file_per_key(self):
+        cache_driver = self.app.make('Cache')
+        location = 'bootstrap/cache/test_disk_driver'
+
+        cache_driver.store('key', 'value', location=location)
+        cache_driver.store('key', 'changed', location=location)
+
+        assert os.listdir(location) == [os.path.basename(cache_driver._path('key'))]
+
+        os.remove(cache_driver._path('key', location))
+        os.rmdir(location)
+
+    def test_disk_cache_files_use_the_default_mode(self):
+        cache_driver = self.app.make('Cache')
+        location = 'bootstrap/cache/test_disk_driver'
+
+        cache_driver.store('key', 'value', location=location)
+        umask = os.umask(0)
+        os.umask(umask)
+
+        assert os.stat(cache_driver._path('key', location)).st_mode & 0o777 == 0o666 & ~umask
+
+        os.remove(cache_driver._path('key', location))
+        os.rmdir(location)
+
+
+
+class TestCacheMemoryDriver:
+
+    def setup_method(self):
+        self.app = App()
+        self.app.bind('CacheConfig', cache)
+        self.app.bind('CacheMemoryDriver', CacheMemoryDriver)
+        self.app.bind('CacheManager', CacheManager(self.app))
+        self.app.bind('Application', self.app)
+        self.cache = self.app.make('CacheManager').driver('memory')
+        self.cache.flush()
+
+    def test_memory_cache_store_and_get(self):
+        assert self.cache.store('key', 'value') == 'key'
+        assert self.cache.get('key') == 'value'
+        assert self.cache.cache_exists('key')
+        assert self.cache.is_valid('key')
+
+        self.cache.update('key', 'updated')
+        assert self.cache.get('key') == 'updated'
+
+        self.cache.delete('key')
+        assert self.cache.get('key') is None
+        assert not self.cache.is_valid('key')
+
+    def test_memory_cache_expires_values(self):
+        self.cache.store_for('key', 'value', 0.05, 'seconds')
+        assert self.cache.get('key') == 'value'
+
+        time.sleep(0.1)
+        assert self.cache.get('key') is None
+        assert not self.cache.cache_exists('key')
+
+    def test_memory_cache_update_stores_expired_values_forever(self):
+        self.cache.store_for('key', 'value', -1, 'seconds')
+        self.cache.update('key', 'updated')
+
+        assert self.cache.get('key') == 'updated'
+
+    def test_memory_cache_gets_sets_and_deletes_many(self):
+        assert self.cache.set_many({'first': 1, 'second': 2}) == ['first', 'second']
+        assert self.cache.get_many(['first', 'second', 'missing']) == {'first': '1', 'second': '2', 'missing': None}
+
+        self.cache.delete_many(['first', 'missing'])
+        assert self.cache.get_many(['first', 'second']) == {'first': None, 'second': '2'}
+
+        self.cache.set_many({'first': 1}, -1, 'seconds')
+        assert self.cache.get_many(['first']) == {'first': None}
+
+    def test_memory_cache_is_shared_between_drivers(self):
+        self.cache.store('key', 'value')
+
+        assert self.app.make('CacheManager').driver('memory').get('key') == 'value'
+
+    def test_memory_cache_removes_least_recently_used_entries(self):
+        self.cache.max_entries = 2
+
+        self.cache.store('first', 'value')
+        self.cache.store('second', 'value')
+        self.cache.get('first')
+        self.cache.store('third', 'value')
+
+        assert self.cache.get('first') == 'value'
+        assert self.cache.get('second') is None
+        assert self.cache.get('third') == 'value'
+
+    def test_memory_cache_exists_does_not_mark_entries_as_used(self):
+        self.cache.max_entries = 2
+
+        self.cache.store('first', 'value')
+        self.cache.store('second', 'value')
+        assert self.cache.cache_exists('first')
+        self.cache.store('third', 'value')
+
+        assert not self.cache.cache_exists('first')
+        assert self.cache.cache_exists('second')
+
+    def test_memory_cache_limits_bytes(self):
+        self.cache.max_bytes = sys.getsizeof('a' * 100) * 2
+
+        self.cache.store('first', 'a' * 100)
+        self.cache.store('second', 'a' * 100)
+        self.cache.store('third', 'a' * 100)
+
+        assert self.cache.get('first') is None
+        assert self.cache.get('second') is not None
+        assert self.cache.get('third') is not None
+
+    def test_memory_cache_is_thread_safe(self):
+        def store(number):
+            for index in range(200):
+                self.cache.store('{0}.{1}'.format(number, index), 'value')
+                self.cache.get('{0}.{1}'.format(number, index - 1))
+
+        self.cache.max_entries = 100
+        threads = [threading.Thread(target=store, args=(number,)) for number in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(CacheMemoryDriver._cache) == 100
+        assert CacheMemoryDriver._size == sum(entry[2] for entry in CacheMemoryDriver._cache.values())
+
+
+def store_in_sqlite_cache(location, number):
+    cache_driver = CacheSqliteDriver(cache, None)
+    cache_driver.location = location
+
+    for index in range(50):
+        cache_driver.store('{0}.{1}'.format(number, index), 'value')
+
+
+class TestCacheSqliteDriver:
+
+    def setup_method(self):
+        self.app = App()
+        self.app.bind('CacheConfig', cache)
+        self.app.bind('CacheSqliteDriver', CacheSqliteDriver)
+        self.app.bind('CacheManager', CacheManager(self.app))
+        self.app.bind('Application', self.app)
+        self.location = 'bootstrap/cache/test_cache.sqlite3'
+        self.cache = self.app.make('CacheManager').driver('sqlite')
+        self.cache.location = self.location
+
+    def teardown_method(self):
+        CacheSqliteDriver._local.connections.pop(self.location).close()
+        for path in glob.glob(self.location + '*'):
+            os.remove(path)
+
+    def test_sqlite_cache_store_and_get(self):
+        assert self.cache.store('key', 'value') == 'key'
+        assert self.cache.get('key') == 'value'
+        assert self.cache.cache_exists('key')
+        assert self.cache.is_valid('key')
+
+        self.cache.update('key', 'updated')
+        assert self.cache.get('key') == 'updated'
+
+        self.cache.delete('key')
+        assert self.cache.get('key') is None
+        assert not self.cache.is_valid('key')
+
+    def test_sqlite_cache_uses_wal_mode(self):
+        self.cache.store('key', 'value')
+
+        assert self.cache._connection().execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+    def test_sqlite_cache_expires_values(self):
+        self.cache.store_for('key', 'value', 0.05, 'seconds')
+        self.cache.update('key', 'updated')
+        assert self.cache.get('key') == 'updated'
+
+        time.sleep(0.1)
+        assert self.cache.get('key') is None
+        assert not self.cache.cache_exists('key')
+
+    def test_sqlite_cache_update_stores_expired_values_forever(self):
+        self.cache.store_for('key', 'value', -1, 'seconds')
+        self.cache.update('key', 'updated')
+
+        assert self.cache.get('key') == 'updated'
+
+    def test_sqlite_cache_gets_sets_and_deletes_many(self):
+        self.cache.batch_size = 2
+        values = {'key{0}'.format(index): index for index in range(5)}
+
+        assert self.cache.set_many(values, 1, 'minute') == list(values)
+        assert self.cache.get_many(list(values) + ['missing']) == dict(
+            {key: str(value) for key, value in values.items()}, missing=None)
+
+        self.cache.delete_many(['key0', 'key1', 'key2'])
+        assert self.cache.get_many(['key0', 'key3']) == {'key0': None, 'key3': '3'}
+
+        self.cache.set_many({'key3': 3}, -1, 'seconds')
+        assert self.cache.get_many(['key3', 'key4']) == {'key3': None, 'key4': '4'}
+
+    def test_sqlite_cache_evicts_expired_rows_in_batches(self):
+        for index in range(5):
+            self.cache.store_for('expired{0}'.format(index), 'value', -1, 'seconds')
+        self.cache.store('key', 'value')
+
+        assert self.cache.evict(limit=3) == 3
+        assert self.cache.evict() == 2
+        assert self.cache._connection().execute('SELECT COUNT(*) FROM cache').fetchone()[0] == 1
+
+    def test_sqlite_cache_is_shared_between_processes(self):
+        processes = [
+            multiprocessing.Process(target=store_in_sqlite_cache, args=(self.location, number))
+            for number in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        assert all(process.exitcode == 0 for process in processes)
+        assert self.cache.get('3.49') == 'value'
+        assert self.cache._connection().execute('SELECT COUNT(*) FROM cache').fetchone()[0] == 200
+
+
+class TestCacheRedisDriver:
+
+    def setup_method(self):
+        fakeredis = pytest.importorskip('fakeredis')
+
+        self.app = App()
+        self.app.bind('CacheConfig', cache)
+        self.app.bind('CacheRedisDriver', CacheRedisDriver)
+        self.app.bind('CacheManager', CacheManager(self.app))
+        self.app.bind('Application', self.app)
+        self.cache = self.app.make('CacheManager').driver('redis')
+        self.cache.client = fakeredis.FakeRedis(decode_responses=True)
+        self.cache.client.flushdb()
+
+    def test_redis_cache_store_and_get(self):
+        assert self.cache.store('key', 'value') == 'key'
+        assert self.cache.get('key') == 'value'
+        assert self.cache.client.get('masonite_cache:key') == 'value'
+        assert self.cache.cache_exists('key')
+        assert self.cache.is_valid('key')
+
+        self.cache.delete('key')
+        assert self.cache.get('key') is None
+        assert not self.cache.is_valid('key')
+
+    def test_redis_cache_uses_native_ttl(self):
+        self.cache.store_for('key', 'value', 1, 'minute')
+        self.cache.update('key', 'updated')
+
+        assert self.cache.get('key') == 'updated'
+        assert 0 < self.cache.client.pttl('masonite_cache:key') <= 60000
+
+        self.cache.store_for('key', 'value', -1, 'seconds')
+        assert self.cache.get('key') is None
+
+    def test_redis_cache_update_keeps_ttl_without_keepttl(self):
+        CacheRedisDriver._keeps_ttl[self.cache.client] = False
+
+        self.cache.store_for('key', 'value', 1, 'minute')
+        self.cache.update('key', 'updated')
+        self.cache.update('missing', 'updated')
+
+        assert self.cache.get('key') == 'updated'
+        assert 0 < self.cache.client.pttl('masonite_cache:key') <= 60000
+        assert self.cache.client.ttl('masonite_cache:missing') in (-1, None)
+
+    def test_redis_cache_update_stores_keys_without_ttl_forever(self):
+        self.cache.store('key', 'value')
+        self.cache.update('key', 'updated')
+        self.cache.update('missing', 'updated')
+
+        assert self.cache.get_many(['key', 'missing']) == {'key': 'updated', 'missing': 'updated'}
+        assert self.cache.client.ttl('masonite_cache:key') in (-1, None)
+        assert self.cache.client.ttl('masonite_cache:missing') in (-1, None)
+
+    def test_redis_cache_gets_sets_and_deletes_many(self):
+        assert self.cache.set_many({'first': 1, 'second': 2}, 1, 'minute') == ['first', 'second']
+
+        assert self.cache.get_many(['first', 'second', 'missing']) == {
+            'first': '1', 'second': '2', 'missing': None
+        }
+        assert self.cache.client.ttl('masonite_cache:first') == 60
+        assert self.cache.get_many([]) == {}
+
+        self.cache.delete_many(['first', 'missing'])
+        assert self.cache.get_many(['first', 'second']) == {'first': None, 'second': '2'}
 
-        for cache_file in glob.glob('bootstrap/cache/key*'):
-            os.remove(cache_file)
+    def test_redis_cache_shares_one_client_per_process(self):
+        pytest.importorskip('redis')
+        first = CacheRedisDriver(cache, None)
+        second = CacheRedisDriver(cache, None)
 
+        assert first._client() is second._client()
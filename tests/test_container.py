@@ -3,6 +3,8 @@ from masonite.request import Request
 from masonite.drivers.UploadDiskDriver import UploadDiskDriver
 from masonite.contracts.UploadContract import UploadContract
 from masonite.exceptions import ContainerError, StrictContainerException
+import gc
+
 import pytest
 
 
@@ -120,3 +122,116 @@ class TestContainer:
         self.app.bind('Request', 'override')
         assert self.app.make('Request') == 'test'
 
+
+    def test_container_caches_resolution_plans(self):
+        self.app.resolve(self._function_test_double_annotations)
+        self.app.resolve(self._function_test_double_annotations)
+
+        assert len(self.app._method_resolution_plans) == 1
+
+    def test_container_frees_resolution_plans_of_freed_callables(self):
+        for index in range(10):
+            self.app.resolve(lambda Request: Request)
+
+        gc.collect()
+        assert len(self.app._resolution_plans) == 0
+
+    def test_container_resolves_new_bindings_with_cached_plan(self):
+        assert isinstance(self.app.resolve(self._function_test), MockObject.__class__)
+
+        self.app.bind('MockObject', GetObject)
+        assert self.app.resolve(self._function_test) is GetObject
+
+    def test_container_indexes_annotations(self):
+        self.app.resolve(self._function_test_annotation)
+
+        assert self.app._type_index[MockObject] == 'MockObject'
+
+    def test_container_type_index_is_invalidated_on_rebind(self):
+        assert self.app.resolve(self._function_test_annotation) is MockObject
+
+        self.app.bind('MockObject', GetAnotherObject)
+        assert self.app.resolve(self._function_test_annotation) is GetAnotherObject
+
+        self.app.bind('MockObject', 'not a mock object')
+        assert self.app.resolve(self._function_test_annotation) is GetObject
+
+        self.app.bind('MockObject', MockObject)
+        assert self.app.resolve(self._function_test_annotation) is MockObject
+
+    def test_child_container_makes_from_parent(self):
+        child = self.app.child()
+
+        assert child.has('MockObject')
+        assert child.make('MockObject') is MockObject
+        assert child.resolve(self._function_test_annotation) is MockObject
+
+    def test_child_container_bindings_do_not_leak_into_parent(self):
+        child = self.app.child()
+        child.bind('MockObject', GetObject)
+        child.bind('ChildObject', GetAnotherObject)
+
+        assert child.make('MockObject') is GetObject
+        assert child.resolve(self._function_test) is GetObject
+        assert self.app.make('MockObject') is MockObject
+        assert not self.app.has('ChildObject')
+
+    def test_child_container_resolves_own_annotations_first(self):
+        child = self.app.child()
+        child.bind('GetAnotherObject', GetAnotherObject)
+
+        assert child.resolve(self._function_test_annotation) is GetAnotherObject
+        assert self.app.resolve(self._function_test_annotation) is MockObject
+
+    def test_child_container_collects_from_parent(self):
+        child = self.app.child()
+        child.bind('GetAnotherObject', GetAnotherObject)
+
+        assert child.collect('Get*') == {'GetObject': GetObject, 'GetAnotherObject': GetAnotherObject}
+
+    def test_container_singleton_is_created_once_on_first_make(self):
+        self.app.singleton('Singleton', GetObject)
+
+        assert 'Singleton' not in self.app.providers
+        assert self.app.has('Singleton')
+
+        singleton = self.app.make('Singleton')
+        assert isinstance(singleton, GetObject)
+        assert self.app.make('Singleton') is singleton
+        assert self.app.providers['Singleton'] is singleton
+
+    def test_container_singleton_factory_is_resolved(self):
+        self.app.singleton('Singleton', self._function_test)
+
+        assert self.app.make('Singleton') is MockObject
+
+    def test_container_factory_creates_new_object_every_time(self):
+        self.app.factory('Factory', GetObject)
+
+        assert isinstance(self.app.make('Factory'), GetObject)
+        assert self.app.make('Factory') is not self.app.make('Factory')
+        assert self.app.resolve(self._function_test_factory) is not self.app.resolve(self._function_test_factory)
+
+    def _function_test_factory(self, Factory):
+        return Factory
+
+    def test_container_factories_resolve_by_annotation(self):
+        self.app.factory('GetAnotherObject', GetAnotherObject)
+
+        assert isinstance(self.app.resolve(self._function_test_another_object), GetAnotherObject)
+
+    def _function_test_another_object(self, obj: GetAnotherObject):
+        return obj
+
+    def test_container_bind_replaces_factory(self):
+        self.app.factory('Factory', GetObject)
+        self.app.bind('Factory', 'bound')
+
+        assert self.app.make('Factory') == 'bound'
+
+    def test_strict_container_raises_exception_for_singletons(self):
+        self.app = App(strict=True)
+        self.app.singleton('Request', object)
+
+        with pytest.raises(StrictContainerException):
+            self.app.bind('Request', object)
@@ -0,0 +1,76 @@
+import atexit
+import logging
+import os
+
+import pytest
+
+from masonite.exceptions import DriverNotFound
+from masonite.logger import AccessLogger
+
+
+class TestAccessLogger:
+
+    def setup_method(self):
+        self.location = 'storage/logs/test_access.log'
+
+    def teardown_method(self):
+        if os.path.exists(self.location):
+            os.remove(self.location)
+
+    def read_log(self, logger):
+        logger.stop()
+        with open(self.location) as log:
+            return log.read()
+
+    def test_logger_writes_records_to_file(self):
+        logger = AccessLogger(sink='file', location=self.location)
+
+        assert logger.log('GET', '/test', '200 OK', 1.5, 4)
+        assert logger.log('GET', '/missing', '404 Not Found', 0.5, 10)
+
+        log = self.read_log(logger)
+        assert 'INFO GET /test 200 OK 1.50ms 4' in log
+        assert 'WARNING GET /missing 404 Not Found 0.50ms 10' in log
+
+    def test_logger_filters_by_level(self):
+        logger = AccessLogger(sink='rotating', location=self.location, level='WARNING')
+
+        assert not logger.log('GET', '/test', '200 OK', 1.5, 4)
+        assert logger.log('GET', '/error', '500 Internal Server Error', 1.5, 4)
+
+        log = self.read_log(logger)
+        assert '/test' not in log
+        assert 'ERROR GET /error' in log
+
+    def test_logger_samples_requests(self):
+        logger = AccessLogger(sink='file', location=self.location, sample_rate=0)
+
+        assert not logger.log('GET', '/test', '200 OK', 1.5, 4)
+        assert not logger.running
+
+    def test_logger_stops_at_exit_once(self, monkeypatch):
+        registered = []
+        monkeypatch.setattr(atexit, 'register', registered.append)
+        logger = AccessLogger(sink='file', location=self.location)
+
+        logger.start()
+        logger.stop()
+        logger.start()
+        logger.stop()
+
+        assert registered == [logger.stop]
+
+    def test_logger_can_be_disabled(self):
+        assert AccessLogger.from_config({'enabled': False}) is None
+        assert isinstance(AccessLogger.from_config({'sink': 'stdout'}), AccessLogger)
+
+    def test_logger_throws_exception_for_unknown_sink(self):
+        with pytest.raises(DriverNotFound):
+            AccessLogger(sink='unknown')
+
+    def test_logger_accepts_lowercase_levels(self):
+        assert AccessLogger(sink='stdout', level='warning').level == logging.WARNING
+
+    def test_logger_throws_exception_for_unknown_level(self):
+        with pytest.raises(ValueError):
+            AccessLogger(sink='stdout', level='verbose')
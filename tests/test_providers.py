@@ -1,9 +1,13 @@
+import builtins
 from pydoc import locate
 from config import application, providers
 
 from masonite.app import App
+from masonite.providers import ViewProvider
+from masonite.helpers.routes import get
 from masonite.routes import Get
 from masonite.testsuite.TestSuite import TestSuite, generate_wsgi
+from masonite.wsgi import WSGIApplication
 
 
 class TestProviders:
@@ -40,3 +44,54 @@ class TestProviders:
     def test_normal_app_containers(self):
         self.app = TestSuite().create_container()
         assert self.app.get_container().make('Request')
+
+    def test_providers_boot_into_child_containers(self):
+        application = WSGIApplication.from_providers(
+            self.app, self.app.make('Providers').PROVIDERS, scoped=True)
+        self.app.bind('HttpMiddleware', [])
+        self.app.bind('WebRoutes', [
+            get('/first', ScopedController.show),
+            get('/second', ScopedController.show),
+        ])
+        ScopedController.requests = []
+
+        for path in ('/first', '/second'):
+            environ = generate_wsgi()
+            environ['PATH_INFO'] = path
+
+            assert list(application(environ, lambda status, headers: None)) == [path.encode('utf-8')]
+
+        requests = ScopedController.requests
+        for request, helper_request, view_request, container_request in requests:
+            assert helper_request is request
+            assert view_request is request
+            assert container_request is request
+
+        assert requests[0][0] is not requests[1][0]
+        assert requests[0][0].path == '/first'
+        assert requests[1][0].path == '/second'
+        assert self.app.make('Request') not in [scoped[0] for scoped in requests]
+        assert not self.app.has('StatusCode')
+        assert not self.app.has('Headers')
+
+    def test_view_provider_reads_debug_as_a_boolean(self):
+        for debug, auto_reload in (('true', True), ('1', True), ('False', False), (False, False)):
+            self.app.bind('Application', type('Application', (), {'DEBUG': debug}))
+            ViewProvider().load_app(self.app).register()
+
+            assert self.app.make('ViewClass').auto_reload is auto_reload
+
+
+class ScopedController:
+
+    requests = []
+
+    def __init__(self, Request):
+        self.request = Request
+
+    def show(self, ViewClass):
+        ScopedController.requests.append(
+            (self.request, builtins.request(), ViewClass.dictionary['request'](),
+             builtins.container().make('Request')))
+
+        return self.request.path
@@ -24,6 +24,31 @@ class TestRequest:
         self.request = Request(wsgi_request).key(
             'NCTpkICMlTXie5te9nJniMj9aVbPM6lsjeq5iDZ0dqY=')
 
+    def test_request_clone_keeps_settings_and_resets_state(self):
+        self.request.cookie('test', 'value')
+        self.request.set_params({'id': '1'})
+        self.request.redirect_url = '/login'
+
+        request = self.request.clone()
+
+        assert request is not self.request
+        assert request.encryption_key == self.request.encryption_key
+        assert request.get_cookies() == []
+        assert request.url_params == {}
+        assert request.redirect_url is False
+        assert self.request.param('id') == '1'
+
+    def test_request_clone_binds_extended_methods_to_the_clone(self):
+        def set_params(self, params):
+            self.url_params = params
+
+        self.request.extend(set_params)
+        request = self.request.clone()
+        request.set_params({'id': '1'})
+
+        assert request.url_params == {'id': '1'}
+        assert self.request.url_params == {}
+
     def test_request_is_callable(self):
         """ Request should be callable """
         if callable(self.request):
@@ -365,6 +390,20 @@ class TestRequest:
         request.path = '/test/url/1'
         assert request.is_named_route('test.id', {'id': 1})
 
+    def test_named_routes_follow_rebound_routes(self):
+        app = App()
+        app.bind('Request', self.request)
+        app.bind('WebRoutes', [get('/test/url', None).name('test')])
+        request = app.make('Request').load_app(app)
+
+        assert request.route('test') == '/test/url'
+
+        app.bind('WebRoutes', [get('/test/rebound', None).name('test')])
+        assert request.route('test') == '/test/rebound'
+
+        app.make('WebRoutes').append(get('/test/appended', None).name('appended'))
+        assert request.route('appended') == '/test/appended'
+
     def test_request_url_from_controller(self):
         app = App()
         app.bind('Request', self.request)
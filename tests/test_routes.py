@@ -1,6 +1,9 @@
+import json
+import os
+import uuid
 from masonite.routes import Route
 from masonite.request import Request
-from masonite.routes import Get, Post, Put, Patch, Delete, RouteGroup
+from masonite.routes import Get, Post, Put, Patch, Delete, Converter, RouteCache, RouteGroup, RouteIndex, RouteTable, UrlTemplate, url_template
 from masonite.helpers.routes import group, flatten_routes
 from masonite.testsuite.TestSuite import generate_wsgi
 from masonite.exceptions import InvalidRouteCompileException
@@ -54,7 +57,7 @@ class TestRoutes:
 
         with pytest.raises(InvalidRouteCompileException):
             self.route.compile_route_to_regex(Get().route(
-                'test/@route:slug', None))
+                'test/@route:unknown', None))
 
     def test_route_gets_controllers(self):
         assert Get().route('test/url', 'TestController@show')
@@ -143,3 +146,243 @@ class TestRoutes:
 
         assert routes[3].route_url == '/dashboard/test/1'
         assert routes[3].named_route == 'post.update'
+
+
+class TestRouteTable:
+
+    def setup_method(self):
+        self.routes = [
+            Get().route('/', None),
+            Get().route('/test/@id:int', None),
+            Get().route('/test/@name', None),
+            Post().route('/test/@name', None),
+            Get().route('/trailing/', None),
+        ]
+        self.table = RouteTable(self.routes)
+        self.route_compilers = Route.route_compilers.copy()
+
+    def teardown_method(self):
+        Route.route_compilers.clear()
+        Route.route_compilers.update(self.route_compilers)
+
+    def test_table_matches_first_route(self):
+        route, params = self.table.matches('GET', '/test/1')[0]
+
+        assert route is self.routes[1]
+        assert params == {'id': 1}
+
+    def test_table_matches_routes_in_order(self):
+        matches = self.table.matches('GET', '/test/1')
+
+        assert [route for route, params in matches] == [self.routes[1], self.routes[2]]
+        assert matches[1][1] == {'name': '1'}
+
+    def test_table_matches_by_method(self):
+        route, params = self.table.matches('POST', '/test/joe')[0]
+
+        assert route is self.routes[3]
+        assert params == {'name': 'joe'}
+        assert self.table.matches('PUT', '/test/joe') == []
+
+    def test_table_matches_trailing_slashes(self):
+        assert self.table.matches('GET', '/')[0][0] is self.routes[0]
+        assert self.table.matches('GET', '/trailing/')[0][0] is self.routes[4]
+        assert self.table.matches('GET', '/trailing') == []
+        assert self.table.matches('GET', '/test/1/') == []
+
+    def test_table_knows_routes_it_was_compiled_from(self):
+        assert self.table.is_compiled_from(self.routes)
+        assert not self.table.is_compiled_from(list(self.routes))
+
+        self.routes.append(Get().route('/new', None))
+        assert not self.table.is_compiled_from(self.routes)
+
+    def test_table_matches_routes_spanning_segments(self):
+        Route().compile('anything', r'(.*)')
+        routes = [
+            Get().route('/files/@file:anything', None),
+            Get().route('/robots.txt', None),
+        ]
+        table = RouteTable(routes)
+
+        assert table.matches('GET', '/files/some/file.txt')[0] == (routes[0], {'file:anything': 'some/file.txt'})
+        assert table.matches('GET', '/robots.txt')[0][0] is routes[1]
+
+
+class TestRouteConverters:
+
+    def setup_method(self):
+        self.route_compilers = Route.route_compilers.copy()
+        self.route_converters = Route.route_converters.copy()
+
+    def teardown_method(self):
+        Route.route_compilers.clear()
+        Route.route_compilers.update(self.route_compilers)
+        Route.route_converters.clear()
+        Route.route_converters.update(self.route_converters)
+        url_template.cache_clear()
+
+    def test_table_converts_parameters(self):
+        identifier = uuid.uuid4()
+        routes = [
+            Get().route('/user/@id:int', None),
+            Get().route('/uuid/@id:uuid', None),
+            Get().route('/post/@slug:slug', None),
+            Get().route('/files/@file:path', None),
+        ]
+        table = RouteTable(routes)
+
+        assert table.matches('GET', '/user/1')[0][1] == {'id': 1}
+        assert table.matches('GET', '/uuid/{0}'.format(identifier))[0][1] == {'id': identifier}
+        assert table.matches('GET', '/post/a-post_1')[0][1] == {'slug': 'a-post_1'}
+        assert table.matches('GET', '/files/some/file.txt')[0][1] == {'file': 'some/file.txt'}
+        assert table.matches('GET', '/uuid/not-a-uuid') == []
+
+    def test_route_can_add_converters(self):
+        class YearConverter(Converter):
+            regex = r'([0-9]+)'
+
+            def to_python(self, value):
+                if len(value) != 4:
+                    raise ValueError('Not a year')
+                return int(value)
+
+            def to_url(self, value):
+                return str(value).zfill(4)
+
+        Route().converter('year', YearConverter())
+        routes = [Get().route('/archive/@year:year', None), Get().route('/archive/@page', None)]
+        table = RouteTable(routes)
+
+        assert table.matches('GET', '/archive/2018')[0] == (routes[0], {'year': 2018})
+        assert table.matches('GET', '/archive/18') == [(routes[1], {'page': '18'})]
+        assert UrlTemplate('/archive/@year:year').format({'year': 18}) == '/archive/0018'
+
+    def test_url_templates_use_replaced_converters(self):
+        class PaddedConverter(Converter):
+            regex = r'([0-9]+)'
+
+            def to_url(self, value):
+                return str(value).zfill(4)
+
+        assert url_template('/archive/@year:int').format({'year': 18}) == '/archive/18'
+
+        Route().converter('int', PaddedConverter())
+        assert url_template('/archive/@year:int').format({'year': 18}) == '/archive/0018'
+
+    def test_url_template_uses_converters(self):
+        identifier = uuid.uuid4()
+
+        assert UrlTemplate('/uuid/@id:uuid').format({'id': identifier}) == '/uuid/{0}'.format(identifier)
+        assert UrlTemplate('/files/@file:path').format({'file': 'some/file.txt'}) == '/files/some/file.txt'
+        assert UrlTemplate('/test/@id:integer').format({'id': 1}) == '/test/1'
+
+
+class CustomRoute(Get):
+
+    def __init__(self):
+        super().__init__()
+        self.method_type = 'OPTIONS'
+
+
+class TestRouteCache:
+
+    def setup_method(self):
+        self.cache = RouteCache('bootstrap/cache/test_routes.json')
+
+    def teardown_method(self):
+        self.cache.clear()
+
+    def test_cache_writes_and_loads_routes(self):
+        from app.http.controllers.ControllerTest import ControllerTest
+        routes = [
+            Get().route('/test/@id', ControllerTest.show).name('test').middleware('auth'),
+            Post().domain('test').route('/test', 'TestController@show'),
+            Get().route('/none', None),
+        ]
+
+        self.cache.write(routes)
+        assert self.cache.exists()
+
+        loaded = self.cache.load()
+        assert isinstance(loaded[0], Get)
+        assert isinstance(loaded[1], Post)
+        assert loaded[0].route_url == '/test/@id'
+        assert loaded[0].named_route == 'test'
+        assert loaded[0].list_middleware == ['auth']
+        assert loaded[1].required_domain == 'test'
+        assert loaded[0].controller is ControllerTest
+        assert loaded[0].controller_method == 'show'
+        assert loaded[1].controller.__name__ == 'TestController'
+        assert not hasattr(loaded[2], 'controller')
+
+    def test_cache_imports_controllers_lazily(self):
+        self.cache.write([Get().route('/test', 'TestController@show')])
+        route = self.cache.load()[0]
+
+        assert 'controller' not in route.__dict__
+        assert route.get_controller_location() == 'app.http.controllers.TestController.TestController'
+        assert route.controller.__name__ == 'TestController'
+        assert 'controller' in route.__dict__
+
+    def test_cache_loads_custom_route_classes(self):
+        self.cache.write([CustomRoute().route('/custom', None)])
+        route = self.cache.load()[0]
+
+        assert isinstance(route, CustomRoute)
+        assert route.method_type == 'OPTIONS'
+
+    def test_cache_raises_exception_for_missing_route_classes(self):
+        self.cache.write([CustomRoute().route('/custom', None)])
+        with open(self.cache.path) as cache:
+            serialized = json.load(cache)
+        serialized[0]['class'] = 'missing.MissingRoute'
+        with open(self.cache.path, 'w') as cache:
+            json.dump(serialized, cache)
+
+        with pytest.raises(InvalidRouteCompileException):
+            self.cache.load()
+
+    def test_cache_clear(self):
+        self.cache.write([])
+
+        assert self.cache.clear()
+        assert not os.path.exists(self.cache.path)
+        assert not self.cache.clear()
+
+
+class TestRouteIndex:
+
+    def test_url_template_formats_parameters(self):
+        assert UrlTemplate('/test/@id/edit').format({'id': 1}) == '/test/1/edit'
+        assert UrlTemplate('/test/@user:string/@id:int/').format({'user': 'joe', 'id': 1}) == '/test/joe/1/'
+        assert UrlTemplate('/').format() == '/'
+        assert UrlTemplate('').format() == ''
+        assert UrlTemplate('http://google.com').format() == 'http://google.com'
+
+    def test_url_template_requires_parameters(self):
+        with pytest.raises(KeyError):
+            UrlTemplate('/test/@id').format({})
+
+    def test_index_finds_first_named_route(self):
+        routes = [
+            Get().route('/first/@id', None).name('test'),
+            Get().route('/second', None).name('test'),
+        ]
+        index = RouteIndex(routes)
+
+        assert index.named('test').format({'id': 1}) == '/first/1'
+        assert index.named('missing') is None
+
+    def test_index_finds_route_by_controller(self):
+        from app.http.controllers.ControllerTest import ControllerTest
+        routes = [
+            Get().route('/none', None),
+            Get().route('/string', 'TestController@show'),
+            Get().route('/object', ControllerTest.show),
+        ]
+        index = RouteIndex(routes)
+
+        assert index.controller('app.http.controllers', 'TestController', 'show') is routes[1]
+        assert index.controller('app.http.controllers.ControllerTest', 'ControllerTest', 'show') is routes[2]
+        assert index.controller('app.http.controllers', 'TestController', 'store') is None
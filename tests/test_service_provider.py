@@ -2,9 +2,11 @@ import inspect
 
 from masonite.provider import ServiceProvider
 from masonite.app import App
+from masonite.contracts import MailContract, UploadContract
+from masonite.drivers import MailSmtpDriver, UploadDiskDriver
 from masonite.request import Request
 from masonite.routes import Get
-from masonite.testsuite.TestSuite import generate_wsgi
+from masonite.testsuite.TestSuite import TestSuite, generate_wsgi
 
 
 class ContainerTest(ServiceProvider):
@@ -44,3 +46,61 @@ class TestServiceProvider:
         self.app.bind('Get', Get().route('url', None))
 
         assert self.app.resolve(ContainerTest().testboot) == self.app.make('Request')
+
+
+class DeferredProvider(ServiceProvider):
+
+    wsgi = False
+    deferred = True
+    provides = ['Deferred']
+
+    registered = 0
+
+    def register(self):
+        DeferredProvider.registered += 1
+        self.app.bind('DeferredConfig', 'config')
+
+    def boot(self, DeferredConfig):
+        self.app.bind('Deferred', DeferredConfig)
+
+
+class TestDeferredServiceProvider:
+
+    def setup_method(self):
+        self.app = App()
+        DeferredProvider.registered = 0
+        self.app.defer(DeferredProvider())
+
+    def test_deferred_provider_is_not_registered_until_made(self):
+        assert DeferredProvider.registered == 0
+        assert self.app.has('Deferred')
+        assert not self.app.has('DeferredConfig')
+
+    def test_deferred_provider_registers_and_boots_on_first_make(self):
+        assert self.app.make('Deferred') == 'config'
+        assert self.app.make('Deferred') == 'config'
+        assert self.app.make('DeferredConfig') == 'config'
+        assert DeferredProvider.registered == 1
+
+    def test_deferred_provider_loads_when_resolved(self):
+        assert self.app.resolve(self._resolve_deferred) == 'config'
+
+    def test_deferred_provider_loads_from_child_container(self):
+        assert self.app.child().make('Deferred') == 'config'
+        assert self.app.providers['Deferred'] == 'config'
+
+    def test_deferred_providers_load_when_resolved_by_contract(self):
+        container = TestSuite().create_container().get_container()
+
+        assert 'UploadDiskDriver' not in container.providers
+        assert container.resolve(self._resolve_upload) is UploadDiskDriver
+        assert container.resolve(self._resolve_mail) is MailSmtpDriver
+
+    def _resolve_deferred(self, Deferred):
+        return Deferred
+
+    def _resolve_upload(self, upload: UploadContract):
+        return upload
+
+    def _resolve_mail(self, mail: MailContract):
+        return mail
@@ -1,11 +1,13 @@
+import os
+import shutil
 import time
-import glob
 
 from config import cache
 from masonite.app import App
 from masonite.drivers.CacheDiskDriver import CacheDiskDriver
+from masonite.fragment_cache import FragmentCacheExtension
 from masonite.managers.CacheManager import CacheManager
-from masonite.view import view, View
+from masonite.view import view, View, ViewStream
 from masonite.exceptions import RequiredContainerBindingNotFound
 import pytest
 from jinja2 import FileSystemLoader, PackageLoader
@@ -153,6 +155,116 @@ class TestView:
         assert view._filters == {'slug': self._filter_slug}
         assert view.render('filter', {'test': 'test slug'}).rendered_template == 'test-slug'
     
+    def test_view_reuses_environment(self):
+        view = self.container.make('ViewClass')
+
+        env = view.render('test', {'test': 'test'}).env
+        assert view.render('index').env is env
+        assert view.render('/storage/test_location', {'test': 'test'}).env is not env
+        assert view.render('/storage/test_location', {'test': 'test'}).env is view.env
+
+    def test_view_filters_update_existing_environment(self):
+        view = self.container.make('ViewClass')
+        env = view.render('test', {'test': 'test'}).env
+
+        view.filter('slug', self._filter_slug)
+
+        assert view.render('filter', {'test': 'test slug'}).rendered_template == 'test-slug'
+        assert view.env is env
+
+    def test_adding_environment_rebuilds_environment(self):
+        viewclass = self.container.make('ViewClass')
+        env = viewclass.render('test', {'test': 'test'}).env
+
+        viewclass.add_environment('storage', loader=FileSystemLoader)
+
+        assert viewclass.render('test_location', {'test': 'testing'}).rendered_template == 'testing'
+        assert viewclass.env is not env
+
+    def test_view_compiles_templates_into_bytecode_cache(self):
+        view = self.container.make('ViewClass')
+        view.cache_bytecode('bootstrap/cache/test_templates')
+
+        compiled, failed = view.compile_templates(['masonite/snippets'])
+
+        assert 'index.html' in compiled
+        assert 'filter.html' in failed
+        assert 'statuscode.html' in compiled
+        assert len(os.listdir('bootstrap/cache/test_templates')) == len(compiled)
+        assert view.render('test', {'test': 'test'}).env.bytecode_cache is view.bytecode_cache
+
+        shutil.rmtree('bootstrap/cache/test_templates')
+
+    def test_view_streams_encoded_chunks(self):
+        view = self.container.make('ViewClass')
+
+        stream = view.stream('test', {'test': 'test'}).rendered_template
+        view.share({'test': 'changed'})
+
+        assert isinstance(stream, ViewStream)
+        assert list(stream) == [b'test']
+
+    def test_view_stream_buffers_chunks(self):
+        stream = ViewStream(iter(['a', 'bc', 'd', 'ef', 'g']), chunk_size=3)
+
+        assert list(stream) == [b'abc', b'def', b'g']
+
+    def test_view_caches_fragments(self):
+        self.container.bind('CacheConfig', cache)
+        self.container.bind('CacheDiskDriver', CacheDiskDriver)
+        self.container.bind('CacheManager', CacheManager(self.container))
+        self.container.bind('Application', self.container)
+        self.container.bind('Cache', self.container.make('CacheManager').driver('disk'))
+
+        view = self.container.make('ViewClass')
+
+        assert view.render('test_fragment', {'content': '<b>first</b>', 'user': 1}).rendered_template == '&lt;b&gt;first&lt;/b&gt;'
+        assert view.render('test_fragment', {'content': 'second', 'user': 1}).rendered_template == '&lt;b&gt;first&lt;/b&gt;'
+        assert view.render('test_fragment', {'content': 'second', 'user': 2}).rendered_template == 'second'
+
+        assert view.fragment_cache_stats.hits == 1
+        assert view.fragment_cache_stats.misses == 2
+
+        for user in (1, 2):
+            self.container.make('Cache').delete(FragmentCacheExtension._key('test', [user]))
+
+    def test_view_fragments_only_vary_by_primitive_values(self):
+        self.container.bind('CacheConfig', cache)
+        self.container.bind('CacheDiskDriver', CacheDiskDriver)
+        self.container.bind('CacheManager', CacheManager(self.container))
+        self.container.bind('Application', self.container)
+        self.container.bind('Cache', self.container.make('CacheManager').driver('disk'))
+
+        view = self.container.make('ViewClass')
+
+        with pytest.raises(TypeError):
+            view.render('test_fragment', {'content': 'first', 'user': object()})
+
+    def test_view_renders_fragments_without_cache(self):
+        view = self.container.make('ViewClass')
+
+        assert view.render('test_fragment', {'content': 'first', 'user': 1}).rendered_template == 'first'
+        assert view.render('test_fragment', {'content': 'second', 'user': 1}).rendered_template == 'second'
+        assert view.fragment_cache_stats.misses == 2
+
+    def test_view_memoizes_exists_without_auto_reload(self):
+        view = self.container.make('ViewClass')
+        view.auto_reload = False
+
+        assert view.exists('index')
+        assert not view.exists('not_available')
+        assert view._exists_cache == {'index': True, 'not_available': False}
+
+        view.add_environment('storage', loader=FileSystemLoader)
+        assert view._exists_cache == {}
+
+    def test_view_does_not_memoize_exists_with_auto_reload(self):
+        view = self.container.make('ViewClass')
+
+        assert view.exists('index')
+        assert not view.exists('not_available')
+        assert view._exists_cache == {}
+
     @staticmethod
     def _filter_slug(item):
         return item.replace(' ', '-')
@@ -171,7 +283,7 @@ class TestView:
             'test_cache', {'test': 'test'}
         ).cache_for(1, 'second').rendered_template == 'test'
 
-        assert open(glob.glob('bootstrap/cache/test_cache:*')[0]).read() == 'test'
+        assert self.container.make('Cache').get('test_cache') == 'test'
 
         time.sleep(2)
 
@@ -181,7 +293,7 @@ class TestView:
 
         time.sleep(2)
 
-        assert open(glob.glob('bootstrap/cache/test_cache:*')[0]).read() == 'macho'
+        assert self.container.make('Cache').get('test_cache') == 'macho'
 
         assert view(
             'test_cache', {'test': 'macho'}
@@ -189,12 +301,14 @@ class TestView:
 
         time.sleep(1)
 
-        assert open(glob.glob('bootstrap/cache/test_cache:*')[0]).read() == 'macho'
+        assert self.container.make('Cache').get('test_cache') == 'macho'
 
         assert view(
             'test_cache', {'test': 'macho'}
         ).cache_for('1', 'second').rendered_template == 'macho'
 
+        self.container.make('Cache').delete('test_cache')
+
     def test_cache_throws_exception_with_incorrect_cache_type(self):
         self.container.bind('CacheConfig', cache)
         self.container.bind('CacheDiskDriver', CacheDiskDriver)
@@ -0,0 +1,120 @@
+import io
+import os
+
+from config import application, providers
+
+from app.http.controllers.ControllerTest import ControllerTest
+from masonite.app import App
+from masonite.helpers.routes import get
+from masonite.logger import AccessLogger
+from masonite.testsuite.TestSuite import generate_wsgi
+from masonite.wsgi import WSGIApplication
+
+
+class TestWSGIApplication:
+
+    def setup_method(self):
+        self.container = App()
+        self.container.bind('WSGI', object)
+        self.container.bind('Application', application)
+        self.container.bind('Providers', providers)
+        self.application = WSGIApplication.from_providers(self.container, providers.PROVIDERS)
+
+        self.container.bind('HttpMiddleware', [])
+        self.container.bind('WebRoutes', [get('/view', ControllerTest.test)])
+        self.status = None
+        self.headers = None
+
+    def start_response(self, status, headers):
+        self.status = status
+        self.headers = headers
+
+    def test_application_only_keeps_wsgi_providers(self):
+        assert self.application.providers
+        for provider in self.application.providers:
+            assert provider.wsgi is True
+
+    def test_application_runs_pipeline(self):
+        environ = generate_wsgi()
+        environ['PATH_INFO'] = '/view'
+
+        assert list(self.application(environ, self.start_response)) == [b'test']
+        assert self.status == '200 OK'
+
+    def test_application_returns_not_found(self):
+        environ = generate_wsgi()
+        environ['PATH_INFO'] = '/not/found'
+
+        response = b''.join(self.application(environ, self.start_response))
+        assert self.status == '404 Not Found'
+        assert b'404 Not Found' in response
+
+    def test_head_request_returns_not_found_without_body(self):
+        environ = generate_wsgi()
+        environ['REQUEST_METHOD'] = 'HEAD'
+        environ['PATH_INFO'] = '/not/found'
+        environ['wsgi.input'] = io.BytesIO()
+
+        assert b''.join(self.application(environ, self.start_response)) == b''
+        assert self.status == '404 Not Found'
+        assert int(dict(self.headers)['Content-Length']) > 0
+
+    def test_scoped_application_does_not_bind_into_application_container(self):
+        application = WSGIApplication(self.container, providers.PROVIDERS, scoped=True)
+        environ = generate_wsgi()
+        environ['PATH_INFO'] = '/view'
+
+        assert list(application(environ, self.start_response)) == [b'test']
+        assert self.status == '200 OK'
+        assert not self.container.has('Environ')
+        assert not self.container.has('StatusCode')
+        assert self.container.current() is self.container
+
+    def test_scoped_application_releases_streamed_requests_once_sent(self):
+        self.container.bind('WebRoutes', [get('/stream', ControllerTest.streams_a_view)])
+        application = WSGIApplication(self.container, providers.PROVIDERS, scoped=True)
+        environ = generate_wsgi()
+        environ['PATH_INFO'] = '/stream'
+
+        body = application(environ, self.start_response)
+        assert self.container.current() is not self.container
+
+        assert list(body) == [b'test']
+        assert self.container.current() is self.container
+
+    def test_scoped_application_helpers_use_the_scoped_request(self):
+        self.container.bind('WebRoutes', [get('/input', ControllerTest.returns_request_input)])
+        application = WSGIApplication(self.container, providers.PROVIDERS, scoped=True)
+
+        for name in ('first', 'second'):
+            environ = generate_wsgi()
+            environ['PATH_INFO'] = '/input'
+            environ['QUERY_STRING'] = 'name=' + name
+
+            assert list(application(environ, self.start_response)) == [name.encode('utf-8')]
+
+    def test_application_streams_views(self):
+        self.container.bind('WebRoutes', [get('/stream', ControllerTest.streams_a_view)])
+        environ = generate_wsgi()
+        environ['PATH_INFO'] = '/stream'
+
+        assert list(self.application(environ, self.start_response)) == [b'test']
+        assert self.status == '200 OK'
+        assert 'Content-Length' not in dict(self.headers)
+
+    def test_application_logs_final_response(self):
+        logger = AccessLogger(sink='file', location='storage/logs/test_access.log')
+        self.container.bind('AccessLogger', logger)
+        environ = generate_wsgi()
+        environ['PATH_INFO'] = '/not/found'
+
+        response = b''.join(self.application(environ, self.start_response))
+        logger.stop()
+
+        with open('storage/logs/test_access.log') as log:
+            line = log.read().rstrip()
+
+        assert 'WARNING GET /not/found 404 Not Found' in line
+        assert line.endswith('ms {0}'.format(len(response)))
+
+        os.remove('storage/logs/test_access.log')